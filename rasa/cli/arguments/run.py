@@ -18,6 +18,7 @@ def set_run_arguments(parser: argparse.ArgumentParser) -> None:
     """Arguments for running Rasa directly using `rasa run`."""
     add_model_param(parser)
     add_server_arguments(parser)
+    add_inference_arguments(parser)
 
 
 def set_run_action_arguments(parser: argparse.ArgumentParser) -> None:
@@ -202,3 +203,49 @@ def add_jwt_arguments(parser: argparse.ArgumentParser) -> None:
         "which hashing algorithm is used. It must be used together with "
         "--jwt-secret for providing the public key.",
     )
+
+
+def add_inference_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds arguments related to running the model's predictions.
+
+    Args:
+        parser: Argument parser.
+    """
+    inference_arguments = parser.add_argument_group("Inference")
+    inference_arguments.add_argument(
+        "--inference-executor",
+        type=str,
+        choices=[
+            constants.INFERENCE_EXECUTOR_THREAD,
+            constants.INFERENCE_EXECUTOR_PROCESS,
+        ],
+        default=constants.DEFAULT_INFERENCE_EXECUTOR,
+        help="Whether model predictions are run in a pool of threads or processes. "
+        "Process workers load their own copy of the model.",
+    )
+    inference_arguments.add_argument(
+        "--inference-workers",
+        type=int,
+        default=constants.DEFAULT_INFERENCE_WORKERS,
+        help="Number of model predictions which are run in parallel.",
+    )
+    inference_arguments.add_argument(
+        "--inference-queue-size",
+        type=int,
+        default=constants.DEFAULT_INFERENCE_QUEUE_SIZE,
+        help="Number of model predictions which can wait for a free worker. "
+        "Further requests wait until a prediction is finished.",
+    )
+    inference_arguments.add_argument(
+        "--nlu-batch-window",
+        type=float,
+        default=constants.DEFAULT_NLU_BATCH_WINDOW,
+        help="Time in milliseconds to collect incoming messages which are then "
+        "parsed as one batch. Set to 0 to parse every message on its own.",
+    )
+    inference_arguments.add_argument(
+        "--nlu-batch-size",
+        type=int,
+        default=constants.DEFAULT_NLU_BATCH_SIZE,
+        help="Maximum number of messages which are parsed as one batch.",
+    )
@@ -1,6 +1,8 @@
 import copy
+import itertools
 import json
 import logging
+from collections import OrderedDict
 from typing import (
     List,
     Text,
@@ -15,7 +17,16 @@ from typing import (
 
 import aiohttp
 import rasa.core
-from rasa.core.actions.constants import DEFAULT_SELECTIVE_DOMAIN, SELECTIVE_DOMAIN
+from rasa.core.actions.constants import (
+    DEFAULT_INCREMENTAL_PAYLOADS,
+    DEFAULT_SELECTIVE_DOMAIN,
+    DOMAIN_HASH_KEY,
+    EVENTS_OFFSET_KEY,
+    INCREMENTAL_PAYLOADS,
+    LAST_SENT_EVENT_TIMESTAMP_KEY,
+    MAX_CONVERSATIONS_WITH_SENT_EVENTS,
+    SELECTIVE_DOMAIN,
+)
 from rasa.core.constants import (
     DEFAULT_REQUEST_TIMEOUT,
     COMPRESS_ACTION_SERVER_REQUEST_ENV_NAME,
@@ -654,6 +665,81 @@ class ActionDeactivateLoop(Action):
         return [ActiveLoop(None), SlotSet(REQUESTED_SLOT, None)]
 
 
+class _SentPayloads:
+    """Remembers which events and domains an action server already received."""
+
+    def __init__(self) -> None:
+        self.domain_hashes: Set[Text] = set()
+        # maps conversation IDs to the number of sent events and the timestamp of
+        # the last sent event
+        self.events: "OrderedDict[Text, Tuple[int, float]]" = OrderedDict()
+        self._domain: Optional[Domain] = None
+        self._domain_hash: Optional[Text] = None
+
+    def domain_hash(self, domain: Domain) -> Text:
+        """Returns the fingerprint of the domain, which is only computed once."""
+        if domain is not self._domain or self._domain_hash is None:
+            self._domain = domain
+            self._domain_hash = domain.fingerprint()
+
+        return self._domain_hash
+
+    def number_of_sent_events(self, tracker: DialogueStateTracker) -> int:
+        """Returns how many events of the tracker the action server received.
+
+        Args:
+            tracker: The tracker which is sent to the action server.
+
+        Returns:
+            Number of events at the start of the tracker which were sent before, `0`
+            if the tracker doesn't continue the sent events.
+        """
+        if tracker.sender_id not in self.events:
+            return 0
+
+        number_of_sent_events, last_sent_event_timestamp = self.events[
+            tracker.sender_id
+        ]
+        if (
+            number_of_sent_events > len(tracker.events)
+            or tracker.events[number_of_sent_events - 1].timestamp
+            != last_sent_event_timestamp
+        ):
+            return 0
+
+        return number_of_sent_events
+
+    def remember(self, tracker: DialogueStateTracker, payload: Dict[Text, Any]) -> None:
+        """Remembers the events and the domain which were sent to the action server.
+
+        Args:
+            tracker: The tracker which was sent.
+            payload: The payload which the action server accepted.
+        """
+        if "domain" in payload and DOMAIN_HASH_KEY in payload:
+            self.domain_hashes.add(payload[DOMAIN_HASH_KEY])
+
+        if not tracker.events:
+            return
+
+        self.events[tracker.sender_id] = (
+            len(tracker.events),
+            tracker.events[-1].timestamp,
+        )
+        self.events.move_to_end(tracker.sender_id)
+        while len(self.events) > MAX_CONVERSATIONS_WITH_SENT_EVENTS:
+            self.events.popitem(last=False)
+
+    def forget(self, sender_id: Text) -> None:
+        """Forgets what was sent, e.g. after the action server was restarted."""
+        self.events.pop(sender_id, None)
+        self.domain_hashes.clear()
+
+
+# what was sent to each action server URL
+_sent_payloads: Dict[Text, _SentPayloads] = {}
+
+
 class RemoteAction(Action):
     def __init__(self, name: Text, action_endpoint: Optional[EndpointConfig]) -> None:
 
@@ -664,11 +750,36 @@ class RemoteAction(Action):
         self,
         tracker: "DialogueStateTracker",
         domain: "Domain",
+        incremental: bool = False,
     ) -> Dict[Text, Any]:
-        """Create the request json send to the action server."""
+        """Create the request json send to the action server.
+
+        Args:
+            tracker: The tracker of the conversation.
+            domain: The domain of the model.
+            incremental: Whether to leave out the events and the domain which were
+                already sent to the action server.
+
+        Returns:
+            The request json.
+        """
         from rasa.shared.core.trackers import EventVerbosity
 
-        tracker_state = tracker.current_state(EventVerbosity.ALL)
+        sent_payloads = self._sent_payloads() if incremental else None
+        number_of_sent_events = (
+            sent_payloads.number_of_sent_events(tracker) if sent_payloads else 0
+        )
+
+        if number_of_sent_events:
+            tracker_state = tracker.current_state(EventVerbosity.NONE)
+            tracker_state["events"] = [
+                event.as_dict()
+                for event in itertools.islice(
+                    tracker.events, number_of_sent_events, None
+                )
+            ]
+        else:
+            tracker_state = tracker.current_state(EventVerbosity.ALL)
 
         result = {
             "next_action": self._name,
@@ -677,14 +788,39 @@ class RemoteAction(Action):
             "version": rasa.__version__,
         }
 
+        if number_of_sent_events:
+            result[EVENTS_OFFSET_KEY] = number_of_sent_events
+            result[LAST_SENT_EVENT_TIMESTAMP_KEY] = tracker.events[
+                number_of_sent_events - 1
+            ].timestamp
+
         if (
             not self._is_selective_domain_enabled()
             or domain.does_custom_action_explicitly_need_domain(self.name())
         ):
-            result["domain"] = domain.as_dict()
+            if sent_payloads is None:
+                result["domain"] = domain.as_dict()
+            else:
+                domain_hash = sent_payloads.domain_hash(domain)
+                result[DOMAIN_HASH_KEY] = domain_hash
+                if domain_hash not in sent_payloads.domain_hashes:
+                    result["domain"] = domain.as_dict()
 
         return result
 
+    def _are_incremental_payloads_enabled(self) -> bool:
+        if self.action_endpoint is None:
+            return False
+        return bool(
+            self.action_endpoint.kwargs.get(
+                INCREMENTAL_PAYLOADS, DEFAULT_INCREMENTAL_PAYLOADS
+            )
+        )
+
+    def _sent_payloads(self) -> _SentPayloads:
+        url = self.action_endpoint.url if self.action_endpoint else None
+        return _sent_payloads.setdefault(url or "", _SentPayloads())
+
     def _is_selective_domain_enabled(self) -> bool:
         if self.action_endpoint is None:
             return False
@@ -766,7 +902,8 @@ class RemoteAction(Action):
         metadata: Optional[Dict[Text, Any]] = None,
     ) -> List[Event]:
         """Runs action. Please see parent class for the full docstring."""
-        json_body = self._action_call_format(tracker, domain)
+        incremental = self._are_incremental_payloads_enabled()
+        json_body = self._action_call_format(tracker, domain, incremental)
         if not self.action_endpoint:
             raise RasaException(
                 f"Failed to execute custom action '{self.name()}' "
@@ -787,20 +924,25 @@ class RemoteAction(Action):
                 DEFAULT_COMPRESS_ACTION_SERVER_REQUEST,
             )
 
-            modified_json = plugin_manager().hook.prefix_stripping_for_custom_actions(
-                json_body=json_body
-            )
-            response: Any = await self.action_endpoint.request(
-                json=modified_json if modified_json else json_body,
-                method="post",
-                timeout=DEFAULT_REQUEST_TIMEOUT,
-                compress=should_compress,
-            )
-            if modified_json:
-                plugin_manager().hook.prefixing_custom_actions_response(
-                    json_body=json_body, response=response
+            try:
+                response = await self._call_action_server(json_body, should_compress)
+            except ClientResponseError as e:
+                if not incremental or e.status != 409:
+                    raise
+
+                # the action server doesn't know the events or the domain which
+                # were left out, e.g. because it was restarted
+                logger.debug(
+                    f"Action server rejected the incremental request for action "
+                    f"'{self.name()}'. Sending the full tracker and domain instead."
                 )
+                self._sent_payloads().forget(tracker.sender_id)
+                json_body = self._action_call_format(tracker, domain, incremental)
+                response = await self._call_action_server(json_body, should_compress)
+
             self._validate_action_result(response)
+            if incremental:
+                self._sent_payloads().remember(tracker, json_body)
 
             events_json = response.get("events", [])
             responses = response.get("responses", [])
@@ -850,6 +992,24 @@ class RemoteAction(Action):
                 "Error: {}".format(self.name(), status, e)
             )
 
+    async def _call_action_server(
+        self, json_body: Dict[Text, Any], compress: bool
+    ) -> Any:
+        modified_json = plugin_manager().hook.prefix_stripping_for_custom_actions(
+            json_body=json_body
+        )
+        response: Any = await self.action_endpoint.request(  # type: ignore[union-attr]
+            json=modified_json if modified_json else json_body,
+            method="post",
+            timeout=DEFAULT_REQUEST_TIMEOUT,
+            compress=compress,
+        )
+        if modified_json:
+            plugin_manager().hook.prefixing_custom_actions_response(
+                json_body=json_body, response=response
+            )
+        return response
+
     def name(self) -> Text:
         return self._name
 
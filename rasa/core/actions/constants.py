@@ -1,2 +1,12 @@
 DEFAULT_SELECTIVE_DOMAIN = False
 SELECTIVE_DOMAIN = "enable_selective_domain"
+
+# leave out events and domains which were already sent to the action server
+INCREMENTAL_PAYLOADS = "send_incremental_payloads"
+DEFAULT_INCREMENTAL_PAYLOADS = False
+# keys of incremental action server requests
+EVENTS_OFFSET_KEY = "events_offset"
+LAST_SENT_EVENT_TIMESTAMP_KEY = "last_sent_event_timestamp"
+DOMAIN_HASH_KEY = "domain_hash"
+# number of conversations for which the events sent to an action server are tracked
+MAX_CONVERSATIONS_WITH_SENT_EVENTS = 10000
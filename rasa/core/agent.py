@@ -1,10 +1,13 @@
 from __future__ import annotations
+import asyncio
 from asyncio import AbstractEventLoop, CancelledError
+import base64
 import functools
+import hashlib
 import logging
 import os
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Text, Union
+from typing import Any, Callable, Dict, List, Optional, Text, Tuple, Union
 import uuid
 
 import aiohttp
@@ -12,8 +15,13 @@ from aiohttp import ClientError
 
 from rasa.core import jobs
 from rasa.core.channels.channel import OutputChannel, UserMessage
-from rasa.core.constants import DEFAULT_REQUEST_TIMEOUT
+from rasa.core.constants import (
+    DEFAULT_REQUEST_TIMEOUT,
+    MODEL_DOWNLOAD_CHUNK_SIZE,
+    MODEL_DOWNLOAD_RESUME_ATTEMPTS,
+)
 from rasa.core.http_interpreter import RasaNLUHttpInterpreter
+from rasa.core.inference_executor import InferenceExecutor
 from rasa.shared.core.domain import Domain
 from rasa.core.exceptions import AgentNotReady
 from rasa.shared.constants import DEFAULT_SENDER_ID
@@ -71,9 +79,15 @@ async def _update_model_from_server(model_server: EndpointConfig, agent: Agent)
             )
 
             if new_fingerprint:
-                    logger.debug(f"Found new model with fingerprint {fingerprint}. Loading...")
-                    agent.load_model(temporary_directory, new_fingerprint)
-                    logger.debug("Finished updating agent to new model.")
+                # unpacking and loading a model takes a while, the previous model
+                # keeps handling messages until the new one is loaded
+                await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    _load_and_set_updated_model,
+                    agent,
+                    temporary_directory,
+                    new_fingerprint,
+                )
             else:
                 logger.debug(f"No new model found at URL {model_server.url}")
         except Exception:  # skipcq: PYL-W0703
@@ -89,6 +103,11 @@ async def _pull_model_and_fingerprint(
 ) -> Optional[Text]:
     """Queries the model server.
 
+    The model is streamed to disk. Interrupted downloads are resumed with range
+    requests. If the server sends a `Content-MD5` header, or the endpoint sets
+    `verify_etag` and the `ETag` is the MD5 hash of the model archive, the
+    downloaded model is checked against it.
+
     Args:
         model_server: Model server endpoint information.
         fingerprint: Current model fingerprint.
@@ -97,6 +116,9 @@ async def _pull_model_and_fingerprint(
     Returns:
         Value of the response's <ETag> header which contains the model
         hash. Returns `None` if no new model is found.
+
+    Raises:
+        RasaException: If the downloaded model doesn't match its checksum.
     """
     headers = {"If-None-Match": fingerprint}
 
@@ -137,11 +159,22 @@ async def _pull_model_and_fingerprint(
             model_path = Path(model_directory) / resp.headers.get(
                 "filename", "model.tar.gz"
             )
-            with open(model_path, "wb") as file:
-                file.write(await resp.read())
-            logger.debug("Saved model to '{}'".format(os.path.abspath(model_path)))
-            # return the new fingerprint
-            return resp.headers.get("ETag")
+            new_fingerprint = resp.headers.get("ETag")
+            content_md5 = resp.headers.get("Content-MD5")
+            try:
+                await _write_response_to_file(resp, model_path, append=False)
+            except aiohttp.ClientPayloadError as e:
+                logger.debug(f"Downloading the model was interrupted: {e}.")
+                new_fingerprint, content_md5 = await _resume_model_download(
+                    model_server, model_path, new_fingerprint, content_md5
+                )
+
+        await _verify_model_checksum(
+            model_server, model_path, new_fingerprint, content_md5
+        )
+        logger.debug("Saved model to '{}'".format(os.path.abspath(model_path)))
+        # return the new fingerprint
+        return new_fingerprint
     except aiohttp.ClientError as e:
         logger.debug(
             "Tried to fetch model from server, but "
@@ -151,6 +184,117 @@ async def _pull_model_and_fingerprint(
         return None
 
 
+async def _write_response_to_file(
+    response: aiohttp.ClientResponse, model_path: Path, append: bool
+) -> None:
+    """Writes the body of a response to a file in chunks."""
+    with open(model_path, "ab" if append else "wb") as file:
+        async for chunk in response.content.iter_chunked(MODEL_DOWNLOAD_CHUNK_SIZE):
+            file.write(chunk)
+
+
+async def _resume_model_download(
+    model_server: EndpointConfig,
+    model_path: Path,
+    fingerprint: Optional[Text],
+    content_md5: Optional[Text],
+) -> Tuple[Optional[Text], Optional[Text]]:
+    """Downloads the rest of a partially downloaded model.
+
+    Args:
+        model_server: Model server endpoint information.
+        model_path: Path of the partially downloaded model.
+        fingerprint: The fingerprint of the partially downloaded model.
+        content_md5: The `Content-MD5` header of the partially downloaded model.
+
+    Returns:
+        The fingerprint and the `Content-MD5` header of the downloaded model. They
+        change if the server sent a different model instead of the missing part.
+
+    Raises:
+        aiohttp.ClientPayloadError: If the download was interrupted too often.
+    """
+    for attempt in range(1, MODEL_DOWNLOAD_RESUME_ATTEMPTS + 1):
+        downloaded_bytes = model_path.stat().st_size
+        logger.debug(
+            f"Resuming model download after {downloaded_bytes} bytes "
+            f"(attempt {attempt} of {MODEL_DOWNLOAD_RESUME_ATTEMPTS})."
+        )
+        headers = {"Range": f"bytes={downloaded_bytes}-"}
+        if fingerprint:
+            # the server sends the complete model if it has changed in the meantime
+            headers["If-Range"] = fingerprint
+
+        async with model_server.session.request(
+            "GET",
+            model_server.url,
+            timeout=DEFAULT_REQUEST_TIMEOUT,
+            headers=headers,
+            params=model_server.combine_parameters(),
+        ) as resp:
+            if resp.status == 206:
+                append = True
+            elif resp.status == 200:
+                append = False
+                fingerprint = resp.headers.get("ETag")
+                content_md5 = resp.headers.get("Content-MD5")
+            else:
+                raise aiohttp.ClientResponseError(
+                    resp.request_info,
+                    resp.history,
+                    status=resp.status,
+                    message="Resuming the model download failed.",
+                )
+
+            try:
+                await _write_response_to_file(resp, model_path, append=append)
+                return fingerprint, content_md5
+            except aiohttp.ClientPayloadError as e:
+                if attempt == MODEL_DOWNLOAD_RESUME_ATTEMPTS:
+                    raise
+                logger.debug(f"Downloading the model was interrupted again: {e}.")
+
+    return fingerprint, content_md5
+
+
+def _md5_of_file(path: Path) -> bytes:
+    md5 = hashlib.md5()  # nosec
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(MODEL_DOWNLOAD_CHUNK_SIZE), b""):
+            md5.update(chunk)
+    return md5.digest()
+
+
+async def _verify_model_checksum(
+    model_server: EndpointConfig,
+    model_path: Path,
+    fingerprint: Optional[Text],
+    content_md5: Optional[Text],
+) -> None:
+    """Checks the downloaded model against the checksums the server sent."""
+    etag_md5 = fingerprint.strip('"') if fingerprint else None
+    if not model_server.kwargs.get("verify_etag"):
+        etag_md5 = None
+
+    if not content_md5 and not etag_md5:
+        return
+
+    # reading a large model shouldn't block the event loop
+    digest = await asyncio.get_running_loop().run_in_executor(
+        None, _md5_of_file, model_path
+    )
+    if content_md5 and base64.b64encode(digest).decode() != content_md5:
+        raise RasaException(
+            f"The downloaded model doesn't match the checksum '{content_md5}' of "
+            f"the 'Content-MD5' header sent by the model server."
+        )
+    if etag_md5 and digest.hex() != etag_md5:
+        raise RasaException(
+            f"The downloaded model doesn't match the checksum '{etag_md5}' of the "
+            f"'ETag' header sent by the model server."
+        )
+
+
 async def _run_model_pulling_worker(model_server: EndpointConfig, agent: Agent) -> None:
     # noinspection PyBroadException
     try:
@@ -162,12 +306,14 @@ async def _run_model_pulling_worker(model_server: EndpointConfig, agent: Agent)
             "An exception was raised while fetching a model. Continuing anyways..."
         )
 
+
 async def load_agent(
     model_path: Optional[Text] = None,
     model_server: Optional[EndpointConfig] = None,
     remote_storage: Optional[Text] = None,
     endpoints: Optional[AvailableEndpoints] = None,
     loop: Optional[AbstractEventLoop] = None,
+    inference_executor: Optional[InferenceExecutor] = None,
 ) -> Agent:
     """Loads agent from server, remote storage or disk.
 
@@ -177,6 +323,7 @@ async def load_agent(
         remote_storage: URL of remote storage for model.
         endpoints: Endpoint configuration.
         loop: Optional async loop to pass to broker creation.
+        inference_executor: Runs the model's predictions off the event loop.
 
     Returns:
         The instantiated `Agent` or `None`.
@@ -210,6 +357,7 @@ async def load_agent(
         model_server=model_server,
         remote_storage=remote_storage,
         http_interpreter=http_interpreter,
+        inference_executor=inference_executor,
     )
 
     try:
@@ -271,6 +419,7 @@ class Agent:
         model_server: Optional[EndpointConfig] = None,
         remote_storage: Optional[Text] = None,
         http_interpreter: Optional[RasaNLUHttpInterpreter] = None,
+        inference_executor: Optional[InferenceExecutor] = None,
     ):
         """Initializes an `Agent`."""
         self.domain = domain
@@ -281,6 +430,7 @@ class Agent:
         self.lock_store = self._create_lock_store(lock_store)
         self.action_endpoint = action_endpoint
         self.http_interpreter = http_interpreter
+        self.inference_executor = inference_executor or InferenceExecutor()
 
         self._set_fingerprint(fingerprint)
         self.model_server = model_server
@@ -299,6 +449,7 @@ class Agent:
         model_server: Optional[EndpointConfig] = None,
         remote_storage: Optional[Text] = None,
         http_interpreter: Optional[RasaNLUHttpInterpreter] = None,
+        inference_executor: Optional[InferenceExecutor] = None,
     ) -> Agent:
         """Constructs a new agent and loads the processer and model."""
         agent = Agent(
@@ -311,6 +462,7 @@ class Agent:
             model_server=model_server,
             remote_storage=remote_storage,
             http_interpreter=http_interpreter,
+            inference_executor=inference_executor,
         )
         agent.load_model(model_path=model_path, fingerprint=fingerprint)
         return agent
@@ -318,16 +470,34 @@ class Agent:
     def load_model(
         self, model_path: Union[Text, Path], fingerprint: Optional[Text] = None
     ) -> None:
-        """Loads the agent's model and processor given a new model path."""
-        self.processor = MessageProcessor(
+        """Loads the agent's model and processor given a new model path.
+
+        If the model server configuration lists `warm_up_messages`, they are run
+        through the new model by the inference workers before it replaces the
+        current one. Messages which are already being handled finish with the
+        previous model, whose archive is removed once its inference requests are
+        done.
+        """
+        processor = MessageProcessor(
             model_path=model_path,
             tracker_store=self.tracker_store,
             lock_store=self.lock_store,
             action_endpoint=self.action_endpoint,
             generator=self.nlg,
             http_interpreter=self.http_interpreter,
+            inference_executor=self.inference_executor,
         )
-        self.domain = self.processor.domain
+        warm_up_messages = self._warm_up_messages()
+        if warm_up_messages:
+            processor.warm_up(warm_up_messages)
+
+        previous_processor = self.processor
+        self.processor = processor
+        self.domain = processor.domain
+        if previous_processor is not None:
+            self.inference_executor.release_model(
+                previous_processor.inference_model_archive
+            )
 
         self._set_fingerprint(fingerprint)
 
@@ -336,6 +506,11 @@ class Agent:
         if isinstance(self.nlg, TemplatedNaturalLanguageGenerator):
             self.nlg.responses = self.domain.responses if self.domain else {}
 
+    def _warm_up_messages(self) -> List[Text]:
+        if not self.model_server:
+            return []
+        return self.model_server.kwargs.get("warm_up_messages") or []
+
     @property
     def model_id(self) -> Optional[Text]:
         """Returns the model_id from processor's model_metadata."""
@@ -400,13 +575,13 @@ class Agent:
         )
 
     @agent_must_be_ready
-    def predict_next_with_tracker(
+    async def predict_next_with_tracker(
         self,
         tracker: DialogueStateTracker,
         verbosity: EventVerbosity = EventVerbosity.AFTER_RESTART,
     ) -> Optional[Dict[Text, Any]]:
         """Predicts the next action."""
-        return self.processor.predict_next_with_tracker(  # type: ignore[union-attr]
+        return await self.processor.predict_next_with_tracker(  # type: ignore[union-attr] # noqa:E501
             tracker, verbosity
         )
 
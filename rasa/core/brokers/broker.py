@@ -1,7 +1,8 @@
 from __future__ import annotations
+import asyncio
 import logging
 from asyncio import AbstractEventLoop
-from typing import Any, Dict, Text, Optional, Union, TypeVar, Type
+from typing import Any, Dict, List, Text, Optional, Union, TypeVar, Type
 
 import aiormq
 
@@ -15,6 +16,9 @@ logger = logging.getLogger(__name__)
 
 EB = TypeVar("EB", bound="EventBroker")
 
+# key of the endpoint configuration which enables `BufferedEventBroker`
+BATCH_PUBLISHING_KEY = "batch_publishing"
+
 
 class EventBroker:
     """Base class for any event broker implementation."""
@@ -64,6 +68,27 @@ class EventBroker:
         """Publishes a json-formatted Rasa Core event into an event queue."""
         raise NotImplementedError("Event broker must implement the `publish` method.")
 
+    async def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        """Publishes several json-formatted Rasa Core events at once.
+
+        Event brokers which can publish several events more efficiently than one by
+        one should override this. Implementations must not block the event loop and
+        should raise an exception if the events couldn't be published.
+
+        The default implementation calls `publish` for every event in a thread of the
+        default executor, so that a blocking `publish` doesn't block the event loop.
+
+        Args:
+            events: Serialised events to be published.
+        """
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._publish_one_by_one, events
+        )
+
+    def _publish_one_by_one(self, events: List[Dict[Text, Any]]) -> None:
+        for event in events:
+            self.publish(event)
+
     def is_ready(self) -> bool:
         """Determine whether or not the event broker is ready.
 
@@ -84,6 +109,12 @@ async def _create_from_endpoint_config(
     """Instantiate an event broker based on its configuration."""
     if endpoint_config is None:
         broker: Optional[EventBroker] = None
+    elif BATCH_PUBLISHING_KEY in endpoint_config.kwargs:
+        from rasa.core.brokers.buffered import BufferedEventBroker
+
+        broker = await BufferedEventBroker.from_endpoint_config(
+            endpoint_config, event_loop
+        )
     elif endpoint_config.type is None or endpoint_config.type.lower() == "pika":
         from rasa.core.brokers.pika import PikaEventBroker
 
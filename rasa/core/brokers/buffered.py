@@ -0,0 +1,283 @@
+import asyncio
+import copy
+import json
+import logging
+import os
+from asyncio import AbstractEventLoop
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Text
+
+from rasa.core.brokers.broker import (
+    BATCH_PUBLISHING_KEY,
+    EventBroker,
+    _create_from_endpoint_config,
+)
+from rasa.shared.exceptions import RasaException
+from rasa.shared.utils.io import DEFAULT_ENCODING
+from rasa.utils.endpoints import EndpointConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL_IN_SECONDS = 1.0
+DEFAULT_MAX_QUEUE_SIZE = 10000
+
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_DROP_NEWEST = "drop_newest"
+OVERFLOW_SPILL = "spill"
+OVERFLOW_POLICIES = [OVERFLOW_DROP_OLDEST, OVERFLOW_DROP_NEWEST, OVERFLOW_SPILL]
+
+
+class BufferedEventBroker(EventBroker):
+    """Publishes the events of another event broker in batches in the background.
+
+    `publish` only adds an event to a bounded in-memory queue, so that a slow or
+    unreachable event broker doesn't delay the handling of messages. The queue is
+    flushed once it holds `flush_size` events, and at the latest after
+    `flush_interval` seconds.
+
+    Batches which can't be published are written to `spill_path` if it's set, and
+    are published again after the next batch was published successfully. Without a
+    `spill_path` they are put back into the queue.
+    """
+
+    def __init__(
+        self,
+        broker: EventBroker,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_IN_SECONDS,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        overflow_policy: Text = OVERFLOW_DROP_OLDEST,
+        spill_path: Optional[Text] = None,
+    ) -> None:
+        """Creates the buffered event broker.
+
+        Args:
+            broker: The event broker which publishes the batches.
+            flush_size: Maximum number of events which are published in one batch.
+            flush_interval: Maximum time in seconds an event waits in the queue.
+            max_queue_size: Maximum number of events in the queue.
+            overflow_policy: What happens to events when the queue is full. Either
+                `drop_oldest`, `drop_newest` or `spill` (write them to
+                `spill_path`).
+            spill_path: File to which events are written which can't be published
+                or don't fit into the queue.
+
+        Raises:
+            RasaException: If the configuration is invalid.
+        """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise RasaException(
+                f"Unknown overflow policy '{overflow_policy}' for batch publishing. "
+                f"Please use one of {OVERFLOW_POLICIES}."
+            )
+        if overflow_policy == OVERFLOW_SPILL and not spill_path:
+            raise RasaException(
+                f"The overflow policy '{OVERFLOW_SPILL}' requires a `spill_path`."
+            )
+        if flush_size < 1 or flush_interval <= 0 or max_queue_size < flush_size:
+            raise RasaException(
+                f"Batch publishing needs a flush size of at least one, a positive "
+                f"flush interval and a queue which holds at least one batch. Got a "
+                f"flush size of {flush_size}, a flush interval of {flush_interval} "
+                f"seconds and a queue size of {max_queue_size}."
+            )
+
+        self.broker = broker
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.spill_path = spill_path
+
+        self._queue: Deque[Dict[Text, Any]] = deque()
+        # events which didn't fit into the queue and still need to be spilled
+        self._overflow: List[Dict[Text, Any]] = []
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @classmethod
+    async def from_endpoint_config(
+        cls,
+        broker_config: EndpointConfig,
+        event_loop: Optional[AbstractEventLoop] = None,
+    ) -> Optional["BufferedEventBroker"]:
+        """Creates broker. See the parent class for more information."""
+        batch_config = broker_config.kwargs.get(BATCH_PUBLISHING_KEY) or {}
+        inner_config = copy.copy(broker_config)
+        inner_config.kwargs = {
+            key: value
+            for key, value in broker_config.kwargs.items()
+            if key != BATCH_PUBLISHING_KEY
+        }
+
+        broker = await _create_from_endpoint_config(inner_config, event_loop)
+        if broker is None:
+            return None
+
+        return cls(broker, **batch_config)
+
+    @property
+    def queue_size(self) -> int:
+        """Returns the number of events which wait to be published."""
+        return len(self._queue)
+
+    def publish(self, event: Dict[Text, Any]) -> None:
+        """Adds an event to the queue of events which are published in the background.
+
+        Args:
+            event: Serialised event to be published.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # there is no event loop which could flush the queue
+            self.broker.publish(event)
+            return
+
+        if self._closed:
+            logger.warning(
+                "Publishing event with a closed buffered event broker. Publishing it "
+                "directly instead."
+            )
+            self.broker.publish(event)
+            return
+
+        if len(self._queue) >= self.max_queue_size:
+            self._handle_overflow(event)
+        else:
+            self._queue.append(event)
+
+        flush_requested = self._start_flusher(loop)
+        if len(self._queue) >= self.flush_size or self._overflow:
+            flush_requested.set()
+
+    def _handle_overflow(self, event: Dict[Text, Any]) -> None:
+        if self.overflow_policy == OVERFLOW_SPILL:
+            self._overflow.append(event)
+            return
+
+        if self.overflow_policy == OVERFLOW_DROP_OLDEST:
+            self._queue.popleft()
+            self._queue.append(event)
+
+        logger.warning(
+            f"The queue of events which wait to be published is full "
+            f"({self.max_queue_size} events). Dropping the "
+            f"{'oldest' if self.overflow_policy == OVERFLOW_DROP_OLDEST else 'newest'} "
+            f"event."
+        )
+
+    def _start_flusher(self, loop: AbstractEventLoop) -> asyncio.Event:
+        if (
+            self._flusher is None
+            or self._flusher.done()
+            or self._flush_requested is None
+        ):
+            self._flush_requested = asyncio.Event()
+            self._flusher = loop.create_task(
+                self._flush_periodically(self._flush_requested)
+            )
+
+        return self._flush_requested
+
+    async def _flush_periodically(self, flush_requested: asyncio.Event) -> None:
+        while not self._closed:
+            try:
+                await asyncio.wait_for(flush_requested.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            flush_requested.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Publishes all events which are currently in the queue."""
+        if self._overflow:
+            overflow, self._overflow = self._overflow, []
+            await self._spill(overflow)
+
+        while self._queue:
+            batch = [
+                self._queue.popleft()
+                for _ in range(min(self.flush_size, len(self._queue)))
+            ]
+            if not await self._publish_batch(batch):
+                return
+
+        await self._publish_spilled_events()
+
+    async def _publish_batch(self, batch: List[Dict[Text, Any]]) -> bool:
+        try:
+            await self.broker.publish_batch(batch)
+            return True
+        except Exception as e:
+            logger.error(
+                f"Failed to publish a batch of {len(batch)} events with "
+                f"'{self.broker.__class__.__name__}'. Error: {e}"
+            )
+
+        if self.spill_path:
+            await self._spill(batch)
+        else:
+            # keep the order of the events and try again with the next flush
+            self._queue.extendleft(reversed(batch))
+        return False
+
+    async def _spill(self, events: List[Dict[Text, Any]]) -> None:
+        if not self.spill_path:
+            return
+
+        logger.debug(f"Writing {len(events)} events to '{self.spill_path}'.")
+        await asyncio.get_running_loop().run_in_executor(
+            None, _append_events_to_file, self.spill_path, events
+        )
+
+    async def _publish_spilled_events(self) -> None:
+        if not self.spill_path or not os.path.exists(self.spill_path):
+            return
+
+        events = await asyncio.get_running_loop().run_in_executor(
+            None, _pop_events_from_file, self.spill_path
+        )
+        logger.debug(f"Publishing {len(events)} events from '{self.spill_path}'.")
+        for start in range(0, len(events), self.flush_size):
+            if not await self._publish_batch(events[start : start + self.flush_size]):
+                # the failed batch was spilled again, keep the rest of the events
+                await self._spill(events[start + self.flush_size :])
+                return
+
+    def is_ready(self) -> bool:
+        """Returns `True` if the wrapped event broker is ready."""
+        return self.broker.is_ready()
+
+    async def close(self) -> None:
+        """Publishes the remaining events and closes the wrapped event broker."""
+        self._closed = True
+        if self._flusher is not None and self._flush_requested is not None:
+            self._flush_requested.set()
+            await self._flusher
+        await self.flush()
+
+        if self._queue:
+            logger.warning(
+                f"Closing the event broker with {len(self._queue)} events which "
+                f"couldn't be published."
+            )
+            await self._spill(list(self._queue))
+            self._queue.clear()
+
+        await self.broker.close()
+
+
+def _append_events_to_file(path: Text, events: List[Dict[Text, Any]]) -> None:
+    with open(path, "a", encoding=DEFAULT_ENCODING) as file:
+        for event in events:
+            file.write(json.dumps(event) + "\n")
+
+
+def _pop_events_from_file(path: Text) -> List[Dict[Text, Any]]:
+    with open(path, encoding=DEFAULT_ENCODING) as file:
+        events = [json.loads(line) for line in file if line.strip()]
+    os.remove(path)
+    return events
@@ -1,10 +1,11 @@
-import json
+import asyncio
 import logging
 import typing
 from asyncio import AbstractEventLoop
-from typing import Optional, Text, Dict
+from typing import Any, Dict, List, Optional, Text
 
 from rasa.core.brokers.broker import EventBroker
+from rasa.core.codecs import JSON_CODEC, create_codec
 
 if typing.TYPE_CHECKING:
     from rasa.utils.endpoints import EndpointConfig
@@ -15,13 +16,15 @@ logger = logging.getLogger(__name__)
 class FileEventBroker(EventBroker):
     """Log events to a file in json format.
 
-    There will be one event per line and each event is stored as json.
+    There will be one event per line and each event is stored as json, unless a
+    different `codec` is configured.
     """
 
     DEFAULT_LOG_FILE_NAME = "rasa_event.log"
 
-    def __init__(self, path: Optional[Text] = None) -> None:
+    def __init__(self, path: Optional[Text] = None, codec: Text = JSON_CODEC) -> None:
         self.path = path or self.DEFAULT_LOG_FILE_NAME
+        self.codec = create_codec(codec)
         self.event_logger = self._event_logger()
 
     @classmethod
@@ -54,5 +57,15 @@ class FileEventBroker(EventBroker):
 
     def publish(self, event: Dict) -> None:
         """Write event to file."""
-        self.event_logger.info(json.dumps(event))
+        self._write_events([event])
+
+    async def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        """Writes the events to the file in a background thread."""
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._write_events, events
+        )
+
+    def _write_events(self, events: List[Dict[Text, Any]]) -> None:
+        for event in events:
+            self.event_logger.info(self.codec.encode(event))
         self.event_logger.handlers[0].flush()
@@ -1,6 +1,5 @@
 import asyncio
 import os
-import json
 import logging
 import structlog
 import threading
@@ -9,6 +8,7 @@ from typing import Any, Text, List, Optional, Union, Dict, TYPE_CHECKING
 import time
 
 from rasa.core.brokers.broker import EventBroker
+from rasa.core.codecs import JSON_CODEC, create_codec
 from rasa.core.exceptions import KafkaProducerInitializationError
 from rasa.shared.utils.io import DEFAULT_ENCODING
 from rasa.utils.endpoints import EndpointConfig
@@ -75,6 +75,9 @@ class KafkaEventBroker(EventBroker):
 
             security_protocol : Protocol used to communicate with brokers.
                 Valid values are: PLAINTEXT, SSL, SASL_PLAINTEXT, SASL_SSL.
+
+            kwargs: Additional options, e.g. `codec` (see
+                `rasa.core.codecs.create_codec`) to change how events are encoded.
         """
         self.producer: Optional[Producer] = None
         self.url = url
@@ -89,6 +92,7 @@ class KafkaEventBroker(EventBroker):
         self.ssl_certfile = ssl_certfile
         self.ssl_keyfile = ssl_keyfile
         self.queue_size = kwargs.get("queue_size")
+        self.codec = create_codec(kwargs.get("codec", JSON_CODEC))
         self.ssl_check_hostname = "https" if ssl_check_hostname else None
 
         # Async producer implementation followed from confluent-kafka asyncio example:
@@ -163,6 +167,55 @@ class KafkaEventBroker(EventBroker):
 
         logger.error("Failed to publish Kafka event.")
 
+    async def publish_batch(
+        self,
+        events: List[Dict[Text, Any]],
+        retries: int = 60,
+        flush_timeout_in_seconds: float = 30,
+    ) -> None:
+        """Produces the events and flushes the producer in a background thread.
+
+        Args:
+            events: Serialised events to be published.
+            retries: How often to wait for the local producer queue to make room
+                for an event before giving up.
+            flush_timeout_in_seconds: Maximum time to wait for the delivery of the
+                events.
+        """
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._publish_batch, events, retries, flush_timeout_in_seconds
+        )
+
+    def _publish_batch(
+        self,
+        events: List[Dict[Text, Any]],
+        retries: int,
+        flush_timeout_in_seconds: float,
+    ) -> None:
+        if self.producer is None:
+            self.producer = self._create_producer()
+
+        for event in events:
+            remaining_retries = retries
+            while True:
+                try:
+                    self._publish(event)
+                    break
+                except BufferError:
+                    remaining_retries -= 1
+                    if remaining_retries <= 0:
+                        raise
+                    # wait for the delivery of previously produced events
+                    self.producer.poll(1)
+
+        undelivered_events = self.producer.flush(flush_timeout_in_seconds)
+        if undelivered_events:
+            # the producer keeps on trying to deliver them in the background
+            logger.warning(
+                f"{undelivered_events} events weren't delivered to kafka url "
+                f"'{self.url}' within {flush_timeout_in_seconds} seconds."
+            )
+
     def _check_kafka_connection(self) -> None:
         """Verifies connection with Kafka.
 
@@ -253,7 +306,7 @@ class KafkaEventBroker(EventBroker):
             headers=headers,
         )
 
-        serialized_event = json.dumps(event).encode(DEFAULT_ENCODING)
+        serialized_event = self.codec.encode(event).encode(DEFAULT_ENCODING)
 
         if self.producer is not None:
             self.producer.produce(
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 import structlog
 import os
@@ -11,9 +10,10 @@ from urllib.parse import urlparse
 
 import aio_pika
 
-from rasa.shared.exceptions import RasaException
+from rasa.shared.exceptions import ConnectionException, RasaException
 from rasa.shared.constants import DOCS_URL_PIKA_EVENT_BROKER
 from rasa.core.brokers.broker import EventBroker
+from rasa.core.codecs import JSON_CODEC, create_codec
 import rasa.shared.utils.io
 from rasa.utils.endpoints import EndpointConfig
 from rasa.shared.utils.io import DEFAULT_ENCODING
@@ -64,6 +64,8 @@ class PikaEventBroker(EventBroker):
             retry_delay_in_seconds: Time in seconds between connection attempts.
             exchange_name: Exchange name to which the queues binds to.
                 If nothing is mentioned then the default exchange name would be used.
+            kwargs: Additional options, e.g. `codec` (see
+                `rasa.core.codecs.create_codec`) to change how events are encoded.
         """
         super().__init__()
 
@@ -81,6 +83,7 @@ class PikaEventBroker(EventBroker):
         self._connection_attempts = connection_attempts
         self._retry_delay_in_seconds = retry_delay_in_seconds
         self.exchange_name = exchange_name
+        self.codec = create_codec(kwargs.get("codec", JSON_CODEC))
 
         # Unpublished messages which hopefully will be published later 🤞
         self._unpublished_events: Deque[Dict[Text, Any]] = deque()
@@ -291,6 +294,29 @@ class PikaEventBroker(EventBroker):
         self._background_tasks.add(task)
         task.add_done_callback(self._background_tasks.discard)
 
+    async def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        """Publishes the events and waits until RabbitMQ confirmed all of them.
+
+        Raises:
+            ConnectionException: If there is no connection to RabbitMQ.
+        """
+        if self._exchange is None:
+            raise ConnectionException(
+                f"Cannot publish events as there is no connection to '{self.host}'."
+            )
+
+        exchange = self._exchange
+        # the channel uses publisher confirms, so every publish waits for its ack
+        await asyncio.gather(
+            *[exchange.publish(self._message(event, None), "") for event in events]
+        )
+        structlogger.debug(
+            "pika.events.publish_batch",
+            rabbitmq_exchange=self.exchange_name,
+            host=self.host,
+            batch_size=len(events),
+        )
+
     async def _publish(
         self, event: Dict[Text, Any], headers: Optional[Dict[Text, Text]] = None
     ) -> None:
@@ -326,7 +352,7 @@ class PikaEventBroker(EventBroker):
     def _message(
         self, event: Dict[Text, Any], headers: Optional[Dict[Text, Text]]
     ) -> aio_pika.Message:
-        body = json.dumps(event)
+        body = self.codec.encode(event)
         return aio_pika.Message(
             bytes(body, DEFAULT_ENCODING),
             headers=headers,
@@ -1,8 +1,8 @@
 import contextlib
-import json
 import logging
 from asyncio import AbstractEventLoop
-from typing import Any, Dict, Optional, Text, Generator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Generator, List, Optional, Text
 
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.declarative import declarative_base, DeclarativeMeta
@@ -10,6 +10,8 @@ from sqlalchemy import Column, Integer, String
 from sqlalchemy import Text as SqlAlchemyText  # to avoid name clash with typing.Text
 
 from rasa.core.brokers.broker import EventBroker
+from rasa.core.codecs import JSON_CODEC, create_codec
+import rasa.utils.common as common_utils
 from rasa.utils.endpoints import EndpointConfig
 
 logger = logging.getLogger(__name__)
@@ -18,8 +20,10 @@ logger = logging.getLogger(__name__)
 class SQLEventBroker(EventBroker):
     """Save events into an SQL database.
 
-    All events will be stored in a table called `events`.
-
+    All events will be stored in a table called `events`. Batches of events are
+    inserted in a thread pool so that they don't block the event loop. SQLite
+    databases are written directly as SQLite connections can't be shared across
+    threads.
     """
 
     Base: DeclarativeMeta = declarative_base()
@@ -40,8 +44,20 @@ class SQLEventBroker(EventBroker):
         db: Text = "events.db",
         username: Optional[Text] = None,
         password: Optional[Text] = None,
+        codec: Text = JSON_CODEC,
     ) -> None:
-        """Initializes `SQLBrokerEvent`."""
+        """Initializes `SQLBrokerEvent`.
+
+        Args:
+            dialect: SQL database type.
+            host: Database network host.
+            port: Database network port.
+            db: Database name.
+            username: User name to use when connecting to the database.
+            password: Password for the database user.
+            codec: Name of the codec which encodes the stored events, see
+                `rasa.core.codecs.create_codec`.
+        """
         from rasa.core.tracker_store import SQLTrackerStore
         import sqlalchemy.orm
 
@@ -54,6 +70,12 @@ class SQLEventBroker(EventBroker):
         self.engine = sqlalchemy.create_engine(engine_url)
         self.Base.metadata.create_all(self.engine)
         self.sessionmaker = sqlalchemy.orm.sessionmaker(bind=self.engine)
+        self.codec = create_codec(codec)
+        self._executor = (
+            None
+            if self.engine.dialect.name == "sqlite"
+            else ThreadPoolExecutor(thread_name_prefix="sql_event_broker")
+        )
 
     @classmethod
     async def from_endpoint_config(
@@ -75,10 +97,30 @@ class SQLEventBroker(EventBroker):
 
     def publish(self, event: Dict[Text, Any]) -> None:
         """Publishes a json-formatted Rasa Core event into an event queue."""
+        self._insert_events([event])
+
+    async def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        """Inserts the events with a single statement."""
+        await common_utils.run_in_thread_pool(
+            self._executor, self._insert_events, events
+        )
+
+    async def close(self) -> None:
+        """Shuts down the thread pool which inserts the events."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _insert_events(self, events: List[Dict[Text, Any]]) -> None:
         with self.session_scope() as session:
-            session.add(
-                self.SQLBrokerEvent(
-                    sender_id=event.get("sender_id"), data=json.dumps(event)
-                )
+            session.bulk_insert_mappings(
+                self.SQLBrokerEvent,
+                [
+                    {
+                        "sender_id": event.get("sender_id"),
+                        "data": self.codec.encode(event),
+                    }
+                    for event in events
+                ],
             )
             session.commit()
@@ -0,0 +1,187 @@
+import base64
+import binascii
+import json
+import logging
+import zlib
+from typing import Any, Dict, Text, Union
+
+import rasa.shared.utils.common
+from rasa.shared.exceptions import RasaException
+from rasa.shared.utils.io import DEFAULT_ENCODING
+
+logger = logging.getLogger(__name__)
+
+JSON_CODEC = "json"
+COMPRESSED_JSON_CODEC = "compressed_json"
+
+# marks data which was encoded with version 1 of `CompressedJsonCodec`
+COMPRESSED_JSON_PREFIX = "z1:"
+
+# Fragments which occur in most serialised events. They are used as preset
+# dictionary for the compression, so that every event can reference them instead of
+# storing them itself. Fragments at the end can be referenced with shorter codes.
+# Changing them breaks decoding of stored data, so add a new prefix version instead.
+_COMPRESSION_FRAGMENTS = (
+    '"event":"loop_interrupted"',
+    '"event":"active_loop"',
+    '"event":"followup"',
+    '"event":"reset_slots"',
+    '"event":"restart"',
+    '"event":"rewind"',
+    '"event":"action_execution_rejected"',
+    '"event":"entities"',
+    '"event":"user_featurization"',
+    '"use_text_for_featurization":false',
+    '"event":"session_started"',
+    '"name":"action_session_start"',
+    '"name":"session_started_metadata"',
+    '"event":"bot"',
+    '"data":{"elements":null,"quick_replies":null,"buttons":null,'
+    '"attachment":null,"image":null,"custom":null}',
+    '"utter_action":',
+    '"event":"slot"',
+    '"value":null',
+    '"response_selector":{"all_retrieval_intents":[],"default":{"response":'
+    '{"responses":null,"confidence":0.0,"intent_response_key":null,'
+    '"utter_action":"utter_None"},"ranking":[]}}',
+    '"extractor":"DIETClassifier"',
+    '"processors":',
+    '{"entity":',
+    '"start":',
+    '"end":',
+    '"confidence_entity":',
+    '"value":',
+    '"input_channel":"rest"',
+    '"input_channel":null',
+    '"message_id":',
+    '"intent_ranking":[{"name":',
+    '"entities":[]',
+    '"parse_data":{"intent":{"name":',
+    '{"event":"user","timestamp":',
+    '"text":',
+    '"policy":"policy_2_TEDPolicy"',
+    '"policy":"policy_1_RulePolicy"',
+    '"policy":"policy_0_MemoizationPolicy"',
+    '"policy":null',
+    '"confidence":1.0',
+    '"confidence":',
+    '"action_text":null,"hide_rule_turn":false',
+    '"metadata":{"model_id":',
+    '"assistant_id":',
+    '"metadata":{}',
+    '"name":"action_listen"',
+    '{"event":"action","timestamp":',
+)
+_COMPRESSION_DICTIONARY = ",".join(_COMPRESSION_FRAGMENTS).encode(DEFAULT_ENCODING)
+
+
+class CodecDecodingException(RasaException):
+    """Raised if data can't be decoded, e.g. because it's corrupted or truncated."""
+
+
+class Codec:
+    """Converts serialised events and trackers to the text which is stored or sent.
+
+    Every codec can decode data which was encoded by one of the built-in codecs, so
+    that changing the codec of a tracker store doesn't break reading stored data.
+    """
+
+    def encode(self, data: Dict[Text, Any]) -> Text:
+        """Encodes a serialised event or tracker.
+
+        Args:
+            data: The serialised event or tracker.
+
+        Returns:
+            The encoded data.
+        """
+        raise NotImplementedError("Codec must implement the `encode` method.")
+
+    def decode(self, encoded: Union[Text, bytes]) -> Dict[Text, Any]:
+        """Decodes a serialised event or tracker.
+
+        Args:
+            encoded: Data which was encoded by one of the built-in codecs.
+
+        Returns:
+            The serialised event or tracker.
+
+        Raises:
+            CodecDecodingException: If the data is neither JSON nor compressed JSON.
+        """
+        try:
+            if isinstance(encoded, bytes):
+                encoded = encoded.decode(DEFAULT_ENCODING)
+
+            if encoded.startswith(COMPRESSED_JSON_PREFIX):
+                decompressor = zlib.decompressobj(zdict=_COMPRESSION_DICTIONARY)
+                compressed = base64.b64decode(
+                    encoded[len(COMPRESSED_JSON_PREFIX) :], validate=True
+                )
+                encoded = decompressor.decompress(compressed) + decompressor.flush()
+                if not decompressor.eof:
+                    raise zlib.error("Compressed data is truncated.")
+
+            return json.loads(encoded)
+        # `UnicodeDecodeError` and `json.JSONDecodeError` are `ValueError`s
+        except (binascii.Error, zlib.error, ValueError) as e:
+            raise CodecDecodingException(f"Data cannot be decoded: {e}") from e
+
+
+class JsonCodec(Codec):
+    """Encodes events and trackers as JSON."""
+
+    def encode(self, data: Dict[Text, Any]) -> Text:
+        """Encodes a serialised event or tracker (see parent class for details)."""
+        return json.dumps(data)
+
+
+class CompressedJsonCodec(Codec):
+    """Encodes events and trackers as compressed JSON.
+
+    The compression uses a preset dictionary of fragments which occur in most
+    events, e.g. their keys or the name of `action_listen`. This makes even single
+    events a lot smaller. The compressed data is base64 encoded, so that it can be
+    stored wherever JSON can be stored.
+
+    The codec trades CPU time for memory and bandwidth: the compression runs on top
+    of the JSON serialisation, so encoding and decoding take longer than with the
+    `JsonCodec`.
+    """
+
+    def encode(self, data: Dict[Text, Any]) -> Text:
+        """Encodes a serialised event or tracker (see parent class for details)."""
+        compressor = zlib.compressobj(zdict=_COMPRESSION_DICTIONARY)
+        serialised = json.dumps(data, separators=(",", ":")).encode(DEFAULT_ENCODING)
+        compressed = compressor.compress(serialised) + compressor.flush()
+
+        return COMPRESSED_JSON_PREFIX + base64.b64encode(compressed).decode("ascii")
+
+
+def create_codec(name: Text) -> Codec:
+    """Creates the codec with the given name.
+
+    Args:
+        name: `json`, `compressed_json` or the module path of a custom `Codec`.
+
+    Returns:
+        The codec.
+
+    Raises:
+        RasaException: If there is no codec with the given name.
+    """
+    if name == JSON_CODEC:
+        return JsonCodec()
+    if name == COMPRESSED_JSON_CODEC:
+        return CompressedJsonCodec()
+
+    try:
+        codec_class = rasa.shared.utils.common.class_from_module_path(name)
+    except (AttributeError, ImportError) as e:
+        raise RasaException(
+            f"Unknown codec '{name}'. Please use '{JSON_CODEC}', "
+            f"'{COMPRESSED_JSON_CODEC}' or the module path of a custom codec."
+        ) from e
+
+    logger.debug(f"Using custom codec '{name}'.")
+    return codec_class()
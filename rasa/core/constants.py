@@ -20,10 +20,31 @@ DEFAULT_RESPONSE_TIMEOUT = 60 * 60  # 1 hour
 
 DEFAULT_REQUEST_TIMEOUT = 60 * 5  # 5 minutes
 
+MODEL_DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # in bytes
+
+# number of times an interrupted model download is resumed
+MODEL_DOWNLOAD_RESUME_ATTEMPTS = 3
+
 DEFAULT_STREAM_READING_TIMEOUT = 10  # in seconds
 
 DEFAULT_LOCK_LIFETIME = 60  # in seconds
 
+INFERENCE_EXECUTOR_THREAD = "thread"
+
+INFERENCE_EXECUTOR_PROCESS = "process"
+
+DEFAULT_INFERENCE_EXECUTOR = INFERENCE_EXECUTOR_THREAD
+
+DEFAULT_INFERENCE_WORKERS = 1
+
+# number of inference requests which can wait for a free worker
+DEFAULT_INFERENCE_QUEUE_SIZE = 100
+
+# time in milliseconds to collect messages which are parsed as one batch
+DEFAULT_NLU_BATCH_WINDOW = 0
+
+DEFAULT_NLU_BATCH_SIZE = 64
+
 BEARER_TOKEN_PREFIX = "Bearer "
 
 # The lowest priority is intended to be used by machine learning policies.
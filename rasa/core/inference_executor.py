@@ -0,0 +1,512 @@
+import asyncio
+import copy
+import functools
+import logging
+import multiprocessing
+import os
+import shutil
+import threading
+from asyncio import AbstractEventLoop
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set, Text, Tuple, Union
+
+import structlog
+
+from rasa.core.channels.channel import UserMessage
+from rasa.core.constants import (
+    DEFAULT_INFERENCE_EXECUTOR,
+    DEFAULT_INFERENCE_QUEUE_SIZE,
+    DEFAULT_INFERENCE_WORKERS,
+    DEFAULT_NLU_BATCH_SIZE,
+    DEFAULT_NLU_BATCH_WINDOW,
+    INFERENCE_EXECUTOR_PROCESS,
+    INFERENCE_EXECUTOR_THREAD,
+)
+from rasa.engine import loader
+from rasa.engine.constants import PLACEHOLDER_MESSAGE, PLACEHOLDER_TRACKER
+from rasa.engine.runner.dask import DaskGraphRunner
+from rasa.engine.runner.interface import GraphRunner
+from rasa.engine.storage.local_model_storage import LocalModelStorage
+from rasa.shared.exceptions import RasaException
+from rasa.shared.nlu.training_data.message import Message
+from rasa.utils.common import TempDirectoryPath, get_temp_dir_name
+
+logger = logging.getLogger(__name__)
+structlogger = structlog.get_logger()
+
+# graph runners which were loaded by a worker process, keyed by the model archive
+_worker_graph_runners: "OrderedDict[Text, GraphRunner]" = OrderedDict()
+# the previous model is kept as well, as it finishes its requests after a model swap
+_MAX_WORKER_GRAPH_RUNNERS = 2
+
+
+@dataclass
+class _MessageBatch:
+    """Messages which are parsed together in a single run of the graph."""
+
+    graph_runner: GraphRunner
+    model_archive: Optional[Text]
+    target: Text
+    messages: List[UserMessage] = field(default_factory=list)
+    futures: List[asyncio.Future] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class InferenceExecutor:
+    """Runs inference on the graph of a trained model in a bounded pool of workers.
+
+    Running the graph in a worker keeps the event loop free to handle other
+    conversations while a model makes a prediction.
+
+    Thread workers use the graph runner of the loaded model. Process workers load
+    the model themselves the first time they run inference for it. Each loaded model
+    uses its own copy of the model archive, which is removed once the model was
+    released and its last inference request finished.
+
+    At most `max_workers + max_queue_size` inference requests are accepted at the
+    same time. Further requests wait until one of them is finished.
+
+    Messages which are parsed within `nlu_batch_window` milliseconds of each other
+    can be collected and run through the NLU part of the graph as one batch.
+    """
+
+    def __init__(
+        self,
+        executor_type: Text = DEFAULT_INFERENCE_EXECUTOR,
+        max_workers: int = DEFAULT_INFERENCE_WORKERS,
+        max_queue_size: int = DEFAULT_INFERENCE_QUEUE_SIZE,
+        nlu_batch_window: float = DEFAULT_NLU_BATCH_WINDOW,
+        nlu_batch_size: int = DEFAULT_NLU_BATCH_SIZE,
+    ) -> None:
+        """Creates the executor.
+
+        Args:
+            executor_type: Either `thread` or `process`.
+            max_workers: Number of inference requests which are run in parallel.
+            max_queue_size: Number of inference requests which can wait for a free
+                worker.
+            nlu_batch_window: Time in milliseconds to wait for further messages
+                before a batch of messages is parsed. `0` disables batching.
+            nlu_batch_size: Maximum number of messages which are parsed in a
+                single batch.
+
+        Raises:
+            RasaException: If the executor type is unknown or the pool or batch
+                size is invalid.
+        """
+        if executor_type not in [INFERENCE_EXECUTOR_THREAD, INFERENCE_EXECUTOR_PROCESS]:
+            raise RasaException(
+                f"Unknown inference executor type '{executor_type}'. Please use "
+                f"'{INFERENCE_EXECUTOR_THREAD}' or '{INFERENCE_EXECUTOR_PROCESS}'."
+            )
+        if max_workers < 1 or max_queue_size < 0:
+            raise RasaException(
+                f"The inference executor needs at least one worker and a queue size "
+                f"of at least zero. Got {max_workers} worker(s) and a queue size of "
+                f"{max_queue_size}."
+            )
+        if nlu_batch_window < 0 or nlu_batch_size < 1:
+            raise RasaException(
+                f"The NLU batch window can't be negative and a batch needs to hold "
+                f"at least one message. Got a window of {nlu_batch_window} ms and a "
+                f"batch size of {nlu_batch_size}."
+            )
+
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.nlu_batch_window = nlu_batch_window
+        self.nlu_batch_size = nlu_batch_size
+
+        self._executor: Optional[Executor] = None
+        # models are loaded and released in other threads than the event loop's
+        self._model_archives_lock = threading.Lock()
+        self._model_archive_dirs: Dict[Text, Text] = {}
+        self._model_archive_requests: Dict[Text, int] = {}
+        self._released_model_archives: Set[Text] = set()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[AbstractEventLoop] = None
+        self._queue_depth = 0
+        self._message_batches: Dict[Tuple[int, Text], _MessageBatch] = {}
+        # the event loop only keeps weak references to tasks
+        self._message_batch_tasks: Set[asyncio.Task] = set()
+
+    @property
+    def queue_depth(self) -> int:
+        """Returns the number of inference requests which are waiting or running."""
+        return self._queue_depth
+
+    def load_model(self, model_archive: Union[Text, Path]) -> Optional[Text]:
+        """Makes a newly loaded model available to the workers.
+
+        Process workers load the model from a copy of its archive, as the original
+        archive might be removed once the model was loaded. Thread workers use the
+        graph runner which is passed to `run`.
+
+        Args:
+            model_archive: Path to the archive of the model.
+
+        Returns:
+            The archive which has to be passed to `run` for this model, or `None` if
+            the workers don't need it.
+        """
+        if self.executor_type != INFERENCE_EXECUTOR_PROCESS:
+            return None
+
+        model_archive_dir = get_temp_dir_name()
+        copied_model_archive = shutil.copy(model_archive, model_archive_dir)
+        with self._model_archives_lock:
+            self._model_archive_dirs[copied_model_archive] = model_archive_dir
+            self._model_archive_requests[copied_model_archive] = 0
+        return copied_model_archive
+
+    def warm_up(
+        self,
+        graph_runner: GraphRunner,
+        warm_up: Callable[[Callable[..., Dict[Text, Any]]], None],
+        model_archive: Optional[Text] = None,
+    ) -> None:
+        """Warms up a newly loaded model in the workers and waits until it's done.
+
+        Thread workers share the graph runner, which is hence warmed up once. Each
+        process worker loads the model itself, so the warm-up is run once per
+        worker. As a worker is busy loading the model while the other warm-ups are
+        dispatched, they usually reach different workers.
+
+        Args:
+            graph_runner: The graph runner of the loaded model.
+            warm_up: Function which runs the warm-up with the graph runner's `run`
+                method. It's sent to process workers and needs to be picklable.
+            model_archive: The archive which `load_model` returned for the model.
+        """
+        executor = self._get_executor()
+        if self.executor_type != INFERENCE_EXECUTOR_PROCESS:
+            executor.submit(warm_up, graph_runner.run).result()
+            return
+
+        futures = [
+            executor.submit(_warm_up_in_worker_process, model_archive, warm_up)
+            for _ in range(self.max_workers)
+        ]
+        for future in futures:
+            future.result()
+
+    def release_model(self, model_archive: Optional[Text]) -> None:
+        """Removes the archive of a model once its running requests are finished.
+
+        Args:
+            model_archive: The archive which was returned by `load_model`.
+        """
+        if model_archive is None:
+            return
+
+        with self._model_archives_lock:
+            self._released_model_archives.add(model_archive)
+        self._remove_model_archive_if_unused(model_archive)
+
+    def _remove_model_archive_if_unused(self, model_archive: Text) -> None:
+        with self._model_archives_lock:
+            if (
+                model_archive not in self._released_model_archives
+                or self._model_archive_requests.get(model_archive)
+            ):
+                return
+
+            self._released_model_archives.discard(model_archive)
+            self._model_archive_requests.pop(model_archive, None)
+            model_archive_dir = self._model_archive_dirs.pop(model_archive, None)
+
+        if model_archive_dir:
+            shutil.rmtree(model_archive_dir, ignore_errors=True)
+
+    async def run(
+        self,
+        graph_runner: GraphRunner,
+        inputs: Dict[Text, Any],
+        targets: List[Text],
+        model_archive: Optional[Text] = None,
+    ) -> Dict[Text, Any]:
+        """Runs the graph in a worker.
+
+        Args:
+            graph_runner: The graph runner of the loaded model.
+            inputs: Inputs for the graph, see `GraphRunner.run`.
+            targets: Nodes of the graph whose outputs should be returned.
+            model_archive: The archive which `load_model` returned for the model.
+
+        Returns:
+            The outputs of the target nodes.
+
+        Raises:
+            RasaException: If process workers are used and no model archive is
+                given.
+        """
+        if self.executor_type == INFERENCE_EXECUTOR_PROCESS and model_archive is None:
+            raise RasaException(
+                "Process workers need the archive of the model which is run. "
+                "Please pass the archive returned by `load_model`."
+            )
+
+        slots = self._get_slots()
+        self._queue_depth += 1
+        structlogger.debug(
+            "inference_executor.run.queued", queue_depth=self._queue_depth
+        )
+        if self.executor_type == INFERENCE_EXECUTOR_PROCESS:
+            # keeps the model archive until the request is finished
+            with self._model_archives_lock:
+                self._model_archive_requests[model_archive] = (
+                    self._model_archive_requests.get(model_archive, 0) + 1
+                )
+        try:
+            async with slots:
+                loop = asyncio.get_running_loop()
+                if self.executor_type == INFERENCE_EXECUTOR_PROCESS:
+                    return await loop.run_in_executor(
+                        self._get_executor(),
+                        _run_graph_in_worker_process,
+                        model_archive,
+                        _without_output_channels(inputs),
+                        targets,
+                    )
+
+                return await loop.run_in_executor(
+                    self._get_executor(),
+                    functools.partial(graph_runner.run, inputs=inputs, targets=targets),
+                )
+        finally:
+            self._queue_depth -= 1
+            if self.executor_type == INFERENCE_EXECUTOR_PROCESS:
+                with self._model_archives_lock:
+                    self._model_archive_requests[model_archive] -= 1
+                self._remove_model_archive_if_unused(model_archive)
+
+    async def parse_message(
+        self,
+        graph_runner: GraphRunner,
+        message: UserMessage,
+        target: Text,
+        model_archive: Optional[Text] = None,
+    ) -> Message:
+        """Parses a message, batching it with other messages if enabled.
+
+        The NLU part of the graph must not depend on the conversation tracker, as
+        the messages of a batch belong to different conversations.
+
+        Args:
+            graph_runner: The graph runner of the loaded model.
+            message: The message which should be parsed.
+            target: The NLU target node of the graph.
+            model_archive: The archive which `load_model` returned for the model.
+
+        Returns:
+            The parsed message.
+        """
+        if not self.nlu_batch_window:
+            results = await self.run(
+                graph_runner,
+                inputs={PLACEHOLDER_MESSAGE: [message], PLACEHOLDER_TRACKER: None},
+                targets=[target],
+                model_archive=model_archive,
+            )
+            return results[target][0]
+
+        key = (id(graph_runner), target)
+        batch = self._message_batches.get(key)
+        if batch is None:
+            batch = _MessageBatch(graph_runner, model_archive, target)
+            batch.timer = asyncio.get_running_loop().call_later(
+                self.nlu_batch_window / 1000, self._flush_message_batch, key
+            )
+            self._message_batches[key] = batch
+
+        future = asyncio.get_running_loop().create_future()
+        batch.messages.append(message)
+        batch.futures.append(future)
+
+        if len(batch.messages) >= self.nlu_batch_size:
+            self._flush_message_batch(key)
+
+        return await future
+
+    def _flush_message_batch(self, key: Tuple[int, Text]) -> None:
+        batch = self._message_batches.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+
+        task = asyncio.ensure_future(self._run_message_batch(batch))
+        self._message_batch_tasks.add(task)
+        task.add_done_callback(self._message_batch_tasks.discard)
+
+    async def _run_message_batch(self, batch: _MessageBatch) -> None:
+        structlogger.debug(
+            "inference_executor.parse_message.batch",
+            batch_size=len(batch.messages),
+        )
+        try:
+            results = await self.run(
+                batch.graph_runner,
+                inputs={
+                    PLACEHOLDER_MESSAGE: batch.messages,
+                    PLACEHOLDER_TRACKER: None,
+                },
+                targets=[batch.target],
+                model_archive=batch.model_archive,
+            )
+            parsed_messages = results[batch.target]
+            if len(parsed_messages) != len(batch.messages):
+                raise RasaException(
+                    f"Parsing a batch of {len(batch.messages)} messages returned "
+                    f"{len(parsed_messages)} messages."
+                )
+        except asyncio.CancelledError:
+            # the executor was closed
+            for future in batch.futures:
+                future.cancel()
+            raise
+        except Exception as e:
+            if len(batch.messages) == 1:
+                _set_future_exception(batch.futures[0], e)
+                return
+
+            # parse the messages one by one so that only the callers whose
+            # message caused the error receive it
+            logger.debug(
+                "Parsing a batch of messages failed. Parsing them one by one.",
+                exc_info=True,
+            )
+            await asyncio.gather(
+                *[
+                    self._run_message_batch(
+                        _MessageBatch(
+                            batch.graph_runner,
+                            batch.model_archive,
+                            batch.target,
+                            [message],
+                            [future],
+                        )
+                    )
+                    for message, future in zip(batch.messages, batch.futures)
+                ]
+            )
+            return
+
+        for future, parsed_message in zip(batch.futures, parsed_messages):
+            if not future.done():
+                future.set_result(parsed_message)
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        # semaphores can't be shared across event loops
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_workers + self.max_queue_size)
+            self._slots_loop = loop
+        return self._slots
+
+    def _get_executor(self) -> Executor:
+        if self._executor is not None:
+            return self._executor
+
+        if self.executor_type == INFERENCE_EXECUTOR_PROCESS:
+            # forking a process which already initialized TensorFlow is not safe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="inference"
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shuts down the workers and removes the copied model archives."""
+        for batch in self._message_batches.values():
+            if batch.timer is not None:
+                batch.timer.cancel()
+            for future in batch.futures:
+                future.cancel()
+        self._message_batches.clear()
+
+        for task in self._message_batch_tasks:
+            task.cancel()
+        self._message_batch_tasks.clear()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        with self._model_archives_lock:
+            model_archive_dirs = list(self._model_archive_dirs.values())
+            self._model_archive_dirs.clear()
+            self._model_archive_requests.clear()
+            self._released_model_archives.clear()
+
+        for model_archive_dir in model_archive_dirs:
+            if os.path.exists(model_archive_dir):
+                shutil.rmtree(model_archive_dir, ignore_errors=True)
+
+
+def _set_future_exception(future: asyncio.Future, exception: Exception) -> None:
+    # the caller might have stopped waiting for the result in the meantime
+    if not future.done():
+        future.set_exception(exception)
+
+
+def _without_output_channels(inputs: Dict[Text, Any]) -> Dict[Text, Any]:
+    """Removes output channels from messages as they can't be sent to a process."""
+    messages = inputs.get(PLACEHOLDER_MESSAGE)
+    if not messages:
+        return inputs
+
+    sendable_messages = []
+    for message in messages:
+        if isinstance(message, UserMessage):
+            message = copy.copy(message)
+            message.output_channel = None
+        sendable_messages.append(message)
+
+    return {**inputs, PLACEHOLDER_MESSAGE: sendable_messages}
+
+
+def _load_worker_graph_runner(model_archive: Text) -> GraphRunner:
+    """Returns the graph runner of a model in a worker process, loading it if needed."""
+    graph_runner = _worker_graph_runners.get(model_archive)
+    if graph_runner is not None:
+        _worker_graph_runners.move_to_end(model_archive)
+        return graph_runner
+
+    logger.debug(f"Loading model '{model_archive}' in inference worker.")
+    with TempDirectoryPath(get_temp_dir_name()) as temporary_directory:
+        _, graph_runner = loader.load_predict_graph_runner(
+            Path(temporary_directory),
+            Path(model_archive),
+            LocalModelStorage,
+            DaskGraphRunner,
+        )
+    _worker_graph_runners[model_archive] = graph_runner
+    while len(_worker_graph_runners) > _MAX_WORKER_GRAPH_RUNNERS:
+        _worker_graph_runners.popitem(last=False)
+
+    return graph_runner
+
+
+def _run_graph_in_worker_process(
+    model_archive: Text, inputs: Dict[Text, Any], targets: List[Text]
+) -> Dict[Text, Any]:
+    """Runs the graph of a model in a worker process, loading the model if needed."""
+    graph_runner = _load_worker_graph_runner(model_archive)
+    return graph_runner.run(inputs=inputs, targets=targets)
+
+
+def _warm_up_in_worker_process(
+    model_archive: Text, warm_up: Callable[[Callable[..., Dict[Text, Any]]], None]
+) -> None:
+    """Loads a model in a worker process and warms it up."""
+    graph_runner = _load_worker_graph_runner(model_archive)
+    warm_up(graph_runner.run)
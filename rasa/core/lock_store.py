@@ -4,17 +4,30 @@ from contextlib import asynccontextmanager
 import json
 import logging
 import os
-
-from typing import AsyncGenerator, Dict, Optional, Text, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Optional,
+    Text,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from rasa.shared.exceptions import RasaException, ConnectionException
 import rasa.shared.utils.common
+import rasa.utils.common as common_utils
 from rasa.core.constants import DEFAULT_LOCK_LIFETIME
 from rasa.core.lock import TicketLock
 from rasa.utils.endpoints import EndpointConfig
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def _get_lock_lifetime() -> int:
     return int(os.environ.get("TICKET_LOCK_LIFETIME", 0)) or DEFAULT_LOCK_LIFETIME
@@ -24,6 +37,8 @@ LOCK_LIFETIME = _get_lock_lifetime()
 DEFAULT_SOCKET_TIMEOUT_IN_SECONDS = 10
 
 DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX = "lock:"
+# name of the Redis channel (after the key prefix) on which lock releases are published
+REDIS_LOCK_RELEASE_CHANNEL = "released"
 
 
 # noinspection PyUnresolvedReferences
@@ -38,7 +53,24 @@ class LockError(RasaException):
 
 
 class LockStore:
-    """Base class for ticket locks."""
+    """Base class for ticket locks.
+
+    Lock stores which talk to a remote storage set `_executor` to run their blocking
+    requests in a thread pool. Otherwise the requests are run directly.
+
+    Waiting for a lock doesn't only poll the lock: waiters are woken up as soon as a
+    lock of their conversation is released by this lock store.
+
+    Locks are read, modified and written with `_modify_lock`, which lock stores
+    that are shared by several Rasa instances override to do so atomically.
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    # set when a lock of the conversation is released, created on first use so that
+    # subclasses don't need to call `__init__`
+    _release_events: Optional[Dict[Text, asyncio.Event]] = None
+    # number of requests which wait for a lock of the conversation
+    _number_of_waiters: Optional[Dict[Text, int]] = None
 
     @staticmethod
     def create(obj: Union[LockStore, EndpointConfig, None]) -> LockStore:
@@ -68,6 +100,33 @@ class LockStore:
         """Commit `lock` to storage."""
         raise NotImplementedError
 
+    def _modify_lock(
+        self,
+        conversation_id: Text,
+        modify: Callable[[], Tuple[Optional[TicketLock], T]],
+    ) -> T:
+        """Reads, modifies and writes the lock of a conversation.
+
+        Args:
+            conversation_id: Conversation ID of the lock.
+            modify: Reads the lock and returns the lock which should be saved, or
+                `None` if the lock should be deleted, together with a result.
+
+        Returns:
+            The result of `modify`.
+        """
+        lock, result = modify()
+        if lock is not None:
+            self.save_lock(lock)
+        else:
+            self.delete_lock(conversation_id)
+        return result
+
+    async def close(self) -> None:
+        """Releases the resources of the lock store."""
+        # default implementation does nothing
+        pass
+
     def issue_ticket(
         self, conversation_id: Text, lock_lifetime: float = LOCK_LIFETIME
     ) -> int:
@@ -77,12 +136,13 @@ class LockStore:
         Creates a new lock if none is found.
         """
         logger.debug(f"Issuing ticket for conversation '{conversation_id}'.")
-        try:
+
+        def issue() -> Tuple[Optional[TicketLock], int]:
             lock = self.get_or_create_lock(conversation_id)
-            ticket = lock.issue_ticket(lock_lifetime)
-            self.save_lock(lock)
+            return lock, lock.issue_ticket(lock_lifetime)
 
-            return ticket
+        try:
+            return self._modify_lock(conversation_id, issue)
         except Exception as e:
             raise LockError(f"Error while acquiring lock. Error:\n{e}")
 
@@ -98,22 +158,53 @@ class LockStore:
         Try acquiring lock with a wait time of `wait_time_in_seconds` seconds
         between attempts. Raise a `LockError` if lock has expired.
         """
-        ticket = self.issue_ticket(conversation_id, lock_lifetime)
+        ticket = await common_utils.run_in_thread_pool(
+            self._executor, self.issue_ticket, conversation_id, lock_lifetime
+        )
         try:
 
             yield await self._acquire_lock(
                 conversation_id, ticket, wait_time_in_seconds
             )
         finally:
-            self.cleanup(conversation_id, ticket)
+            await common_utils.run_in_thread_pool(
+                self._executor, self.cleanup, conversation_id, ticket
+            )
+            await self._notify_release(conversation_id)
 
     async def _acquire_lock(
         self, conversation_id: Text, ticket: int, wait_time_in_seconds: float
     ) -> TicketLock:
         logger.debug(f"Acquiring lock for conversation '{conversation_id}'.")
+        if self._number_of_waiters is None:
+            self._number_of_waiters = {}
+        self._number_of_waiters[conversation_id] = (
+            self._number_of_waiters.get(conversation_id, 0) + 1
+        )
+        try:
+            return await self._wait_until_lock_is_acquired(
+                conversation_id, ticket, wait_time_in_seconds
+            )
+        finally:
+            self._number_of_waiters[conversation_id] -= 1
+            if not self._number_of_waiters[conversation_id]:
+                del self._number_of_waiters[conversation_id]
+                # nobody waits for a release which might never come anymore
+                if self._release_events is not None:
+                    self._release_events.pop(conversation_id, None)
+
+    async def _wait_until_lock_is_acquired(
+        self, conversation_id: Text, ticket: int, wait_time_in_seconds: float
+    ) -> TicketLock:
         while True:
+            # get the release event before fetching the lock, so that a release in
+            # between isn't missed
+            released = self._release_event(conversation_id)
+
             # fetch lock in every iteration because lock might no longer exist
-            lock = self.get_lock(conversation_id)
+            lock = await common_utils.run_in_thread_pool(
+                self._executor, self.get_lock, conversation_id
+            )
 
             # exit loop if lock does not exist anymore (expired)
             if not lock:
@@ -133,20 +224,70 @@ class LockStore:
                 f"Retrying in {wait_time_in_seconds} seconds ..."
             )
 
-            # sleep and update lock
-            await asyncio.sleep(wait_time_in_seconds)
-            self.update_lock(conversation_id)
+            # wait for the release of the lock, and update the lock if it wasn't
+            # released in time, e.g. because its holder crashed
+            if not await self._wait_for_release(
+                conversation_id, released, wait_time_in_seconds
+            ):
+                await common_utils.run_in_thread_pool(
+                    self._executor, self.update_lock, conversation_id
+                )
 
         raise LockError(
             f"Could not acquire lock for conversation_id '{conversation_id}'."
         )
 
+    def _release_event(self, conversation_id: Text) -> asyncio.Event:
+        if self._release_events is None:
+            self._release_events = {}
+
+        return self._release_events.setdefault(conversation_id, asyncio.Event())
+
+    async def _wait_for_release(
+        self, conversation_id: Text, released: asyncio.Event, timeout: float
+    ) -> bool:
+        """Waits until a lock of the conversation is released.
+
+        Args:
+            conversation_id: Conversation ID of the lock.
+            released: Event which is set when the lock is released.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            `True` if the lock was released, `False` if the wait timed out.
+        """
+        try:
+            await asyncio.wait_for(released.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _notify_release(self, conversation_id: Text) -> None:
+        """Wakes up everyone who waits for a lock of the conversation.
+
+        Args:
+            conversation_id: Conversation ID of the released lock.
+        """
+        self._set_released(conversation_id)
+
+    def _set_released(self, conversation_id: Text) -> None:
+        if self._release_events is None:
+            return
+
+        released = self._release_events.pop(conversation_id, None)
+        if released is not None:
+            released.set()
+
     def update_lock(self, conversation_id: Text) -> None:
         """Fetch lock for `conversation_id`, remove expired tickets and save lock."""
-        lock = self.get_lock(conversation_id)
-        if lock:
-            lock.remove_expired_tickets()
-            self.save_lock(lock)
+
+        def remove_expired_tickets() -> Tuple[Optional[TicketLock], None]:
+            lock = self.get_lock(conversation_id)
+            if lock:
+                lock.remove_expired_tickets()
+            return lock, None
+
+        self._modify_lock(conversation_id, remove_expired_tickets)
 
     def get_or_create_lock(self, conversation_id: Text) -> TicketLock:
         """Fetch existing lock for `conversation_id`.
@@ -173,16 +314,27 @@ class LockStore:
 
         Removes ticket from lock and saves lock.
         """
-        lock = self.get_lock(conversation_id)
-        if lock:
-            lock.remove_ticket_for(ticket_number)
-            self.save_lock(lock)
+
+        def remove_ticket() -> Tuple[Optional[TicketLock], None]:
+            lock = self.get_lock(conversation_id)
+            if lock:
+                lock.remove_ticket_for(ticket_number)
+            return lock, None
+
+        self._modify_lock(conversation_id, remove_ticket)
 
     def cleanup(self, conversation_id: Text, ticket_number: int) -> None:
         """Remove lock for `conversation_id` if no one is waiting."""
-        self.finish_serving(conversation_id, ticket_number)
-        if not self.is_someone_waiting(conversation_id):
-            self.delete_lock(conversation_id)
+
+        def remove_ticket_and_unused_lock() -> Tuple[Optional[TicketLock], None]:
+            lock = self.get_lock(conversation_id)
+            if lock:
+                lock.remove_ticket_for(ticket_number)
+            if lock and lock.is_someone_waiting():
+                return lock, None
+            return None, None
+
+        self._modify_lock(conversation_id, remove_ticket_and_unused_lock)
 
     @staticmethod
     def _log_deletion(conversation_id: Text, deletion_successful: bool) -> None:
@@ -193,7 +345,20 @@ class LockStore:
 
 
 class RedisLockStore(LockStore):
-    """Redis store for ticket locks."""
+    """Redis store for ticket locks.
+
+    Requests to Redis are run in a single background thread, so that they don't
+    block the event loop. Locks are updated in transactions which watch the lock,
+    so that concurrent updates of other Rasa instances aren't overwritten.
+
+    Releases of locks are published on a Redis channel, so that waiters of other
+    Rasa instances are woken up as well.
+    """
+
+    # thread which listens for lock releases of other Rasa instances
+    _release_listener: Optional[Any] = None
+    # event loop of the waiters which the listener wakes up
+    _release_listener_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def __init__(
         self,
@@ -243,6 +408,9 @@ class RedisLockStore(LockStore):
             ssl_ca_certs=ssl_ca_certs,
             socket_timeout=socket_timeout,
         )
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="redis_lock_store"
+        )
 
         self.key_prefix = DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX
         if key_prefix:
@@ -276,6 +444,103 @@ class RedisLockStore(LockStore):
     def save_lock(self, lock: TicketLock) -> None:
         self.red.set(self.key_prefix + lock.conversation_id, lock.dumps())
 
+    def _modify_lock(
+        self,
+        conversation_id: Text,
+        modify: Callable[[], Tuple[Optional[TicketLock], T]],
+    ) -> T:
+        """Reads, modifies and writes the lock of a conversation atomically.
+
+        The lock is watched while it is read and modified. If another client
+        changes it in the meantime, the transaction fails and is retried.
+
+        See parent class for more information.
+        """
+        import redis.exceptions
+
+        key = self.key_prefix + conversation_id
+        with self.red.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(key)
+                    lock, result = modify()
+                    pipe.multi()
+                    if lock is not None:
+                        pipe.set(key, lock.dumps())
+                    else:
+                        pipe.delete(key)
+                    pipe.execute()
+                    return result
+                except redis.exceptions.WatchError:
+                    logger.debug(
+                        f"Lock for conversation '{conversation_id}' was modified "
+                        f"by another client. Retrying."
+                    )
+
+    async def close(self) -> None:
+        """Stops listening for lock releases of other Rasa instances."""
+        await common_utils.run_in_thread_pool(
+            self._executor, self._stop_listening_for_releases
+        )
+
+    @property
+    def _release_channel(self) -> Text:
+        return self.key_prefix + REDIS_LOCK_RELEASE_CHANNEL
+
+    async def _wait_for_release(
+        self, conversation_id: Text, released: asyncio.Event, timeout: float
+    ) -> bool:
+        """Waits until a lock of the conversation is released by any Rasa instance.
+
+        See parent class for more information.
+        """
+        loop = asyncio.get_running_loop()
+        if self._release_listener is None or self._release_listener_loop is not loop:
+            await common_utils.run_in_thread_pool(
+                self._executor, self._listen_for_releases, loop
+            )
+
+        return await super()._wait_for_release(conversation_id, released, timeout)
+
+    def _listen_for_releases(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._release_listener is not None:
+            if self._release_listener_loop is loop:
+                return
+            # the waiters of the previous event loop can't be woken up anymore
+            self._stop_listening_for_releases()
+
+        def on_release(message: Dict[Text, Any]) -> None:
+            conversation_id = message["data"]
+            if isinstance(conversation_id, bytes):
+                conversation_id = conversation_id.decode()
+
+            try:
+                loop.call_soon_threadsafe(self._set_released, conversation_id)
+            except RuntimeError:
+                # the event loop was closed
+                pass
+
+        pubsub = self.red.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{self._release_channel: on_release})
+        self._release_listener = pubsub.run_in_thread(sleep_time=1, daemon=True)
+        self._release_listener_loop = loop
+
+    def _stop_listening_for_releases(self) -> None:
+        if self._release_listener is None:
+            return
+
+        # the listener unsubscribes and closes its connection once it stopped
+        self._release_listener.stop()
+        self._release_listener = None
+        self._release_listener_loop = None
+
+    async def _notify_release(self, conversation_id: Text) -> None:
+        """Publishes the release of a lock to all Rasa instances."""
+        await common_utils.run_in_thread_pool(
+            self._executor, self.red.publish, self._release_channel, conversation_id
+        )
+        await super()._notify_release(conversation_id)
+
 
 class InMemoryLockStore(LockStore):
     """In-memory store for ticket locks."""
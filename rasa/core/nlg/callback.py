@@ -1,6 +1,10 @@
+import asyncio
+import copy
 import json
 import logging
-from typing import List, Text, Any, Dict, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Text, Tuple
 
 from rasa.core.constants import DEFAULT_REQUEST_TIMEOUT
 from rasa.core.nlg.generator import NaturalLanguageGenerator, ResponseVariationFilter
@@ -32,6 +36,11 @@ def nlg_response_format_spec() -> Dict[Text, Any]:
 
 RESPONSE_ID_KEY = "response_ids"
 
+# endpoint configuration key of the response cache
+NLG_CACHE_KEY = "cache"
+DEFAULT_NLG_CACHE_MAX_SIZE = 1000
+DEFAULT_NLG_CACHE_TTL_IN_SECONDS = 60.0
+
 
 def nlg_request_format(
     utter_action: Text,
@@ -65,6 +74,13 @@ class CallbackNaturalLanguageGenerator(NaturalLanguageGenerator):
 
         self.nlg_endpoint = endpoint_config
 
+        cache_config = endpoint_config.kwargs.get(NLG_CACHE_KEY)
+        self.cache: Optional[ResponseCache] = None
+        if cache_config is not None and cache_config is not False:
+            self.cache = ResponseCache(
+                **(cache_config if isinstance(cache_config, dict) else {})
+            )
+
     async def generate(
         self,
         utter_action: Text,
@@ -79,6 +95,26 @@ class CallbackNaturalLanguageGenerator(NaturalLanguageGenerator):
         )
         kwargs["response_id"] = response_id
 
+        if self.cache is None:
+            return await self._request_response(
+                utter_action, tracker, output_channel, **kwargs
+            )
+
+        key = self.cache.key(utter_action, tracker, output_channel, **kwargs)
+        return await self.cache.get_or_request(
+            key,
+            lambda: self._request_response(
+                utter_action, tracker, output_channel, **kwargs
+            ),
+        )
+
+    async def _request_response(
+        self,
+        utter_action: Text,
+        tracker: DialogueStateTracker,
+        output_channel: Text,
+        **kwargs: Any,
+    ) -> Dict[Text, Any]:
         body = nlg_request_format(utter_action, tracker, output_channel, **kwargs)
 
         logger.debug(
@@ -145,3 +181,126 @@ class CallbackNaturalLanguageGenerator(NaturalLanguageGenerator):
             logger.debug(f"Failed to fetch response id for action '{utter_action}'.")
 
         return response_id
+
+
+class ResponseCache:
+    """Caches the responses of an NLG endpoint.
+
+    Responses are cached per utter action, output channel, response variation and
+    slot values, so only use the cache if the responses of your NLG server don't
+    depend on anything else. Identical requests which are made at the same time
+    are only sent once to the NLG endpoint.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_NLG_CACHE_MAX_SIZE,
+        ttl: float = DEFAULT_NLG_CACHE_TTL_IN_SECONDS,
+        slots: Optional[List[Text]] = None,
+    ) -> None:
+        """Creates the cache.
+
+        Args:
+            max_size: Maximum number of cached responses. The least recently used
+                response is removed from the cache when it's full.
+            ttl: Time in seconds after which a response is requested again.
+            slots: Names of the slots which the responses depend on. Defaults to
+                all slots of the domain.
+
+        Raises:
+            RasaException: If the configuration is invalid.
+        """
+        if max_size < 1 or ttl <= 0:
+            raise RasaException(
+                f"The NLG response cache needs a size of at least one and a positive "
+                f"time to live. Got a size of {max_size} and a time to live of {ttl} "
+                f"seconds."
+            )
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.slots = slots
+        # maps cache keys to the cached response and its expiry time
+        self._responses: OrderedDict[
+            Text, Tuple[Dict[Text, Any], float]
+        ] = OrderedDict()
+        # requests which are currently sent to the NLG endpoint
+        self._pending: Dict[Text, asyncio.Future] = {}
+
+    def key(
+        self,
+        utter_action: Text,
+        tracker: DialogueStateTracker,
+        output_channel: Text,
+        **kwargs: Any,
+    ) -> Text:
+        """Returns the cache key of a response.
+
+        Args:
+            utter_action: The utter action of the response.
+            tracker: The tracker of the conversation.
+            output_channel: The name of the output channel.
+            **kwargs: Additional arguments of the response, e.g. the response ID.
+
+        Returns:
+            The cache key.
+        """
+        slot_values = tracker.current_slot_values()
+        if self.slots is not None:
+            slot_values = {slot: slot_values.get(slot) for slot in self.slots}
+
+        return json.dumps(
+            [utter_action, output_channel, kwargs, slot_values],
+            sort_keys=True,
+            default=str,
+        )
+
+    async def get_or_request(
+        self, key: Text, request: Callable[[], Awaitable[Dict[Text, Any]]]
+    ) -> Dict[Text, Any]:
+        """Returns the cached response or requests it.
+
+        Args:
+            key: The cache key of the response.
+            request: Requests the response from the NLG endpoint.
+
+        Returns:
+            The response.
+        """
+        cached = self._cached_response(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(request())
+            self._pending[key] = pending
+            pending.add_done_callback(lambda done: self._finish_request(key, done))
+        else:
+            logger.debug("Waiting for an identical request to the NLG endpoint.")
+
+        # other waiters still receive the response if this caller is cancelled
+        response = await asyncio.shield(pending)
+        return copy.deepcopy(response)
+
+    def _cached_response(self, key: Text) -> Optional[Dict[Text, Any]]:
+        if key not in self._responses:
+            return None
+
+        response, expires_at = self._responses[key]
+        if expires_at < time.time():
+            del self._responses[key]
+            return None
+
+        self._responses.move_to_end(key)
+        return response
+
+    def _finish_request(self, key: Text, request: asyncio.Future) -> None:
+        self._pending.pop(key, None)
+        if request.cancelled() or request.exception() is not None:
+            return
+
+        self._responses[key] = (request.result(), time.time() + self.ttl)
+        self._responses.move_to_end(key)
+        while len(self._responses) > self.max_size:
+            self._responses.popitem(last=False)
@@ -1,5 +1,5 @@
 import logging
-from typing import List, Optional, Union, Text, Any, Dict
+from typing import Callable, List, Optional, Union, Text, Any, Dict, Tuple
 
 import rasa.shared.utils.common
 import rasa.shared.utils.io
@@ -92,11 +92,60 @@ def _load_from_module_name_in_endpoint_config(
         )
 
 
+SlotCondition = Callable[[Dict[Text, Any]], bool]
+
+
+def compile_slot_condition(constraints: List[Dict[Text, Any]]) -> SlotCondition:
+    """Compiles the condition of a response variation into a predicate.
+
+    Args:
+        constraints: The slot constraints of the condition.
+
+    Returns:
+        Function which checks if filled slots match the condition.
+    """
+    # the expected values of text slots are case folded once instead of per check
+    checks = [
+        (
+            constraint["name"],
+            constraint["value"],
+            constraint["value"].casefold()
+            if isinstance(constraint["value"], str)
+            else None,
+        )
+        for constraint in constraints
+    ]
+
+    def matches(filled_slots: Dict[Text, Any]) -> bool:
+        for name, value, casefolded_value in checks:
+            filled_slots_value = filled_slots.get(name)
+            if isinstance(filled_slots_value, str) and casefolded_value is not None:
+                if filled_slots_value.casefold() != casefolded_value:
+                    return False
+            # slot values can be of different data types
+            # such as int, float, bool, etc. hence, this check
+            # executes when slot values are not strings
+            elif filled_slots_value != value:
+                return False
+
+        return True
+
+    return matches
+
+
 class ResponseVariationFilter:
     """Filters response variations based on the channel, action and condition."""
 
     def __init__(self, responses: Dict[Text, List[Dict[Text, Any]]]) -> None:
         self.responses = responses
+        # maps utter actions to their variations grouped by channel, see
+        # `_variations_by_channel`
+        self._variations: Dict[
+            Text,
+            Dict[
+                Optional[Text], Tuple[List[Dict], List[Tuple[Dict, SlotCondition]]]
+            ],
+        ] = {}
 
     @staticmethod
     def _matches_filled_slots(
@@ -104,20 +153,49 @@ class ResponseVariationFilter:
     ) -> bool:
         """Checks if the conditional response variation matches the filled slots."""
         constraints = response.get(RESPONSE_CONDITION, [])
-        for constraint in constraints:
-            name = constraint["name"]
-            value = constraint["value"]
-            filled_slots_value = filled_slots.get(name)
-            if isinstance(filled_slots_value, str) and isinstance(value, str):
-                if filled_slots_value.casefold() != value.casefold():
-                    return False
-            # slot values can be of different data types
-            # such as int, float, bool, etc. hence, this check
-            # executes when slot values are not strings
-            elif filled_slots_value != value:
-                return False
+        return compile_slot_condition(constraints)(filled_slots)
 
-        return True
+    def index_responses(self) -> None:
+        """Groups the variations of all responses, see `_variations_by_channel`.
+
+        Otherwise, the variations of a response are grouped when the response is
+        used for the first time.
+        """
+        for utter_action in self.responses:
+            self._variations_by_channel(utter_action)
+
+    def _variations_by_channel(
+        self, utter_action: Text
+    ) -> Dict[Optional[Text], Tuple[List[Dict], List[Tuple[Dict, SlotCondition]]]]:
+        """Groups the variations of an utter action by their channel.
+
+        The groups are only built once per utter action.
+
+        Args:
+            utter_action: The utter action.
+
+        Returns:
+            Maps the channels (`None` for variations without a channel) to the
+            variations without a condition and the variations with a condition
+            together with their compiled condition.
+        """
+        variations = self._variations.get(utter_action)
+        if variations is not None:
+            return variations
+
+        variations = {}
+        for response in self.responses[utter_action]:
+            default, conditional = variations.setdefault(
+                response.get(CHANNEL), ([], [])
+            )
+            condition = response.get(RESPONSE_CONDITION)
+            if condition is None:
+                default.append(response)
+            elif condition:
+                conditional.append((response, compile_slot_condition(condition)))
+
+        self._variations[utter_action] = variations
+        return variations
 
     def responses_for_utter_action(
         self,
@@ -126,53 +204,32 @@ class ResponseVariationFilter:
         filled_slots: Dict[Text, Any],
     ) -> List[Dict[Text, Any]]:
         """Returns array of responses that fit the channel, action and condition."""
-        # filter responses without a condition
-        default_responses = list(
-            filter(
-                lambda x: (x.get(RESPONSE_CONDITION) is None),
-                self.responses[utter_action],
-            )
-        )
-        # filter responses with a condition that matches the filled slots
-        conditional_responses = list(
-            filter(
-                lambda x: (
-                    x.get(RESPONSE_CONDITION)
-                    and self._matches_filled_slots(
-                        filled_slots=filled_slots, response=x
-                    )
-                ),
-                self.responses[utter_action],
-            )
-        )
+        variations = self._variations_by_channel(utter_action)
+        default_channel, conditional_channel = variations.get(output_channel, ([], []))
+        default_no_channel, conditional_no_channel = variations.get(None, ([], []))
 
-        # filter conditional responses that match the channel
-        conditional_channel = list(
-            filter(lambda x: (x.get(CHANNEL) == output_channel), conditional_responses)
-        )
-        # filter conditional responses that don't match the channel
-        conditional_no_channel = list(
-            filter(lambda x: (x.get(CHANNEL) is None), conditional_responses)
-        )
-        # filter default responses that match the channel
-        default_channel = list(
-            filter(lambda x: (x.get(CHANNEL) == output_channel), default_responses)
-        )
-        # filter default responses that don't match the channel
-        default_no_channel = list(
-            filter(lambda x: (x.get(CHANNEL) is None), default_responses)
-        )
-
-        if conditional_channel:
-            return conditional_channel
+        # conditional responses that match the channel and the filled slots
+        matching = self._matching_filled_slots(conditional_channel, filled_slots)
+        if matching:
+            return matching
 
+        # default responses that match the channel
         if default_channel:
-            return default_channel
+            return list(default_channel)
+
+        # conditional responses without a channel that match the filled slots
+        matching = self._matching_filled_slots(conditional_no_channel, filled_slots)
+        if matching:
+            return matching
 
-        if conditional_no_channel:
-            return conditional_no_channel
+        return list(default_no_channel)
 
-        return default_no_channel
+    @staticmethod
+    def _matching_filled_slots(
+        responses: List[Tuple[Dict[Text, Any], SlotCondition]],
+        filled_slots: Dict[Text, Any],
+    ) -> List[Dict[Text, Any]]:
+        return [response for response, matches in responses if matches(filled_slots)]
 
     def get_response_variation_id(
         self,
@@ -1,4 +1,5 @@
 import copy
+import functools
 import re
 import logging
 import structlog
@@ -7,6 +8,20 @@ from typing import Text, Dict, Union, Any, List
 logger = logging.getLogger(__name__)
 structlogger = structlog.get_logger()
 
+# matches placeholders like "{slot_name}"
+PLACEHOLDER_PATTERN = re.compile(r"{([^\n{}]+?)}")
+# number of response texts whose format strings are kept
+FORMAT_STRING_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=FORMAT_STRING_CACHE_SIZE)
+def _format_string(response: Text) -> Text:
+    """Converts the placeholders of a response text to a format string.
+
+    Response texts are the same for every message, so they are only converted once.
+    """
+    return PLACEHOLDER_PATTERN.sub(r"{0[\1]}", response)
+
 
 def interpolate_text(response: Text, values: Dict[Text, Text]) -> Text:
     """Interpolate values into responses with placeholders.
@@ -25,9 +40,12 @@ def interpolate_text(response: Text, values: Dict[Text, Text]) -> Text:
     Returns:
         The piece of text with any replacements made.
     """
+    if "{" not in response and "}" not in response:
+        # nothing to interpolate
+        return response
+
     try:
-        text = re.sub(r"{([^\n{}]+?)}", r"{0[\1]}", response)
-        text = text.format(values)
+        text = _format_string(response).format(values)
         if "0[" in text:
             # regex replaced tag but format did not replace
             # likely cause would be that tag name was enclosed
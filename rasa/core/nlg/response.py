@@ -26,6 +26,18 @@ class TemplatedNaturalLanguageGenerator(NaturalLanguageGenerator):
         """
         self.responses = responses
 
+    @property
+    def responses(self) -> Dict[Text, List[Dict[Text, Any]]]:
+        """Returns the responses which are used to generate messages."""
+        return self._response_filter.responses
+
+    @responses.setter
+    def responses(self, responses: Dict[Text, List[Dict[Text, Any]]]) -> None:
+        # the variations of all responses are grouped and their conditions are
+        # compiled up front, so that only the matching ones are checked per message
+        self._response_filter = ResponseVariationFilter(responses)
+        self._response_filter.index_responses()
+
     # noinspection PyUnusedLocal
     def _random_response_for(
         self, utter_action: Text, output_channel: Text, filled_slots: Dict[Text, Any]
@@ -38,8 +50,7 @@ class TemplatedNaturalLanguageGenerator(NaturalLanguageGenerator):
         import numpy as np
 
         if utter_action in self.responses:
-            response_filter = ResponseVariationFilter(self.responses)
-            suitable_responses = response_filter.responses_for_utter_action(
+            suitable_responses = self._response_filter.responses_for_utter_action(
                 utter_action, output_channel, filled_slots
             )
 
@@ -8,7 +8,7 @@ import logging
 import structlog
 
 from tqdm import tqdm
-from typing import Optional, Any, Dict, List, Text
+from typing import Optional, Any, Dict, Hashable, List, Text, Tuple
 from pathlib import Path
 
 import rasa.utils.io
@@ -38,6 +38,23 @@ from rasa.shared.core.constants import ACTION_LISTEN_NAME
 logger = logging.getLogger(__name__)
 structlogger = structlog.get_logger()
 
+# version of the persisted lookup, lookups without a version use string keys
+LOOKUP_FORMAT_VERSION = 1
+
+# a state feature is a sub state type, optionally followed by a key and a value
+StateFeature = Tuple[Any, ...]
+
+
+def _hashable(value: Any) -> Any:
+    """Converts lists and dictionaries, e.g. of a loaded json file, to tuples."""
+    if isinstance(value, dict):
+        return tuple(
+            sorted(((key, _hashable(item)) for key, item in value.items()), key=repr)
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    return value
+
 
 @DefaultV1Recipe.register(
     DefaultV1Recipe.ComponentType.POLICY_WITHOUT_END_TO_END_SUPPORT, is_trainable=True
@@ -88,16 +105,25 @@ class MemoizationPolicy(Policy):
         execution_context: ExecutionContext,
         featurizer: Optional[TrackerFeaturizer] = None,
         lookup: Optional[Dict] = None,
+        state_features: Optional[List[StateFeature]] = None,
     ) -> None:
         """Initialize the policy."""
         super().__init__(config, model_storage, resource, execution_context, featurizer)
         self.lookup = lookup or {}
+        # ids of the state features which the feature keys consist of
+        self._feature_ids: Dict[StateFeature, int] = {
+            feature: feature_id
+            for feature_id, feature in enumerate(state_features or [])
+        }
+        # lookups which were persisted before `LOOKUP_FORMAT_VERSION` was introduced
+        # use strings as keys
+        self._uses_string_keys = bool(lookup) and state_features is None
 
     def _create_lookup_from_states(
         self,
         trackers_as_states: List[List[State]],
         trackers_as_actions: List[List[Text]],
-    ) -> Dict[Text, Text]:
+    ) -> Dict[Any, Text]:
         """Creates lookup dictionary from the tracker represented as states.
 
         Args:
@@ -107,7 +133,7 @@ class MemoizationPolicy(Policy):
         Returns:
             lookup dictionary
         """
-        lookup: Dict[Text, Text] = {}
+        lookup: Dict[Any, Text] = {}
 
         if not trackers_as_states:
             return lookup
@@ -144,10 +170,61 @@ class MemoizationPolicy(Policy):
 
         return lookup
 
-    def _create_feature_key(self, states: List[State]) -> Optional[Text]:
+    @staticmethod
+    def _state_features(state: State) -> List[StateFeature]:
+        features: List[StateFeature] = []
+        for sub_state_type, sub_state in state.items():
+            if not isinstance(sub_state, dict):
+                features.append((sub_state_type, _hashable(sub_state)))
+            elif not sub_state:
+                features.append((sub_state_type,))
+            else:
+                features.extend(
+                    (sub_state_type, key, _hashable(value))
+                    for key, value in sub_state.items()
+                )
+        return features
+
+    def _add_state_features(self, trackers_as_states: List[List[State]]) -> None:
+        """Assigns ids to all state features which appear in the training data."""
+        for states in trackers_as_states:
+            for state in states:
+                for feature in self._state_features(state):
+                    if feature not in self._feature_ids:
+                        self._feature_ids[feature] = len(self._feature_ids)
+
+    def _create_feature_key(self, states: List[State]) -> Optional[Hashable]:
+        """Creates the key under which the action following the states is stored.
+
+        The key holds the sorted ids of the features of each state, so that the
+        same states represented as dictionaries have the same key.
+
+        Args:
+            states: The states of the conversation.
+
+        Returns:
+            The key or `None` if there are no states or a state has a feature which
+            wasn't seen during training.
+        """
         if not states:
             return None
 
+        if self._uses_string_keys:
+            return self._create_string_feature_key(states)
+
+        feature_key = []
+        for state in states:
+            feature_ids = []
+            for feature in self._state_features(state):
+                feature_id = self._feature_ids.get(feature)
+                if feature_id is None:
+                    return None
+                feature_ids.append(feature_id)
+            feature_key.append(tuple(sorted(feature_ids)))
+
+        return tuple(feature_key)
+
+    def _create_string_feature_key(self, states: List[State]) -> Text:
         # we sort keys to make sure that the same states
         # represented as dictionaries have the same json strings
         # quotes are removed for aesthetic reasons
@@ -182,6 +259,9 @@ class MemoizationPolicy(Policy):
             trackers_as_states,
             trackers_as_actions,
         ) = self.featurizer.training_states_and_labels(training_trackers, domain)
+        self._uses_string_keys = False
+        self._feature_ids = {}
+        self._add_state_features(trackers_as_states)
         self.lookup = self._create_lookup_from_states(
             trackers_as_states, trackers_as_actions
         )
@@ -269,7 +349,33 @@ class MemoizationPolicy(Policy):
         return self._prediction(result)
 
     def _metadata(self) -> Dict[Text, Any]:
-        return {"lookup": self.lookup}
+        if self._uses_string_keys:
+            return {"lookup": self.lookup}
+
+        # json has no tuples, so the keys are persisted as lists of feature ids
+        return {
+            "lookup_format_version": LOOKUP_FORMAT_VERSION,
+            "state_features": list(self._feature_ids.keys()),
+            "lookup": [
+                [feature_key, action] for feature_key, action in self.lookup.items()
+            ],
+        }
+
+    @classmethod
+    def _lookup_from_metadata(
+        cls, metadata: Dict[Text, Any]
+    ) -> Tuple[Dict, Optional[List[StateFeature]]]:
+        """Reads the lookup and its state features from the persisted metadata."""
+        if "lookup_format_version" not in metadata:
+            # lookups of older models are dictionaries with string keys
+            return metadata["lookup"], None
+
+        state_features = [_hashable(feature) for feature in metadata["state_features"]]
+        lookup = {
+            _hashable(feature_key): action
+            for feature_key, action in metadata["lookup"]
+        }
+        return lookup, state_features
 
     @classmethod
     def _metadata_filename(cls) -> Text:
@@ -299,12 +405,13 @@ class MemoizationPolicy(Policy):
         """Loads a trained policy (see parent class for full docstring)."""
         featurizer = None
         lookup = None
+        state_features = None
 
         try:
             with model_storage.read_from(resource) as path:
                 metadata_file = Path(path) / cls._metadata_filename()
                 metadata = rasa.shared.utils.io.read_json_file(metadata_file)
-                lookup = metadata["lookup"]
+                lookup, state_features = cls._lookup_from_metadata(metadata)
 
                 if (Path(path) / FEATURIZER_FILE).is_file():
                     featurizer = TrackerFeaturizer.load(path)
@@ -315,6 +422,9 @@ class MemoizationPolicy(Policy):
                 f"metadata couldn't be loaded."
             )
 
+        # the lookups of subclasses like `RulePolicy` don't use state features
+        kwargs = {} if state_features is None else {"state_features": state_features}
+
         return cls(
             config,
             model_storage,
@@ -322,6 +432,7 @@ class MemoizationPolicy(Policy):
             execution_context,
             featurizer=featurizer,
             lookup=lookup,
+            **kwargs,
         )
 
 
@@ -50,9 +50,10 @@ from rasa.shared.core.constants import (
     ACTIVE_LOOP,
     RULE_ONLY_SLOTS,
     RULE_ONLY_LOOPS,
+    USER,
 )
 from rasa.shared.core.domain import InvalidDomain, State, Domain
-from rasa.shared.nlu.constants import ACTION_NAME, INTENT_NAME_KEY
+from rasa.shared.nlu.constants import ACTION_NAME, INTENT, INTENT_NAME_KEY
 import rasa.core.test
 from rasa.core.training.training import create_action_fingerprints, ActionFingerprint
 
@@ -79,6 +80,79 @@ LOOP_RULES = "handling active loops and forms - "
 LOOP_RULES_SEPARATOR = " - "
 
 
+class _RuleIndex:
+    """Groups rule keys by the previous action and intent of their last state.
+
+    A rule can only be applicable if its last state matches the current
+    conversation state, so only the rules with a matching previous action and
+    intent (or without a condition on them) need to be checked.
+    """
+
+    def __init__(self, lookup: Dict[Text, Text]) -> None:
+        """Builds the index for the rules of a lookup.
+
+        Args:
+            lookup: Rule lookup which maps rule keys to predictions.
+        """
+        self.number_of_rules = len(lookup)
+        self.reversed_rule_states: Dict[Text, List[State]] = {}
+        # rules without any state and rules which start a conversation
+        self._unconditional_keys: Set[Text] = set()
+        self._conversation_start_keys: Set[Text] = set()
+        self._keys_by_condition: DefaultDict[
+            Tuple[Optional[Text], Optional[Text]], Set[Text]
+        ] = defaultdict(set)
+
+        for rule_key in lookup:
+            rule_states = json.loads(rule_key)
+            self.reversed_rule_states[rule_key] = list(reversed(rule_states))
+
+            if not rule_states:
+                self._unconditional_keys.add(rule_key)
+            elif not rule_states[-1].get(PREVIOUS_ACTION):
+                self._conversation_start_keys.add(rule_key)
+            else:
+                self._keys_by_condition[self._condition(rule_states[-1])].add(
+                    rule_key
+                )
+
+    @staticmethod
+    def _condition(state: State) -> Tuple[Optional[Text], Optional[Text]]:
+        def value_or_none(value: Any) -> Optional[Text]:
+            # rules which don't require a certain value match any value
+            if not isinstance(value, str) or value == SHOULD_NOT_BE_SET:
+                return None
+            return value
+
+        return (
+            value_or_none(state.get(PREVIOUS_ACTION, {}).get(ACTION_NAME)),
+            value_or_none(state.get(USER, {}).get(INTENT)),
+        )
+
+    def candidate_keys(self, conversation_state: State) -> Set[Text]:
+        """Returns the keys of rules which might apply to the conversation state.
+
+        Args:
+            conversation_state: The latest state of the conversation.
+
+        Returns:
+            A superset of the keys of the rules which are applicable.
+        """
+        if not conversation_state.get(PREVIOUS_ACTION):
+            return self._unconditional_keys | self._conversation_start_keys
+
+        action_name, intent = self._condition(conversation_state)
+        candidates = set(self._unconditional_keys)
+        for condition in {
+            (action_name, intent),
+            (action_name, None),
+            (None, intent),
+            (None, None),
+        }:
+            candidates.update(self._keys_by_condition.get(condition, ()))
+        return candidates
+
+
 class InvalidRule(RasaException):
     """Exception that can be raised when rules are not valid."""
 
@@ -164,6 +238,8 @@ class RulePolicy(MemoizationPolicy):
         self._rules_sources: DefaultDict[Text, List[Tuple[Text, Text]]] = defaultdict(
             list
         )
+        # rule indices keyed by the `id` of the lookup they were built for
+        self._rule_indices: Dict[int, Tuple[Dict[Text, Text], _RuleIndex]] = {}
 
     @classmethod
     def raise_if_incompatible_with_domain(
@@ -866,21 +942,21 @@ class RulePolicy(MemoizationPolicy):
         return json.loads(rule_key)
 
     def _is_rule_applicable(
-        self, rule_key: Text, turn_index: int, conversation_state: State
+        self,
+        reversed_rule_states: List[State],
+        turn_index: int,
+        conversation_state: State,
     ) -> bool:
         """Checks if rule is satisfied with current state at turn.
 
         Args:
-            rule_key: the textual representation of learned rule
+            reversed_rule_states: the states of the learned rule, latest state first
             turn_index: index of a current dialogue turn
             conversation_state: the state that corresponds to turn_index
 
         Returns:
             a boolean that says whether the rule is applicable to current state
         """
-        # turn_index goes back in time
-        reversed_rule_states = list(reversed(self._rule_key_to_state(rule_key)))
-
         # the rule must be applicable because we got (without any applicability issues)
         # further in the conversation history than the rule's length
         if turn_index >= len(reversed_rule_states):
@@ -910,17 +986,49 @@ class RulePolicy(MemoizationPolicy):
             reversed_rule_states[turn_index], conversation_state
         )
 
+    def _rule_index(self, lookup: Dict[Text, Text]) -> _RuleIndex:
+        indexed = self._rule_indices.get(id(lookup))
+        # rules are only removed from a lookup after it was created, so the index
+        # only needs to be rebuilt if the lookup was replaced or has grown
+        if (
+            indexed is not None
+            and indexed[0] is lookup
+            and len(lookup) <= indexed[1].number_of_rules
+        ):
+            return indexed[1]
+
+        rule_index = _RuleIndex(lookup)
+        # drop indices of lookups which were replaced
+        self._rule_indices = {
+            lookup_id: (indexed_lookup, index)
+            for lookup_id, (indexed_lookup, index) in self._rule_indices.items()
+            if any(indexed_lookup is current for current in self.lookup.values())
+        }
+        # keep a reference to the lookup, so that its `id` can't be reused
+        self._rule_indices[id(lookup)] = (lookup, rule_index)
+        return rule_index
+
     def _get_possible_keys(
         self, lookup: Dict[Text, Text], states: List[State]
     ) -> Set[Text]:
-        possible_keys = set(lookup.keys())
+        if not states:
+            return set(lookup.keys())
+
+        rule_index = self._rule_index(lookup)
+        possible_keys = {
+            key for key in rule_index.candidate_keys(states[-1]) if key in lookup
+        }
         for i, state in enumerate(reversed(states)):
             # find rule keys that correspond to current state
-            possible_keys = set(
-                filter(
-                    lambda _key: self._is_rule_applicable(_key, i, state), possible_keys
+            possible_keys = {
+                key
+                for key in possible_keys
+                if self._is_rule_applicable(
+                    rule_index.reversed_rule_states[key], i, state
                 )
-            )
+            }
+            if not possible_keys:
+                break
         return possible_keys
 
     @staticmethod
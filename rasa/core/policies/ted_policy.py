@@ -101,6 +101,7 @@ from rasa.utils.tensorflow.constants import (
     TENSORBOARD_LOG_DIR,
     TENSORBOARD_LOG_LEVEL,
     CHECKPOINT_MODEL,
+    EXPORT_PREDICT_FUNCTION,
     ENCODING_DIMENSION,
     UNIDIRECTIONAL_ENCODER,
     SEQUENCE,
@@ -315,6 +316,9 @@ class TEDPolicy(Policy):
             TENSORBOARD_LOG_LEVEL: "epoch",
             # Perform model checkpointing
             CHECKPOINT_MODEL: False,
+            # If 'True' the traced prediction graph is exported together with the
+            # model, which makes loading the model for inference a lot faster.
+            EXPORT_PREDICT_FUNCTION: False,
             # Only pick e2e prediction if the policy is confident enough
             E2E_CONFIDENCE_THRESHOLD: 0.5,
             # Specify what features to use as sequence and sentence features.
@@ -951,6 +955,13 @@ class TEDPolicy(Policy):
                 checkpoint_marker.touch()
 
             self.model.save(str(tf_model_file))
+            if self.config[EXPORT_PREDICT_FUNCTION] and self.data_example:
+                _, predict_data_example = self._construct_model_initialization_data(
+                    self.data_example
+                )
+                self.model.export_predict_function(
+                    str(tf_model_file), predict_data_example
+                )
 
             self.persist_model_utilities(model_path)
 
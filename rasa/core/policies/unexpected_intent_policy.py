@@ -84,6 +84,7 @@ from rasa.utils.tensorflow.constants import (
     TENSORBOARD_LOG_DIR,
     TENSORBOARD_LOG_LEVEL,
     CHECKPOINT_MODEL,
+    EXPORT_PREDICT_FUNCTION,
     FEATURIZERS,
     ENTITY_RECOGNITION,
     IGNORE_INTENTS_LIST,
@@ -246,6 +247,9 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
             TENSORBOARD_LOG_LEVEL: "epoch",
             # Perform model checkpointing
             CHECKPOINT_MODEL: False,
+            # If 'True' the traced prediction graph is exported together with the
+            # model, which makes loading the model for inference a lot faster.
+            EXPORT_PREDICT_FUNCTION: False,
             # Specify what features to use as sequence and sentence features.
             # By default all features in the pipeline are used.
             FEATURIZERS: [],
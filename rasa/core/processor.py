@@ -1,5 +1,7 @@
+import asyncio
 import inspect
 import copy
+import functools
 import logging
 import structlog
 import os
@@ -7,9 +9,10 @@ from pathlib import Path
 import tarfile
 import time
 from types import LambdaType
-from typing import Any, Dict, List, Optional, Text, Tuple, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Text, Tuple, Union
 
 from rasa.core.http_interpreter import RasaNLUHttpInterpreter
+from rasa.core.inference_executor import InferenceExecutor
 from rasa.engine import loader
 from rasa.engine.constants import PLACEHOLDER_MESSAGE, PLACEHOLDER_TRACKER
 from rasa.engine.runner.dask import DaskGraphRunner
@@ -62,6 +65,7 @@ from rasa.utils.common import TempDirectoryPath, get_temp_dir_name
 import rasa.core.tracker_store
 import rasa.core.actions.action
 import rasa.shared.core.trackers
+from rasa.shared.core.slots import Slot
 from rasa.shared.core.trackers import DialogueStateTracker, EventVerbosity
 from rasa.shared.core.training_data.story_reader.yaml_story_reader import (
     YAMLStoryReader,
@@ -95,6 +99,7 @@ class MessageProcessor:
         max_number_of_predictions: int = MAX_NUMBER_OF_PREDICTIONS,
         on_circuit_break: Optional[LambdaType] = None,
         http_interpreter: Optional[RasaNLUHttpInterpreter] = None,
+        inference_executor: Optional[InferenceExecutor] = None,
     ) -> None:
         """Initializes a `MessageProcessor`."""
         self.nlg = generator
@@ -103,9 +108,15 @@ class MessageProcessor:
         self.max_number_of_predictions = max_number_of_predictions
         self.on_circuit_break = on_circuit_break
         self.action_endpoint = action_endpoint
-        self.model_filename, self.model_metadata, self.graph_runner = self._load_model(
+        model_archive, self.model_metadata, self.graph_runner = self._load_model(
             model_path
         )
+        self.model_filename = os.path.basename(model_archive)
+        self.inference_executor = inference_executor or InferenceExecutor()
+        self.inference_model_archive = self.inference_executor.load_model(
+            model_archive
+        )
+        self._nlu_needs_tracker = self._nlu_target_needs_tracker(self.model_metadata)
 
         if self.model_metadata.assistant_id is None:
             rasa.shared.utils.io.raise_warning(
@@ -121,11 +132,58 @@ class MessageProcessor:
         self.domain = self.model_metadata.domain
         self.http_interpreter = http_interpreter
 
+    @staticmethod
+    def _nlu_target_needs_tracker(model_metadata: ModelMetadata) -> bool:
+        """Checks if any node which the NLU target depends on needs the tracker."""
+        nlu_schema = model_metadata.predict_schema.minimal_graph_schema(
+            [model_metadata.nlu_target]
+        )
+        return any(
+            PLACEHOLDER_TRACKER in node.needs.values()
+            for node in nlu_schema.nodes.values()
+        )
+
+    def warm_up(self, texts: List[Text]) -> None:
+        """Runs messages through the model before it handles its first request.
+
+        The first predictions of a model trace its TensorFlow functions and load
+        lazily initialized resources, which makes them a lot slower than the
+        following ones. The messages are run by the inference workers, so that
+        process workers load the model before the first request reaches them.
+        Nothing is saved to the tracker store.
+
+        Args:
+            texts: Texts of the messages which are parsed and for which the next
+                action is predicted.
+        """
+        self.inference_executor.warm_up(
+            self.graph_runner,
+            functools.partial(
+                _run_warm_up_messages,
+                texts=texts,
+                slots=self.domain.slots,
+                nlu_target=self.model_metadata.nlu_target,
+                core_target=self.model_metadata.core_target,
+                nlu_needs_tracker=self._nlu_needs_tracker,
+            ),
+            model_archive=self.inference_model_archive,
+        )
+
+        structlogger.debug(
+            "processor.warm_up.done",
+            model_id=self.model_metadata.model_id,
+            num_messages=len(texts),
+        )
+
     @staticmethod
     def _load_model(
         model_path: Union[Text, Path]
     ) -> Tuple[Text, ModelMetadata, GraphRunner]:
-        """Unpacks a model from a given path using the graph model loader."""
+        """Unpacks a model from a given path using the graph model loader.
+
+        Returns:
+            The path to the model archive, the model metadata and the graph runner.
+        """
         try:
             if os.path.isfile(model_path):
                 model_tar = model_path
@@ -146,7 +204,7 @@ class MessageProcessor:
                     LocalModelStorage,
                     DaskGraphRunner,
                 )
-                return os.path.basename(model_tar), metadata, runner
+                return model_tar, metadata, runner
             except tarfile.ReadError:
                 raise ModelNotFound(f"Model {model_path} can not be loaded.")
 
@@ -242,14 +300,14 @@ class MessageProcessor:
             The prediction for the next action. `None` if no domain or policies loaded.
         """
         tracker = await self.fetch_tracker_and_update_session(sender_id)
-        result = self.predict_next_with_tracker(tracker)
+        result = await self.predict_next_with_tracker(tracker)
 
         # save tracker state to continue conversation from this state
         await self.save_tracker(tracker)
 
         return result
 
-    def predict_next_with_tracker(
+    async def predict_next_with_tracker(
         self,
         tracker: DialogueStateTracker,
         verbosity: EventVerbosity = EventVerbosity.AFTER_RESTART,
@@ -270,7 +328,7 @@ class MessageProcessor:
             )
             return None
 
-        prediction = self._predict_next_with_tracker(tracker)
+        prediction = await self._predict_next_with_tracker(tracker)
 
         scores = [
             {"action": a, "score": p}
@@ -507,7 +565,7 @@ class MessageProcessor:
 
         return tracker
 
-    def predict_next_with_tracker_if_should(
+    async def predict_next_with_tracker_if_should(
         self, tracker: DialogueStateTracker
     ) -> Tuple[rasa.core.actions.action.Action, PolicyPrediction]:
         """Predicts the next action the bot should take after seeing x.
@@ -530,7 +588,7 @@ class MessageProcessor:
                 "The limit of actions to predict has been reached."
             )
 
-        prediction = self._predict_next_with_tracker(tracker)
+        prediction = await self._predict_next_with_tracker(tracker)
 
         action = rasa.core.actions.action.action_for_index(
             prediction.max_confidence_index, self.domain, self.action_endpoint
@@ -725,7 +783,7 @@ class MessageProcessor:
             )
             # Intent is not explicitly present. Pass message to graph.
             if msg.data.get(INTENT) is None:
-                parse_data = self._parse_message_with_graph(
+                parse_data = await self._parse_message_with_graph(
                     message, tracker, only_output_properties
                 )
             else:
@@ -749,7 +807,7 @@ class MessageProcessor:
 
         return parse_data
 
-    def _parse_message_with_graph(
+    async def _parse_message_with_graph(
         self,
         message: UserMessage,
         tracker: Optional[DialogueStateTracker] = None,
@@ -766,12 +824,22 @@ class MessageProcessor:
         Returns:
             Parsed data extracted from the message.
         """
-        results = self.graph_runner.run(
-            inputs={PLACEHOLDER_MESSAGE: [message], PLACEHOLDER_TRACKER: tracker},
-            targets=[self.model_metadata.nlu_target],
-        )
-        parsed_messages = results[self.model_metadata.nlu_target]
-        parsed_message = parsed_messages[0]
+        if self._nlu_needs_tracker:
+            results = await self.inference_executor.run(
+                self.graph_runner,
+                inputs={PLACEHOLDER_MESSAGE: [message], PLACEHOLDER_TRACKER: tracker},
+                targets=[self.model_metadata.nlu_target],
+                model_archive=self.inference_model_archive,
+            )
+            parsed_message = results[self.model_metadata.nlu_target][0]
+        else:
+            # messages of different conversations can be parsed in one batch
+            parsed_message = await self.inference_executor.parse_message(
+                self.graph_runner,
+                message,
+                self.model_metadata.nlu_target,
+                model_archive=self.inference_model_archive,
+            )
         parse_data = {
             TEXT: "",
             INTENT: {INTENT_NAME_KEY: None, PREDICTED_CONFIDENCE_KEY: 0.0},
@@ -853,32 +921,51 @@ class MessageProcessor:
     ) -> None:
         # keep taking actions decided by the policy until it chooses to 'listen'
         should_predict_another_action = True
+        # the bot messages of an action are sent while the next action is predicted
+        side_effects = _SideEffectsPipeline()
 
-        # action loop. predicts actions until we hit action listen
-        while should_predict_another_action and self._should_handle_message(tracker):
-            # this actually just calls the policy's method by the same name
-            try:
-                action, prediction = self.predict_next_with_tracker_if_should(tracker)
-            except ActionLimitReached:
-                logger.warning(
-                    "Circuit breaker tripped. Stopped predicting "
-                    f"more actions for sender '{tracker.sender_id}'."
-                )
-                if self.on_circuit_break:
-                    # call a registered callback
-                    self.on_circuit_break(tracker, output_channel, self.nlg)
-                break
+        try:
+            # action loop. predicts actions until we hit action listen
+            while should_predict_another_action and self._should_handle_message(
+                tracker
+            ):
+                # this actually just calls the policy's method by the same name
+                try:
+                    action, prediction = await self.predict_next_with_tracker_if_should(
+                        tracker
+                    )
+                except ActionLimitReached:
+                    logger.warning(
+                        "Circuit breaker tripped. Stopped predicting "
+                        f"more actions for sender '{tracker.sender_id}'."
+                    )
+                    if self.on_circuit_break:
+                        await side_effects.wait()
+                        # call a registered callback
+                        self.on_circuit_break(tracker, output_channel, self.nlg)
+                    break
 
-            if prediction.is_end_to_end_prediction:
-                logger.debug(
-                    f"An end-to-end prediction was made which has triggered the 2nd "
-                    f"execution of the default action '{ACTION_EXTRACT_SLOTS}'."
+                if prediction.is_end_to_end_prediction:
+                    logger.debug(
+                        f"An end-to-end prediction was made which has triggered the "
+                        f"2nd execution of the default action "
+                        f"'{ACTION_EXTRACT_SLOTS}'."
+                    )
+                    await side_effects.wait()
+                    tracker = await self.run_action_extract_slots(
+                        output_channel, tracker
+                    )
+
+                should_predict_another_action = await self._run_action(
+                    action,
+                    tracker,
+                    output_channel,
+                    self.nlg,
+                    prediction,
+                    side_effects=side_effects,
                 )
-                tracker = await self.run_action_extract_slots(output_channel, tracker)
-
-            should_predict_another_action = await self._run_action(
-                action, tracker, output_channel, self.nlg, prediction
-            )
+        finally:
+            await side_effects.wait()
 
     @staticmethod
     def should_predict_another_action(action_name: Text) -> bool:
@@ -901,8 +988,21 @@ class MessageProcessor:
     ) -> None:
         """Send bot messages, schedule and cancel reminders that are logged
         in the events array.
+
+        The bot messages are sent in order, while the reminders are scheduled and
+        cancelled at the same time.
         """
-        await self._send_bot_messages(events, tracker, output_channel)
+        await asyncio.gather(
+            self._send_bot_messages(events, tracker, output_channel),
+            self._update_reminders(events, tracker, output_channel),
+        )
+
+    async def _update_reminders(
+        self,
+        events: List[Event],
+        tracker: DialogueStateTracker,
+        output_channel: OutputChannel,
+    ) -> None:
         await self._schedule_reminders(events, tracker, output_channel)
         await self._cancel_reminders(events, tracker)
 
@@ -966,6 +1066,7 @@ class MessageProcessor:
         output_channel: OutputChannel,
         nlg: NaturalLanguageGenerator,
         prediction: PolicyPrediction,
+        side_effects: Optional["_SideEffectsPipeline"] = None,
     ) -> bool:
         # events and return values are used to update
         # the tracker state after an action has been taken
@@ -1013,6 +1114,8 @@ class MessageProcessor:
                 f"action '{action.name()}'. This will run the default action "
                 f"'{ACTION_EXTRACT_SLOTS}'."
             )
+            if side_effects:
+                await side_effects.wait()
             tracker = await self.run_action_extract_slots(output_channel, tracker)
 
         if action.name() != ACTION_LISTEN_NAME and not action.name().startswith(
@@ -1020,7 +1123,12 @@ class MessageProcessor:
         ):
             self._log_slots(tracker)
 
-        await self.execute_side_effects(events, tracker, output_channel)
+        if side_effects:
+            side_effects.schedule(
+                lambda: self.execute_side_effects(events, tracker, output_channel)
+            )
+        else:
+            await self.execute_side_effects(events, tracker, output_channel)
 
         return self.should_predict_another_action(action.name())
 
@@ -1100,7 +1208,7 @@ class MessageProcessor:
         """
         await self.tracker_store.save(tracker)
 
-    def _predict_next_with_tracker(
+    async def _predict_next_with_tracker(
         self, tracker: DialogueStateTracker
     ) -> PolicyPrediction:
         """Collect predictions from ensemble and return action and predictions."""
@@ -1123,8 +1231,89 @@ class MessageProcessor:
         if not target:
             raise ValueError("Cannot predict next action if there is no core target.")
 
-        results = self.graph_runner.run(
-            inputs={PLACEHOLDER_TRACKER: tracker}, targets=[target]
+        results = await self.inference_executor.run(
+            self.graph_runner,
+            inputs={PLACEHOLDER_TRACKER: tracker},
+            targets=[target],
+            model_archive=self.inference_model_archive,
         )
         policy_prediction = results[target]
         return policy_prediction
+
+
+class _SideEffectsPipeline:
+    """Executes the side effects of actions in the background, one after another.
+
+    This allows to predict the next action while the bot messages of the previous
+    action are still being sent, without changing the order of the messages.
+    """
+
+    def __init__(self) -> None:
+        self._latest: Optional[asyncio.Future] = None
+
+    def schedule(self, side_effects: Callable[[], Awaitable[None]]) -> None:
+        """Executes side effects once the previously scheduled ones are done.
+
+        Args:
+            side_effects: Function which executes the side effects.
+        """
+        previous = self._latest
+
+        async def execute() -> None:
+            if previous is not None:
+                # stops if the previous side effects failed
+                await previous
+            await side_effects()
+
+        self._latest = asyncio.ensure_future(execute())
+
+    async def wait(self) -> None:
+        """Waits until all scheduled side effects were executed.
+
+        Raises:
+            Exception: The error of side effects which failed.
+        """
+        latest, self._latest = self._latest, None
+        if latest is not None:
+            await latest
+
+
+def _run_warm_up_messages(
+    run_graph: Callable[..., Dict[Text, Any]],
+    texts: List[Text],
+    slots: List[Slot],
+    nlu_target: Text,
+    core_target: Optional[Text],
+    nlu_needs_tracker: bool,
+) -> None:
+    """Parses messages and predicts the next action for them with a model's graph.
+
+    Args:
+        run_graph: Runs the graph of the model, see `GraphRunner.run`.
+        texts: Texts of the messages.
+        slots: Slots of the model's domain.
+        nlu_target: The NLU target node of the graph.
+        core_target: The Core target node of the graph, if the model has one.
+        nlu_needs_tracker: Whether the NLU part of the graph needs the tracker.
+    """
+    for text in texts:
+        tracker = DialogueStateTracker.from_events(
+            DEFAULT_SENDER_ID, [ActionExecuted(ACTION_LISTEN_NAME)], slots=slots
+        )
+        results = run_graph(
+            inputs={
+                PLACEHOLDER_MESSAGE: [UserMessage(text)],
+                PLACEHOLDER_TRACKER: tracker if nlu_needs_tracker else None,
+            },
+            targets=[nlu_target],
+        )
+        parsed_message = results[nlu_target][0]
+        if not core_target:
+            continue
+
+        tracker.update(
+            UserUttered(
+                text, parsed_message.get(INTENT), parsed_message.get(ENTITIES, [])
+            )
+        )
+        run_graph(inputs={PLACEHOLDER_TRACKER: tracker}, targets=[core_target])
@@ -19,6 +19,7 @@ from rasa.core.agent import Agent
 from rasa.core.channels import console
 from rasa.core.channels.channel import InputChannel
 from rasa.core.utils import AvailableEndpoints
+from rasa.core.inference_executor import InferenceExecutor
 import rasa.shared.utils.io
 from sanic import Sanic
 from asyncio import AbstractEventLoop
@@ -179,6 +180,11 @@ def serve_application(
     syslog_port: Optional[int] = None,
     syslog_protocol: Optional[Text] = None,
     request_timeout: Optional[int] = None,
+    inference_executor: Text = constants.DEFAULT_INFERENCE_EXECUTOR,
+    inference_workers: int = constants.DEFAULT_INFERENCE_WORKERS,
+    inference_queue_size: int = constants.DEFAULT_INFERENCE_QUEUE_SIZE,
+    nlu_batch_window: float = constants.DEFAULT_NLU_BATCH_WINDOW,
+    nlu_batch_size: int = constants.DEFAULT_NLU_BATCH_SIZE,
 ) -> None:
     """Run the API entrypoint."""
     if not channel and not credentials:
@@ -214,7 +220,19 @@ def serve_application(
     logger.info(f"Starting Rasa server on {protocol}://{interface}:{port}")
 
     app.register_listener(
-        partial(load_agent_on_start, model_path, endpoints, remote_storage),
+        partial(
+            load_agent_on_start,
+            model_path,
+            endpoints,
+            remote_storage,
+            inference_executor=InferenceExecutor(
+                inference_executor,
+                inference_workers,
+                inference_queue_size,
+                nlu_batch_window,
+                nlu_batch_size,
+            ),
+        ),
         "before_server_start",
     )
     app.register_listener(create_connection_pools, "after_server_start")
@@ -248,6 +266,7 @@ async def load_agent_on_start(
     remote_storage: Optional[Text],
     app: Sanic,
     loop: AbstractEventLoop,
+    inference_executor: Optional[InferenceExecutor] = None,
 ) -> Agent:
     """Load an agent.
 
@@ -259,6 +278,7 @@ async def load_agent_on_start(
         remote_storage=remote_storage,
         endpoints=endpoints,
         loop=loop,
+        inference_executor=inference_executor,
     )
     logger.info("Rasa server is up and running.")
     return app.ctx.agent
@@ -280,6 +300,8 @@ async def close_resources(app: Sanic, _: AbstractEventLoop) -> None:
     if event_broker:
         await event_broker.close()
 
+    await current_agent.lock_store.close()
+
     action_endpoint = current_agent.action_endpoint
     if action_endpoint:
         await action_endpoint.session.close()
@@ -288,6 +310,8 @@ async def close_resources(app: Sanic, _: AbstractEventLoop) -> None:
     if model_server:
         await model_server.session.close()
 
+    current_agent.inference_executor.close()
+
 
 async def create_connection_pools(app: Sanic, _: AbstractEventLoop) -> None:
     """Create connection pools for the agent's action server and model server."""
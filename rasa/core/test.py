@@ -664,7 +664,9 @@ async def _run_action_prediction(
     partial_tracker: DialogueStateTracker,
     expected_action: Text,
 ) -> Tuple[Text, PolicyPrediction, Optional[EntityEvaluationResult]]:
-    action, prediction = processor.predict_next_with_tracker_if_should(partial_tracker)
+    action, prediction = await processor.predict_next_with_tracker_if_should(
+        partial_tracker
+    )
     predicted_action = _get_predicted_action_name(
         action, partial_tracker, expected_action
     )
@@ -683,7 +685,7 @@ async def _run_action_prediction(
         # but it might be Ok if form action is rejected.
         emulate_loop_rejection(partial_tracker)
         # try again
-        action, prediction = processor.predict_next_with_tracker_if_should(
+        action, prediction = await processor.predict_next_with_tracker_if_should(
             partial_tracker
         )
         # Even if the prediction is also wrong, we don't have to undo the emulation
@@ -1,9 +1,13 @@
 from __future__ import annotations
 import contextlib
+import copy
 import itertools
 import json
 import logging
 import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from inspect import isawaitable, iscoroutinefunction
 
 from time import sleep
@@ -21,18 +25,21 @@ from typing import (
     Generator,
     TypeVar,
     Generic,
+    Tuple,
 )
 
 from boto3.dynamodb.conditions import Key
 from pymongo.collection import Collection
 
 import rasa.core.utils as core_utils
+import rasa.utils.common as common_utils
 import rasa.shared.utils.cli
 import rasa.shared.utils.common
 import rasa.shared.utils.io
 from rasa.plugin import plugin_manager
-from rasa.shared.core.constants import ACTION_LISTEN_NAME
+from rasa.shared.core.constants import ACTION_LISTEN_NAME, ACTION_SESSION_START_NAME
 from rasa.core.brokers.broker import EventBroker
+from rasa.core.codecs import JSON_CODEC, CodecDecodingException, create_codec
 from rasa.core.constants import (
     POSTGRESQL_SCHEMA,
     POSTGRESQL_MAX_OVERFLOW,
@@ -55,6 +62,7 @@ from sqlalchemy.ext.declarative import declarative_base, DeclarativeMeta
 
 if TYPE_CHECKING:
     import boto3.resources.factory.dynamodb.Table
+    import redis.asyncio.client
     from sqlalchemy.engine.url import URL
     from sqlalchemy.engine.base import Engine
     from sqlalchemy.orm import Session, Query
@@ -66,8 +74,23 @@ logger = logging.getLogger(__name__)
 POSTGRESQL_DEFAULT_MAX_OVERFLOW = 100
 POSTGRESQL_DEFAULT_POOL_SIZE = 50
 
+# default value of the Mongo connection pool size
+MONGO_DEFAULT_MAX_POOL_SIZE = 100
+# fields of the Mongo conversation documents which index the stored events
+MONGO_EVENT_COUNT_KEY = "event_count"
+MONGO_SESSION_START_KEY = "session_start"
+
 # default value for key prefix in RedisTrackerStore
 DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX = "tracker:"
+# default value for the key prefix of the conversation metadata in RedisTrackerStore
+DEFAULT_REDIS_TRACKER_STORE_METADATA_KEY_PREFIX = "tracker_metadata:"
+REDIS_SESSION_START_KEY = "session_start"
+REDIS_LAST_EVENT_TIMESTAMP_KEY = "last_event_timestamp"
+
+# endpoint configuration key of the in-process tracker cache
+TRACKER_STORE_CACHE_KEY = "cache"
+DEFAULT_TRACKER_CACHE_MAX_SIZE = 1000
+DEFAULT_TRACKER_CACHE_TTL_IN_SECONDS = 300.0
 
 
 def check_if_tracker_store_async(tracker_store: TrackerStore) -> bool:
@@ -135,6 +158,7 @@ class TrackerStore:
         self,
         domain: Optional[Domain],
         event_broker: Optional[EventBroker] = None,
+        codec: Text = JSON_CODEC,
         **kwargs: Dict[Text, Any],
     ) -> None:
         """Create a TrackerStore.
@@ -143,10 +167,14 @@ class TrackerStore:
             domain: The `Domain` to initialize the `DialogueStateTracker`.
             event_broker: An event broker to publish any new events to another
                 destination.
+            codec: Name of the codec which encodes stored trackers and events, see
+                `rasa.core.codecs.create_codec`. Stored data can be read with any
+                of the built-in codecs.
             kwargs: Additional kwargs.
         """
         self._domain = domain or Domain.empty()
         self.event_broker = event_broker
+        self.codec = create_codec(codec)
         self.max_event_history: Optional[int] = None
 
     @staticmethod
@@ -290,6 +318,22 @@ class TrackerStore:
         """
         return await self.retrieve(conversation_id)
 
+    async def stored_event_count(self, sender_id: Text) -> Optional[int]:
+        """Returns the number of stored events of a conversation across all sessions.
+
+        The count is used to check whether a cached tracker is still up to date, so
+        it has to change whenever events are stored. This method may be overridden
+        by tracker stores which can look up the count without retrieving the
+        tracker.
+
+        Args:
+            sender_id: Conversation ID.
+
+        Returns:
+            The number of stored events, or `None` if it is unknown.
+        """
+        return None
+
     async def get_or_create_full_tracker(
         self,
         sender_id: Text,
@@ -347,8 +391,8 @@ class TrackerStore:
         tracker = self.init_tracker(sender_id)
 
         try:
-            dialogue = Dialogue.from_parameters(json.loads(serialised_tracker))
-        except UnicodeDecodeError as e:
+            dialogue = Dialogue.from_parameters(self.codec.decode(serialised_tracker))
+        except CodecDecodingException as e:
             raise TrackerDeserialisationException(
                 "Tracker cannot be deserialised. "
                 "Trackers must be serialised as json. "
@@ -359,6 +403,17 @@ class TrackerStore:
 
         return tracker
 
+    def _decode_events(
+        self, sender_id: Text, serialised_events: Iterable[Union[Text, bytes]]
+    ) -> List[Dict[Text, Any]]:
+        """Decodes the stored events of a conversation."""
+        try:
+            return [self.codec.decode(event) for event in serialised_events]
+        except CodecDecodingException as e:
+            raise TrackerDeserialisationException(
+                f"Events of conversation '{sender_id}' cannot be deserialised."
+            ) from e
+
     @property
     def domain(self) -> Domain:
         """Returns the domain of the tracker store."""
@@ -385,8 +440,9 @@ class InMemoryTrackerStore(TrackerStore, SerializedTrackerAsText):
     async def save(self, tracker: DialogueStateTracker) -> None:
         """Updates and saves the current conversation state."""
         await self.stream_events(tracker)
-        serialised = InMemoryTrackerStore.serialise_tracker(tracker)
-        self.store[tracker.sender_id] = serialised
+        self.store[tracker.sender_id] = self.codec.encode(
+            tracker.as_dialogue().as_dict()
+        )
 
     async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Returns tracker matching sender_id."""
@@ -441,8 +497,21 @@ class InMemoryTrackerStore(TrackerStore, SerializedTrackerAsText):
         return multiple_tracker_sessions[-1]
 
 
+def _decode_redis_response(response: Union[Text, bytes]) -> Text:
+    # the store's own client sets `decode_responses`, but clients which are
+    # assigned to `red` afterwards (e.g. in tests) may return `bytes`
+    return response.decode() if isinstance(response, bytes) else response
+
+
 class RedisTrackerStore(TrackerStore, SerializedTrackerAsText):
-    """Stores conversation history in Redis."""
+    """Stores conversation history in Redis.
+
+    The events of a conversation are stored in a Redis list to which new events are
+    appended. A Redis hash per conversation keeps the index of the latest
+    conversation session and the timestamp of the latest stored event, so that
+    saving a tracker only writes its new events and retrieving a tracker only reads
+    the events of the latest conversation session.
+    """
 
     def __init__(
         self,
@@ -459,12 +528,18 @@ class RedisTrackerStore(TrackerStore, SerializedTrackerAsText):
         ssl_keyfile: Optional[Text] = None,
         ssl_certfile: Optional[Text] = None,
         ssl_ca_certs: Optional[Text] = None,
+        max_connections: Optional[int] = None,
         **kwargs: Dict[Text, Any],
     ) -> None:
-        """Initializes the tracker store."""
-        import redis
+        """Initializes the tracker store.
 
-        self.red = redis.StrictRedis(
+        The store uses the asyncio Redis client, so that requests to Redis don't
+        block the event loop. `max_connections` limits the size of its connection
+        pool (unlimited by default).
+        """
+        import redis.asyncio
+
+        self.red = redis.asyncio.Redis(
             host=host,
             port=port,
             db=db,
@@ -475,6 +550,7 @@ class RedisTrackerStore(TrackerStore, SerializedTrackerAsText):
             ssl_certfile=ssl_certfile,
             ssl_ca_certs=ssl_ca_certs,
             decode_responses=True,
+            max_connections=max_connections,
         )
         self.record_exp = record_exp
 
@@ -497,26 +573,228 @@ class RedisTrackerStore(TrackerStore, SerializedTrackerAsText):
     def _get_key_prefix(self) -> Text:
         return self.key_prefix
 
+    def _get_metadata_key_prefix(self) -> Text:
+        # the metadata keys must not match the `keys()` pattern of the event keys
+        custom_prefix = self.key_prefix[: -len(DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX)]
+        return custom_prefix + DEFAULT_REDIS_TRACKER_STORE_METADATA_KEY_PREFIX
+
     async def save(
         self, tracker: DialogueStateTracker, timeout: Optional[float] = None
     ) -> None:
-        """Saves the current conversation state."""
-        await self.stream_events(tracker)
+        """Saves the current conversation state.
+
+        Only events which are not stored yet are appended to the stored events. The
+        stored conversation is watched while the new events are determined, so that
+        they are only appended if no other client saved the conversation in the
+        meantime. Otherwise the new events are determined again.
+        """
+        import redis.exceptions
 
         if not timeout and self.record_exp:
             timeout = self.record_exp
 
-        stored = self.red.get(self.key_prefix + tracker.sender_id)
+        sender_id = tracker.sender_id
+        async with self.red.pipeline() as pipe:
+            while True:
+                try:
+                    await pipe.watch(
+                        self.key_prefix + sender_id,
+                        self._get_metadata_key_prefix() + sender_id,
+                    )
+                    new_events = await self._queue_new_events(pipe, tracker, timeout)
+                    await pipe.execute()
+                    break
+                except redis.exceptions.WatchError:
+                    logger.debug(
+                        f"Conversation '{sender_id}' was modified while it was "
+                        f"saved. Retrying."
+                    )
+
+        # events are only published once they were stored successfully
+        if self.event_broker is not None:
+            await self._stream_new_events(self.event_broker, new_events, sender_id)
+
+    async def _queue_new_events(
+        self,
+        pipe: "redis.asyncio.client.Pipeline",
+        tracker: DialogueStateTracker,
+        timeout: Optional[float],
+    ) -> List[Event]:
+        """Determines the new events of a tracker and queues storing them.
+
+        Args:
+            pipe: Pipeline which watches the stored conversation.
+            tracker: The tracker which is saved.
+            timeout: Expiration of the stored conversation in seconds.
+
+        Returns:
+            The events which are new to the latest stored conversation session.
+        """
+        (
+            key_type,
+            number_of_stored_events,
+            session_start,
+            last_event_timestamp,
+        ) = await self._stored_metadata(tracker.sender_id)
+
+        new_events = None
+        if key_type == "none":
+            new_events = list(tracker.events)
+        elif key_type == "list":
+            new_events = self._new_events(
+                tracker, number_of_stored_events, session_start, last_event_timestamp
+            )
+
+        if new_events is not None:
+            pipe.multi()
+            self._queue_events(
+                pipe,
+                tracker.sender_id,
+                new_events,
+                number_of_stored_events,
+                session_start,
+                timeout,
+            )
+            return new_events
 
-        if stored is not None:
-            prior_tracker = self.deserialise_tracker(tracker.sender_id, stored)
+        # The tracker doesn't continue the stored events or the conversation was
+        # stored as a single serialised tracker by a previous Rasa version.
+        old_tracker = await self.retrieve(tracker.sender_id)
+        new_events = TrackerEventDiffEngine.event_difference(old_tracker, tracker)
 
+        prior_tracker = await self._retrieve(tracker.sender_id, fetch_all_sessions=True)
+        if prior_tracker is not None:
             tracker = self._merge_trackers(prior_tracker, tracker)
 
-        serialised_tracker = self.serialise_tracker(tracker)
-        self.red.set(
-            self.key_prefix + tracker.sender_id, serialised_tracker, ex=timeout
+        pipe.multi()
+        self._queue_events(
+            pipe, tracker.sender_id, list(tracker.events), 0, 0, timeout, replace=True
         )
+        return new_events
+
+    async def _stored_metadata(
+        self, sender_id: Text
+    ) -> Tuple[Text, int, int, Optional[float]]:
+        """Fetches what is needed to determine which events of a tracker are new.
+
+        Args:
+            sender_id: Conversation ID of the tracker.
+
+        Returns:
+            The Redis type of the events key, the number of stored events, the index
+            of the latest session start and the timestamp of the latest stored event.
+        """
+        async with self.red.pipeline(transaction=False) as pipe:
+            pipe.type(self.key_prefix + sender_id)
+            pipe.llen(self.key_prefix + sender_id)
+            pipe.hmget(
+                self._get_metadata_key_prefix() + sender_id,
+                REDIS_SESSION_START_KEY,
+                REDIS_LAST_EVENT_TIMESTAMP_KEY,
+            )
+            # `LLEN` fails for conversations stored in the legacy format
+            key_type, number_of_events, metadata = await pipe.execute(
+                raise_on_error=False
+            )
+
+        key_type = _decode_redis_response(key_type)
+        if key_type != "list":
+            return key_type, 0, 0, None
+
+        session_start, last_event_timestamp = metadata
+        return (
+            key_type,
+            number_of_events,
+            int(session_start or 0),
+            float(last_event_timestamp) if last_event_timestamp else None,
+        )
+
+    @staticmethod
+    def _new_events(
+        tracker: DialogueStateTracker,
+        number_of_stored_events: int,
+        session_start: int,
+        last_event_timestamp: Optional[float],
+    ) -> Optional[List[Event]]:
+        """Returns the events of `tracker` which are not stored yet.
+
+        Args:
+            tracker: The tracker which is saved.
+            number_of_stored_events: Number of events stored for the conversation.
+            session_start: Index of the latest session start in the stored events.
+            last_event_timestamp: Timestamp of the latest stored event.
+
+        Returns:
+            The new events or `None` if the tracker events don't continue the
+            stored events.
+        """
+        events = list(tracker.events)
+        if not number_of_stored_events:
+            return events
+
+        # the tracker contains either the latest session or all sessions
+        for number_of_known_events in (
+            number_of_stored_events - session_start,
+            number_of_stored_events,
+        ):
+            if (
+                0 < number_of_known_events <= len(events)
+                and events[number_of_known_events - 1].timestamp == last_event_timestamp
+            ):
+                return events[number_of_known_events:]
+
+        return None
+
+    def _queue_events(
+        self,
+        pipe: "redis.asyncio.client.Pipeline",
+        sender_id: Text,
+        new_events: List[Event],
+        number_of_stored_events: int,
+        session_start: int,
+        timeout: Optional[float],
+        replace: bool = False,
+    ) -> None:
+        """Queues appending events to the stored events.
+
+        Args:
+            pipe: Pipeline in transaction mode to which the commands are added.
+            sender_id: Conversation ID of the events.
+            new_events: The events to append.
+            number_of_stored_events: Number of events stored for the conversation.
+            session_start: Index of the latest session start in the stored events.
+            timeout: Expiration of the stored conversation in seconds.
+            replace: If `True` the stored events are replaced with `new_events`.
+        """
+        events_key = self.key_prefix + sender_id
+        metadata_key = self._get_metadata_key_prefix() + sender_id
+
+        for index, event in enumerate(new_events, start=number_of_stored_events):
+            if (
+                isinstance(event, ActionExecuted)
+                and event.action_name == ACTION_SESSION_START_NAME
+            ):
+                session_start = index
+
+        if replace:
+            pipe.delete(events_key, metadata_key)
+
+        if new_events:
+            pipe.rpush(
+                events_key,
+                *[self.codec.encode(event.as_dict()) for event in new_events],
+            )
+            pipe.hset(
+                metadata_key,
+                mapping={
+                    REDIS_SESSION_START_KEY: session_start,
+                    REDIS_LAST_EVENT_TIMESTAMP_KEY: repr(new_events[-1].timestamp),
+                },
+            )
+
+        if timeout:
+            pipe.expire(events_key, int(timeout))
+            pipe.expire(metadata_key, int(timeout))
 
     async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Retrieves tracker for the latest conversation session.
@@ -555,7 +833,60 @@ class RedisTrackerStore(TrackerStore, SerializedTrackerAsText):
             sender_id: Conversation ID to fetch the tracker for.
             fetch_all_sessions: Whether to fetch all sessions or only the last one.
         """
-        stored = self.red.get(self.key_prefix + sender_id)
+        async with self.red.pipeline(transaction=False) as pipe:
+            pipe.type(self.key_prefix + sender_id)
+            pipe.hget(
+                self._get_metadata_key_prefix() + sender_id, REDIS_SESSION_START_KEY
+            )
+            key_type, session_start = await pipe.execute()
+
+        key_type = _decode_redis_response(key_type)
+        if key_type == "none":
+            logger.debug(f"Could not find tracker for conversation ID '{sender_id}'.")
+            return None
+
+        if key_type == "string":
+            return await self._retrieve_serialised_tracker(
+                sender_id, fetch_all_sessions
+            )
+
+        start = 0 if fetch_all_sessions else int(session_start or 0)
+        serialised_events = await self.red.lrange(
+            self.key_prefix + sender_id, start, -1
+        )
+
+        tracker = self.init_tracker(sender_id)
+        tracker.recreate_from_dialogue(
+            Dialogue.from_parameters(
+                {
+                    "name": sender_id,
+                    "events": self._decode_events(sender_id, serialised_events),
+                }
+            )
+        )
+        return tracker
+
+    async def stored_event_count(self, sender_id: Text) -> Optional[int]:
+        """Returns the number of stored events of a conversation."""
+        import redis.exceptions
+
+        try:
+            return await self.red.llen(self.key_prefix + sender_id)
+        except redis.exceptions.ResponseError:
+            # conversations stored as a single serialised tracker by a previous Rasa
+            # version don't have a list of events
+            return None
+
+    async def _retrieve_serialised_tracker(
+        self, sender_id: Text, fetch_all_sessions: bool
+    ) -> Optional[DialogueStateTracker]:
+        """Returns a tracker which was stored as a single serialised tracker.
+
+        Args:
+            sender_id: Conversation ID to fetch the tracker for.
+            fetch_all_sessions: Whether to fetch all sessions or only the last one.
+        """
+        stored = await self.red.get(self.key_prefix + sender_id)
         if stored is None:
             logger.debug(f"Could not find tracker for conversation ID '{sender_id}'.")
             return None
@@ -576,7 +907,7 @@ class RedisTrackerStore(TrackerStore, SerializedTrackerAsText):
 
     async def keys(self) -> Iterable[Text]:
         """Returns keys of the Redis Tracker Store."""
-        return self.red.keys(self.key_prefix + "*")
+        return await self.red.keys(self.key_prefix + "*")
 
     @staticmethod
     def _merge_trackers(
@@ -762,10 +1093,16 @@ class DynamoTrackerStore(TrackerStore, SerializedTrackerAsDict):
 class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
     """Stores conversation history in Mongo.
 
+    Requests to Mongo are run in a thread pool so that they don't block the event
+    loop.
+
     Property methods:
         conversations: returns the current conversation
     """
 
+    # requests are run directly if no thread pool was created
+    _executor: Optional[ThreadPoolExecutor] = None
+
     def __init__(
         self,
         domain: Domain,
@@ -776,6 +1113,7 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
         auth_source: Optional[Text] = "admin",
         collection: Text = "conversations",
         event_broker: Optional[EventBroker] = None,
+        max_pool_size: int = MONGO_DEFAULT_MAX_POOL_SIZE,
         **kwargs: Dict[Text, Any],
     ) -> None:
         from pymongo.database import Database
@@ -786,12 +1124,16 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
             username=username,
             password=password,
             authSource=auth_source,
+            maxPoolSize=max_pool_size,
             # delay connect until process forking is done
             connect=False,
         )
 
         self.db = Database(self.client, db)
         self.collection = collection
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_pool_size, thread_name_prefix="mongo_tracker_store"
+        )
         super().__init__(domain, event_broker, **kwargs)
 
         self._ensure_indices()
@@ -817,13 +1159,42 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
     async def save(self, tracker: DialogueStateTracker) -> None:
         """Saves the current conversation state."""
         await self.stream_events(tracker)
+        await common_utils.run_in_thread_pool(self._executor, self._save, tracker)
 
-        additional_events = self._additional_events(tracker)
+    def _save(self, tracker: DialogueStateTracker) -> None:
+        """Appends the new events of the tracker to the stored conversation.
+
+        Only the event count and the index of the latest session start are read
+        from the stored conversation, so that the costs of a save don't grow with
+        the length of the conversation.
+
+        Args:
+            tracker: The tracker to save.
+        """
+        number_of_stored_events, session_start = self._stored_event_counts(
+            tracker.sender_id
+        )
+        additional_events = list(
+            self._events_after_stored_events(
+                tracker, number_of_stored_events, session_start
+            )
+        )
+
+        for index, event in enumerate(
+            additional_events, start=number_of_stored_events
+        ):
+            if isinstance(event, SessionStarted):
+                session_start = index
 
         self.conversations.update_one(
             {"sender_id": tracker.sender_id},
             {
-                "$set": self._current_tracker_state_without_events(tracker),
+                "$set": {
+                    **self._current_tracker_state_without_events(tracker),
+                    MONGO_EVENT_COUNT_KEY: number_of_stored_events
+                    + len(additional_events),
+                    MONGO_SESSION_START_KEY: session_start,
+                },
                 "$push": {
                     "events": {"$each": [e.as_dict() for e in additional_events]}
                 },
@@ -841,17 +1212,55 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
             List of serialised events that aren't currently stored.
 
         """
-        stored = self.conversations.find_one({"sender_id": tracker.sender_id}) or {}
-        all_events = self._events_from_serialized_tracker(stored)
-
-        number_events_since_last_session = len(
-            self._events_since_last_session_start(all_events)
+        return self._events_after_stored_events(
+            tracker, *self._stored_event_counts(tracker.sender_id)
         )
 
+    @staticmethod
+    def _events_after_stored_events(
+        tracker: DialogueStateTracker, number_of_stored_events: int, session_start: int
+    ) -> Iterator:
+        # the tracker contains the events since the latest stored session start
         return itertools.islice(
-            tracker.events, number_events_since_last_session, len(tracker.events)
+            tracker.events,
+            number_of_stored_events - session_start,
+            len(tracker.events),
         )
 
+    def _stored_event_counts(self, sender_id: Text) -> Tuple[int, int]:
+        """Returns the number of stored events and the index of the latest session.
+
+        Args:
+            sender_id: Conversation ID of the events.
+
+        Returns:
+            Number of stored events and the index of the latest `SessionStarted`
+            event in the stored events (`0` if there is none).
+        """
+        stored = self.conversations.find_one(
+            {"sender_id": sender_id},
+            {MONGO_EVENT_COUNT_KEY: True, MONGO_SESSION_START_KEY: True},
+        )
+        if not stored:
+            return 0, 0
+
+        if MONGO_EVENT_COUNT_KEY in stored:
+            return (
+                stored[MONGO_EVENT_COUNT_KEY],
+                stored.get(MONGO_SESSION_START_KEY, 0),
+            )
+
+        # conversations which were saved before the events were indexed
+        stored = self.conversations.find_one(
+            {"sender_id": sender_id}, {"events": True}
+        )
+        all_events = self._events_from_serialized_tracker(stored or {})
+        number_of_events_since_last_session = len(
+            self._events_since_last_session_start(all_events)
+        )
+
+        return len(all_events), len(all_events) - number_of_events_since_last_session
+
     @staticmethod
     def _events_from_serialized_tracker(serialised: Dict) -> List[Dict]:
         return serialised.get("events", [])
@@ -879,7 +1288,61 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
     async def _retrieve(
         self, sender_id: Text, fetch_events_from_all_sessions: bool
     ) -> Optional[List[Dict[Text, Any]]]:
-        stored = self.conversations.find_one({"sender_id": sender_id})
+        return await common_utils.run_in_thread_pool(
+            self._executor,
+            self._find_events,
+            sender_id,
+            fetch_events_from_all_sessions,
+        )
+
+    def _find_events(
+        self, sender_id: Text, fetch_events_from_all_sessions: bool
+    ) -> Optional[List[Dict[Text, Any]]]:
+        """Fetches the stored events of a conversation.
+
+        Args:
+            sender_id: Conversation ID of the events.
+            fetch_events_from_all_sessions: Whether to fetch all sessions or only the
+                latest one.
+
+        Returns:
+            The serialised events or `None` if the conversation isn't stored.
+        """
+        stored = self._find_conversation(
+            sender_id, {MONGO_EVENT_COUNT_KEY: True, MONGO_SESSION_START_KEY: True}
+        )
+        if not stored:
+            return None
+
+        session_start = stored.get(MONGO_SESSION_START_KEY)
+        number_of_stored_events = stored.get(MONGO_EVENT_COUNT_KEY)
+
+        if (
+            fetch_events_from_all_sessions
+            or session_start is None
+            or not number_of_stored_events
+        ):
+            stored = self._find_conversation(sender_id, {"events": True})
+            events = self._events_from_serialized_tracker(stored or {})
+            if not fetch_events_from_all_sessions:
+                events = self._events_since_last_session_start(events)
+            return events
+
+        # only fetch the events of the latest session
+        stored = self._find_conversation(
+            sender_id,
+            {
+                "events": {
+                    "$slice": [session_start, number_of_stored_events - session_start]
+                }
+            },
+        )
+        return self._events_from_serialized_tracker(stored or {})
+
+    def _find_conversation(
+        self, sender_id: Text, projection: Optional[Dict[Text, Any]] = None
+    ) -> Optional[Dict[Text, Any]]:
+        stored = self.conversations.find_one({"sender_id": sender_id}, projection)
 
         # look for conversations which have used an `int` sender_id in the past
         # and update them.
@@ -889,18 +1352,11 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
             stored = self.conversations.find_one_and_update(
                 {"sender_id": int(sender_id)},
                 {"$set": {"sender_id": str(sender_id)}},
+                projection=projection,
                 return_document=ReturnDocument.AFTER,
             )
 
-        if not stored:
-            return None
-
-        events = self._events_from_serialized_tracker(stored)
-
-        if not fetch_events_from_all_sessions:
-            events = self._events_since_last_session_start(events)
-
-        return events
+        return stored
 
     async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Retrieves tracker for the latest conversation session."""
@@ -926,8 +1382,25 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
             conversation_id, events, self.domain.slots
         )
 
+    async def stored_event_count(self, sender_id: Text) -> Optional[int]:
+        """Returns the number of stored events of a conversation."""
+        stored = await common_utils.run_in_thread_pool(
+            self._executor,
+            self.conversations.find_one,
+            {"sender_id": sender_id},
+            {MONGO_EVENT_COUNT_KEY: True},
+        )
+        if not stored:
+            return 0
+
+        # conversations which were saved before the events were counted
+        return stored.get(MONGO_EVENT_COUNT_KEY)
+
     async def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the Mongo Tracker Store."""
+        return await common_utils.run_in_thread_pool(self._executor, self._sender_ids)
+
+    def _sender_ids(self) -> List[Text]:
         return [c["sender_id"] for c in self.conversations.find()]
 
 
@@ -963,11 +1436,20 @@ def is_postgresql_url(url: Union[Text, "URL"]) -> bool:
     return url.drivername == "postgresql"
 
 
-def create_engine_kwargs(url: Union[Text, "URL"]) -> Dict[Text, Any]:
+def create_engine_kwargs(
+    url: Union[Text, "URL"],
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+) -> Dict[Text, Any]:
     """Get `sqlalchemy.create_engine()` kwargs.
 
     Args:
         url: SQL connection URL.
+        pool_size: Number of connections to keep in the connection pool. Overrides
+            the value of the `SQL_POOL_SIZE` environment variable.
+        max_overflow: Number of connections which can be opened in addition to the
+            pool size. Overrides the value of the `SQL_MAX_OVERFLOW` environment
+            variable.
 
     Returns:
         kwargs to be passed into `sqlalchemy.create_engine()`.
@@ -987,10 +1469,10 @@ def create_engine_kwargs(url: Union[Text, "URL"]) -> Dict[Text, Any]:
     # connections that are kept in the connection pool. Not available
     # for SQLite, and only  tested for PostgreSQL. See
     # https://docs.sqlalchemy.org/en/13/core/pooling.html#sqlalchemy.pool.QueuePool
-    kwargs["pool_size"] = int(
+    kwargs["pool_size"] = pool_size or int(
         os.environ.get(POSTGRESQL_POOL_SIZE, POSTGRESQL_DEFAULT_POOL_SIZE)
     )
-    kwargs["max_overflow"] = int(
+    kwargs["max_overflow"] = max_overflow or int(
         os.environ.get(POSTGRESQL_MAX_OVERFLOW, POSTGRESQL_DEFAULT_MAX_OVERFLOW)
     )
 
@@ -1039,7 +1521,12 @@ def validate_port(port: Any) -> Optional[int]:
 
 
 class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
-    """Store which can save and retrieve trackers from an SQL database."""
+    """Store which can save and retrieve trackers from an SQL database.
+
+    Database queries are run in a thread pool so that they don't block the event
+    loop. SQLite databases are queried directly as SQLite connections can't be
+    shared across threads.
+    """
 
     Base: DeclarativeMeta = declarative_base()
 
@@ -1058,6 +1545,27 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
         action_name = sa.Column(sa.String(255))
         data = sa.Column(sa.Text)
 
+        __table_args__ = (
+            sa.Index("ix_events_sender_id_timestamp", "sender_id", "timestamp"),
+            sa.Index("ix_events_sender_id_type_name", "sender_id", "type_name"),
+        )
+
+    class SQLConversationWatermark(Base):
+        """Represents where the latest session of a conversation starts."""
+
+        __tablename__ = "conversation_watermarks"
+
+        sender_id = sa.Column(sa.String(255), primary_key=True)
+        # timestamp of the latest `SessionStarted` event
+        session_start = sa.Column(sa.Float)
+        # number of stored events since and including the latest `SessionStarted`
+        # event, or of all stored events if there is none
+        session_event_count = sa.Column(sa.Integer, nullable=False, default=0)
+        # number of all stored events of the conversation
+        event_count = sa.Column(sa.Integer, nullable=False, default=0)
+
+    _executor: Optional[ThreadPoolExecutor] = None
+
     def __init__(
         self,
         domain: Optional[Domain] = None,
@@ -1070,6 +1578,8 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
         event_broker: Optional[EventBroker] = None,
         login_db: Optional[Text] = None,
         query: Optional[Dict] = None,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
         **kwargs: Dict[Text, Any],
     ) -> None:
         import sqlalchemy.exc
@@ -1080,7 +1590,9 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
             dialect, host, port, db, username, password, login_db, query
         )
 
-        self.engine = sa.create_engine(engine_url, **create_engine_kwargs(engine_url))
+        self.engine = sa.create_engine(
+            engine_url, **create_engine_kwargs(engine_url, pool_size, max_overflow)
+        )
 
         logger.debug(f"Attempting to connect to database via '{self.engine.url!r}'.")
 
@@ -1094,6 +1606,7 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
 
                 try:
                     self.Base.metadata.create_all(self.engine)
+                    self._ensure_indices()
                 except (
                     sqlalchemy.exc.OperationalError,
                     sqlalchemy.exc.ProgrammingError,
@@ -1115,8 +1628,26 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
 
         logger.debug(f"Connection to SQL database '{db}' successful.")
 
+        self._executor = (
+            None
+            if self.engine.dialect.name == "sqlite"
+            else ThreadPoolExecutor(thread_name_prefix="sql_tracker_store")
+        )
+
         super().__init__(domain, event_broker, **kwargs)
 
+    def _ensure_indices(self) -> None:
+        """Creates indices which were added after the `events` table was created."""
+        table = self.SQLEvent.__table__
+        existing_indices = {
+            index["name"] for index in sa.inspect(self.engine).get_indexes(table.name)
+        }
+
+        for index in table.indexes:
+            if index.name not in existing_indices:
+                logger.info(f"Creating index '{index.name}' on table '{table.name}'.")
+                index.create(self.engine)
+
     @staticmethod
     def get_db_url(
         dialect: Text = "sqlite",
@@ -1243,6 +1774,31 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
 
     async def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the SQLTrackerStore."""
+        return await common_utils.run_in_thread_pool(self._executor, self._sender_ids)
+
+    async def stored_event_count(self, sender_id: Text) -> Optional[int]:
+        """Returns the number of stored events of a conversation."""
+        return await common_utils.run_in_thread_pool(
+            self._executor, self._stored_event_count, sender_id
+        )
+
+    def _stored_event_count(self, sender_id: Text) -> Optional[int]:
+        with self.session_scope() as session:
+            watermark = session.get(self.SQLConversationWatermark, sender_id)
+            if watermark is not None:
+                return watermark.event_count
+
+            is_stored = (
+                session.query(self.SQLEvent.id)
+                .filter(self.SQLEvent.sender_id == sender_id)
+                .first()
+                is not None
+            )
+            # conversations which were saved before watermarks were stored are
+            # only counted when they are saved again
+            return None if is_stored else 0
+
+    def _sender_ids(self) -> List[Text]:
         with self.session_scope() as session:
             sender_ids = session.query(self.SQLEvent.sender_id).distinct().all()
             return [sender_id for (sender_id,) in sender_ids]
@@ -1262,28 +1818,38 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
     async def _retrieve(
         self, sender_id: Text, fetch_events_from_all_sessions: bool
     ) -> Optional[DialogueStateTracker]:
-        with self.session_scope() as session:
+        serialised_events = await common_utils.run_in_thread_pool(
+            self._executor,
+            self._serialised_events,
+            sender_id,
+            fetch_events_from_all_sessions,
+        )
 
-            serialised_events = self._event_query(
-                session,
-                sender_id,
-                fetch_events_from_all_sessions=fetch_events_from_all_sessions,
-            ).all()
+        events = self._decode_events(sender_id, serialised_events)
 
-            events = [json.loads(event.data) for event in serialised_events]
+        if self.domain and len(events) > 0:
+            logger.debug(f"Recreating tracker from sender id '{sender_id}'")
+            return DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        else:
+            logger.debug(
+                f"Can't retrieve tracker matching "
+                f"sender id '{sender_id}' from SQL storage. "
+                f"Returning `None` instead."
+            )
+            return None
 
-            if self.domain and len(events) > 0:
-                logger.debug(f"Recreating tracker from sender id '{sender_id}'")
-                return DialogueStateTracker.from_dict(
-                    sender_id, events, self.domain.slots
-                )
-            else:
-                logger.debug(
-                    f"Can't retrieve tracker matching "
-                    f"sender id '{sender_id}' from SQL storage. "
-                    f"Returning `None` instead."
-                )
-                return None
+    def _serialised_events(
+        self, sender_id: Text, fetch_events_from_all_sessions: bool
+    ) -> List[Text]:
+        with self.session_scope() as session:
+            return [
+                event.data
+                for event in self._event_query(
+                    session,
+                    sender_id,
+                    fetch_events_from_all_sessions=fetch_events_from_all_sessions,
+                ).all()
+            ]
 
     def _event_query(
         self, session: "Session", sender_id: Text, fetch_events_from_all_sessions: bool
@@ -1300,20 +1866,30 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
         Returns:
             Query to get the conversation events.
         """
-        # Subquery to find the timestamp of the latest `SessionStarted` event
-        session_start_sub_query = (
-            session.query(sa.func.max(self.SQLEvent.timestamp).label("session_start"))
-            .filter(
-                self.SQLEvent.sender_id == sender_id,
-                self.SQLEvent.type_name == SessionStarted.type_name,
-            )
-            .subquery()
-        )
-
         event_query = session.query(self.SQLEvent).filter(
             self.SQLEvent.sender_id == sender_id
         )
-        if not fetch_events_from_all_sessions:
+        if fetch_events_from_all_sessions:
+            return event_query.order_by(self.SQLEvent.timestamp)
+
+        watermark = session.get(self.SQLConversationWatermark, sender_id)
+        if watermark is not None:
+            if watermark.session_start is not None:
+                event_query = event_query.filter(
+                    self.SQLEvent.timestamp >= watermark.session_start
+                )
+        else:
+            # conversations which were saved before watermarks were stored
+            session_start_sub_query = (
+                session.query(
+                    sa.func.max(self.SQLEvent.timestamp).label("session_start")
+                )
+                .filter(
+                    self.SQLEvent.sender_id == sender_id,
+                    self.SQLEvent.type_name == SessionStarted.type_name,
+                )
+                .subquery()
+            )
             event_query = event_query.filter(
                 # Find events after the latest `SessionStarted` event or return all
                 # events
@@ -1328,44 +1904,123 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
     async def save(self, tracker: DialogueStateTracker) -> None:
         """Update database with events from the current conversation."""
         await self.stream_events(tracker)
+        await common_utils.run_in_thread_pool(
+            self._executor, self._save_events, tracker
+        )
 
+        logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
+
+    def _save_events(self, tracker: DialogueStateTracker) -> None:
+        import sqlalchemy.exc
+
+        try:
+            self._insert_new_events(tracker)
+        except sqlalchemy.exc.IntegrityError:
+            # Another instance stored the first events of the conversation at the
+            # same time and created its watermark. The failed transaction was rolled
+            # back, so insert the events which are still missing after that
+            # watermark.
+            logger.debug(
+                f"Watermark of conversation '{tracker.sender_id}' was created "
+                f"concurrently. Retrying to save its events."
+            )
+            self._insert_new_events(tracker)
+
+    def _insert_new_events(self, tracker: DialogueStateTracker) -> None:
         with self.session_scope() as session:
+            watermark = self._watermark(session, tracker.sender_id)
             # only store recent events
-            events = self._additional_events(session, tracker)
+            events = list(self._events_after_watermark(tracker, watermark))
 
+            rows = []
             for event in events:
                 data = event.as_dict()
                 intent = (
                     data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
                 )
-                action = data.get("name")
-                timestamp = data.get("timestamp")
-
-                # noinspection PyArgumentList
-                session.add(
-                    self.SQLEvent(
-                        sender_id=tracker.sender_id,
-                        type_name=event.type_name,
-                        timestamp=timestamp,
-                        intent_name=intent,
-                        action_name=action,
-                        data=json.dumps(data),
-                    )
+
+                rows.append(
+                    {
+                        "sender_id": tracker.sender_id,
+                        "type_name": event.type_name,
+                        "timestamp": data.get("timestamp"),
+                        "intent_name": intent,
+                        "action_name": data.get("name"),
+                        "data": self.codec.encode(data),
+                    }
                 )
-            session.commit()
 
-        logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
+                if isinstance(event, SessionStarted):
+                    watermark.session_start = event.timestamp
+                    watermark.session_event_count = 0
+                watermark.session_event_count += 1
+                watermark.event_count += 1
+
+            if rows:
+                # a single multi-row insert instead of one insert per event
+                session.execute(self.SQLEvent.__table__.insert(), rows)
+                session.add(watermark)
+            session.commit()
 
     def _additional_events(
         self, session: "Session", tracker: DialogueStateTracker
     ) -> Iterator:
         """Return events from the tracker which aren't currently stored."""
-        number_of_events_since_last_session = self._event_query(
-            session, tracker.sender_id, fetch_events_from_all_sessions=False
-        ).count()
+        return self._events_after_watermark(
+            tracker, self._watermark(session, tracker.sender_id)
+        )
 
+    @staticmethod
+    def _events_after_watermark(
+        tracker: DialogueStateTracker,
+        watermark: "SQLTrackerStore.SQLConversationWatermark",
+    ) -> Iterator:
+        # the tracker contains the events since the latest stored session start
         return itertools.islice(
-            tracker.events, number_of_events_since_last_session, len(tracker.events)
+            tracker.events, watermark.session_event_count, len(tracker.events)
+        )
+
+    def _watermark(
+        self, session: "Session", sender_id: Text
+    ) -> "SQLTrackerStore.SQLConversationWatermark":
+        """Returns where the latest stored session of a conversation starts.
+
+        Args:
+            session: Current database session.
+            sender_id: Conversation ID.
+
+        Returns:
+            The stored watermark of the conversation, or a new one which isn't added
+            to the database session yet.
+        """
+        watermark = session.get(self.SQLConversationWatermark, sender_id)
+        if watermark is not None:
+            return watermark
+
+        # conversations which were saved before watermarks were stored
+        session_start = (
+            session.query(sa.func.max(self.SQLEvent.timestamp))
+            .filter(
+                self.SQLEvent.sender_id == sender_id,
+                self.SQLEvent.type_name == SessionStarted.type_name,
+            )
+            .scalar()
+        )
+        session_event_count = self._event_query(
+            session, sender_id, fetch_events_from_all_sessions=False
+        ).count()
+        event_count = (
+            session.query(self.SQLEvent)
+            .filter(self.SQLEvent.sender_id == sender_id)
+            .count()
+        )
+
+        # noinspection PyArgumentList
+        return self.SQLConversationWatermark(
+            sender_id=sender_id,
+            session_start=session_start,
+            session_event_count=session_event_count,
+            event_count=event_count,
         )
 
 
@@ -1486,6 +2141,170 @@ class FailSafeTrackerStore(TrackerStore):
             )
 
 
+class CachedTrackerStore(TrackerStore):
+    """Tracker store wrapper which caches recently used trackers in memory.
+
+    Trackers are saved to the wrapped tracker store right away (write-through) and
+    kept in a cache which holds up to `max_size` trackers for `ttl` seconds. Every
+    cached tracker remembers how many events were stored for its conversation.
+    Before a cached tracker is returned, this count is compared with the count in
+    the wrapped tracker store, so that trackers which were changed by other Rasa
+    instances aren't returned. This check only needs a small query instead of
+    retrieving and deserialising the whole tracker.
+    """
+
+    def __init__(
+        self,
+        tracker_store: TrackerStore,
+        max_size: int = DEFAULT_TRACKER_CACHE_MAX_SIZE,
+        ttl: float = DEFAULT_TRACKER_CACHE_TTL_IN_SECONDS,
+        check_event_count: bool = True,
+    ) -> None:
+        """Create a `CachedTrackerStore`.
+
+        Args:
+            tracker_store: The wrapped tracker store.
+            max_size: Maximum number of cached trackers. The least recently used
+                tracker is removed from the cache when it's full.
+            ttl: Time in seconds after which a cached tracker is retrieved from the
+                wrapped tracker store again.
+            check_event_count: Whether to check if a cached tracker is up to date
+                before returning it. Only disable this if every conversation is
+                always handled by the same Rasa instance.
+
+        Raises:
+            RasaException: If the configuration is invalid.
+        """
+        if max_size < 1 or ttl <= 0:
+            raise RasaException(
+                f"The tracker cache needs a size of at least one and a positive time "
+                f"to live. Got a size of {max_size} and a time to live of {ttl} "
+                f"seconds."
+            )
+
+        self._tracker_store = tracker_store
+        self.max_size = max_size
+        self.ttl = ttl
+        self.check_event_count = check_event_count
+        # maps conversation IDs to the cached tracker, the number of events which
+        # were stored for the conversation when it was cached and its expiry time
+        self._trackers: OrderedDict[
+            Text, Tuple[DialogueStateTracker, Optional[int], float]
+        ] = OrderedDict()
+
+        super().__init__(tracker_store.domain, tracker_store.event_broker)
+
+    @property
+    def domain(self) -> Domain:
+        """Returns the domain of the wrapped tracker store."""
+        return self._tracker_store.domain
+
+    @domain.setter
+    def domain(self, domain: Optional[Domain]) -> None:
+        self._tracker_store.domain = domain or Domain.empty()
+
+    async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Retrieves the tracker from the cache or the wrapped tracker store."""
+        # the count is fetched before the tracker, so that events which are stored
+        # in between make the cached tracker outdated instead of being missed
+        stored_event_count = await self._stored_event_count(sender_id)
+
+        cached = self._cached_tracker(sender_id)
+        if cached is not None:
+            tracker, cached_event_count = cached
+            # the tracker can only be checked if the wrapped tracker store knows
+            # the count, otherwise it's only expired after its time to live
+            if stored_event_count is None or stored_event_count == cached_event_count:
+                # copies of trackers don't contain their cached past states
+                return copy.deepcopy(tracker)
+
+        tracker = await self._tracker_store.retrieve(sender_id)
+        if tracker is None:
+            self._trackers.pop(sender_id, None)
+        else:
+            self._cache(tracker, stored_event_count)
+
+        return tracker
+
+    async def _stored_event_count(self, sender_id: Text) -> Optional[int]:
+        if not self.check_event_count:
+            return None
+
+        return await self._tracker_store.stored_event_count(sender_id)
+
+    def _cached_tracker(
+        self, sender_id: Text
+    ) -> Optional[Tuple[DialogueStateTracker, Optional[int]]]:
+        if sender_id not in self._trackers:
+            return None
+
+        tracker, stored_event_count, expires_at = self._trackers[sender_id]
+        if expires_at <= time.monotonic():
+            del self._trackers[sender_id]
+            return None
+
+        self._trackers.move_to_end(sender_id)
+        return tracker, stored_event_count
+
+    def _cache(
+        self, tracker: DialogueStateTracker, stored_event_count: Optional[int]
+    ) -> None:
+        self._trackers[tracker.sender_id] = (
+            copy.deepcopy(tracker),
+            stored_event_count,
+            time.monotonic() + self.ttl,
+        )
+        self._trackers.move_to_end(tracker.sender_id)
+
+        while len(self._trackers) > self.max_size:
+            self._trackers.popitem(last=False)
+
+    async def save(self, tracker: DialogueStateTracker) -> None:
+        """Saves the tracker to the wrapped tracker store and caches it.
+
+        The number of stored events after saving is derived from the count of the
+        cached tracker plus the events which were added to it. If another Rasa
+        instance stored events in between, the count in the wrapped tracker store
+        differs and the tracker is retrieved again.
+        """
+        # the cached tracker might be outdated if saving fails
+        cached = self._trackers.pop(tracker.sender_id, None)
+        if cached is not None:
+            cached_tracker, stored_event_count, _ = cached
+            number_of_known_events = len(cached_tracker.events)
+        else:
+            stored_event_count = await self._stored_event_count(tracker.sender_id)
+            number_of_known_events = 0
+
+        await self._tracker_store.save(tracker)
+
+        if stored_event_count is None:
+            self._cache(tracker, None)
+        elif (
+            cached is not None or stored_event_count == 0
+        ) and number_of_known_events <= len(tracker.events):
+            self._cache(
+                tracker,
+                stored_event_count + len(tracker.events) - number_of_known_events,
+            )
+        # otherwise it's unknown which of the tracker's events were stored before,
+        # so the tracker is retrieved again the next time
+
+    async def retrieve_full_tracker(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        """Calls `retrieve_full_tracker` method of the wrapped tracker store."""
+        return await self._tracker_store.retrieve_full_tracker(conversation_id)
+
+    async def stored_event_count(self, sender_id: Text) -> Optional[int]:
+        """Calls `stored_event_count` method of the wrapped tracker store."""
+        return await self._tracker_store.stored_event_count(sender_id)
+
+    async def keys(self) -> Iterable[Text]:
+        """Calls `keys` method of the wrapped tracker store."""
+        return await self._tracker_store.keys()
+
+
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig] = None,
     domain: Optional[Domain] = None,
@@ -1569,6 +2388,16 @@ def create_tracker_store(
     event_broker: Optional[EventBroker] = None,
 ) -> TrackerStore:
     """Creates a tracker store based on the current configuration."""
+    cache_config = None
+    if endpoint_config and TRACKER_STORE_CACHE_KEY in endpoint_config.kwargs:
+        cache_config = endpoint_config.kwargs[TRACKER_STORE_CACHE_KEY]
+        endpoint_config = copy.copy(endpoint_config)
+        endpoint_config.kwargs = {
+            key: value
+            for key, value in endpoint_config.kwargs.items()
+            if key != TRACKER_STORE_CACHE_KEY
+        }
+
     tracker_store = _create_from_endpoint_config(endpoint_config, domain, event_broker)
 
     if not check_if_tracker_store_async(tracker_store):
@@ -1582,6 +2411,11 @@ def create_tracker_store(
         )
         tracker_store = AwaitableTrackerStore(tracker_store)
 
+    if cache_config is not None and cache_config is not False:
+        tracker_store = CachedTrackerStore(
+            tracker_store, **(cache_config if isinstance(cache_config, dict) else {})
+        )
+
     return tracker_store
 
 
@@ -106,6 +106,7 @@ from rasa.utils.tensorflow.constants import (
     MODEL_CONFIDENCE,
     SOFTMAX,
     RUN_EAGERLY,
+    EXPORT_PREDICT_FUNCTION,
 )
 
 logger = logging.getLogger(__name__)
@@ -288,6 +289,9 @@ class DIETClassifier(GraphComponent, IntentClassifier, EntityExtractorMixin):
             # a few steps, as the compilation of the graph tends to take more time than
             # running it. It is recommended to not adjust the optimization parameter.
             RUN_EAGERLY: False,
+            # If 'True' the traced prediction graph is exported together with the
+            # model, which makes loading the model for inference a lot faster.
+            EXPORT_PREDICT_FUNCTION: False,
         }
 
     def __init__(
@@ -971,6 +975,70 @@ class DIETClassifier(GraphComponent, IntentClassifier, EntityExtractorMixin):
             return None
         return self.model.run_inference(model_data)
 
+    def _predict_batch(
+        self, messages: List[Message]
+    ) -> List[Optional[Dict[Text, Union[tf.Tensor, Dict[Text, tf.Tensor]]]]]:
+        """Runs the model once for all messages instead of once per message.
+
+        Diagnostic data isn't split by message, so messages are predicted one by
+        one if it is requested.
+        """
+        if (
+            self.model is None
+            or len(messages) < 2
+            or self._execution_context.should_add_diagnostic_data
+        ):
+            return [self._predict(message) for message in messages]
+
+        # only messages with features end up in the model data
+        featurized_indices = [
+            index
+            for index, message in enumerate(messages)
+            if message.features_present(
+                attribute=TEXT, featurizers=self.component_config.get(FEATURIZERS)
+            )
+        ]
+        outputs: List[Optional[Dict[Text, Any]]] = [None] * len(messages)
+
+        model_data = self._create_model_data(
+            [messages[index] for index in featurized_indices], training=False
+        )
+        if model_data.is_empty():
+            return outputs
+
+        batch_out = self.model.run_inference(
+            model_data, batch_size=len(featurized_indices)
+        )
+        for batch_index, message_index in enumerate(featurized_indices):
+            outputs[message_index] = self._output_for_message(
+                batch_out,
+                batch_index,
+                len(messages[message_index].get(TOKENS_NAMES[TEXT], [])),
+            )
+
+        return outputs
+
+    @staticmethod
+    def _output_for_message(
+        batch_out: Dict[Text, Any], batch_index: int, number_of_tokens: int
+    ) -> Dict[Text, Any]:
+        """Selects the output of one message from the output of a batch.
+
+        The output keeps the batch dimension of size one and entity predictions are
+        cut to the tokens of the message, like the output of `_predict`.
+        """
+        message_out = {}
+        for key, value in batch_out.items():
+            if not isinstance(value, np.ndarray):
+                continue
+
+            value = value[batch_index : batch_index + 1]
+            if key.startswith("e_") and value.ndim > 1:
+                value = value[:, :number_of_tokens]
+            message_out[key] = value
+
+        return message_out
+
     def _predict_label(
         self, predict_out: Optional[Dict[Text, tf.Tensor]]
     ) -> Tuple[Dict[Text, Any], List[Dict[Text, Any]]]:
@@ -1039,9 +1107,7 @@ class DIETClassifier(GraphComponent, IntentClassifier, EntityExtractorMixin):
 
     def process(self, messages: List[Message]) -> List[Message]:
         """Augments the message with intents, entities, and diagnostic data."""
-        for message in messages:
-            out = self._predict(message)
-
+        for message, out in zip(messages, self._predict_batch(messages)):
             if self.component_config[INTENT_CLASSIFICATION]:
                 label, label_ranking = self._predict_label(out)
 
@@ -1079,6 +1145,13 @@ class DIETClassifier(GraphComponent, IntentClassifier, EntityExtractorMixin):
                 checkpoint_marker.touch()
 
             self.model.save(str(tf_model_file))
+            if self.component_config[EXPORT_PREDICT_FUNCTION]:
+                self.model.export_predict_function(
+                    str(tf_model_file),
+                    self._create_predict_data_example(
+                        RasaModelData(data=self._data_example)
+                    ),
+                )
 
             io_utils.pickle_dump(
                 model_path / f"{file_name}.data_example.pkl", self._data_example
@@ -1262,15 +1335,7 @@ class DIETClassifier(GraphComponent, IntentClassifier, EntityExtractorMixin):
         config: Dict[Text, Any],
         finetune_mode: bool,
     ) -> "RasaModel":
-
-        predict_data_example = RasaModelData(
-            label_key=model_data_example.label_key,
-            data={
-                feature_name: features
-                for feature_name, features in model_data_example.items()
-                if TEXT in feature_name
-            },
-        )
+        predict_data_example = cls._create_predict_data_example(model_data_example)
 
         return cls.model_class().load(
             tf_model_file,
@@ -1283,6 +1348,19 @@ class DIETClassifier(GraphComponent, IntentClassifier, EntityExtractorMixin):
             finetune_mode=finetune_mode,
         )
 
+    @staticmethod
+    def _create_predict_data_example(
+        model_data_example: RasaModelData,
+    ) -> RasaModelData:
+        return RasaModelData(
+            label_key=model_data_example.label_key,
+            data={
+                feature_name: features
+                for feature_name, features in model_data_example.items()
+                if TEXT in feature_name
+            },
+        )
+
     def _instantiate_model_class(self, model_data: RasaModelData) -> "RasaModel":
         return self.model_class()(
             data_signature=model_data.get_signature(),
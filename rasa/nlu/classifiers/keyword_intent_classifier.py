@@ -1,7 +1,7 @@
 from __future__ import annotations
 import logging
 import re
-from typing import Any, Dict, Optional, Text, List
+from typing import Any, Dict, Optional, Pattern, Set, Text, List, Tuple
 
 from rasa.engine.graph import GraphComponent, ExecutionContext
 from rasa.engine.recipes.default_recipe import DefaultV1Recipe
@@ -9,6 +9,11 @@ from rasa.engine.storage.resource import Resource
 from rasa.engine.storage.storage import ModelStorage
 from rasa.shared.constants import DOCS_URL_COMPONENTS
 from rasa.nlu.classifiers.classifier import IntentClassifier
+from rasa.nlu.utils.pattern_utils import (
+    LiteralMatcher,
+    has_word_boundaries,
+    is_literal_pattern,
+)
 from rasa.shared.nlu.constants import (
     INTENT,
     TEXT,
@@ -53,6 +58,7 @@ class KeywordIntentClassifier(GraphComponent, IntentClassifier):
 
         self.case_sensitive = self.component_config.get("case_sensitive")
         self.intent_keyword_map = intent_keyword_map or {}
+        self._compile_keywords()
 
     @classmethod
     def create(
@@ -92,19 +98,81 @@ class KeywordIntentClassifier(GraphComponent, IntentClassifier):
             )
 
         self._validate_keyword_map()
+        self._compile_keywords()
         self.persist()
         return self._resource
 
+    def _compile_keywords(self) -> None:
+        """Compiles the keywords, so that a text is searched for all of them at once.
+
+        Keywords without special regex characters are compiled into a single
+        automaton. The other keywords are still matched as regexes.
+        """
+        flags = 0 if self.case_sensitive else re.IGNORECASE
+        self._keywords = list(self.intent_keyword_map.keys())
+
+        # the matcher ignores empty literals, which keeps the indices of the keywords
+        literals = [
+            keyword if is_literal_pattern(keyword) else ""
+            for keyword in self._keywords
+        ]
+        self._keyword_matcher = LiteralMatcher(literals, self.case_sensitive)
+        self._keyword_regexes: List[Tuple[int, Pattern]] = [
+            (index, re.compile(r"\b" + keyword + r"\b", flags))
+            for index, keyword in enumerate(self._keywords)
+            if not literals[index]
+        ]
+
+    def _matching_keywords(self, text: Text) -> Set[int]:
+        """Returns the indices of all keywords which occur in the text."""
+        matches = {
+            index
+            for start, end, index in self._keyword_matcher.find_all(text)
+            if has_word_boundaries(text, start, end)
+        }
+        matches.update(
+            index for index, regex in self._keyword_regexes if regex.search(text)
+        )
+        return matches
+
+    def _first_matching_keyword(self, text: Text) -> Optional[int]:
+        """Returns the index of the first keyword of the map which occurs in the text.
+
+        This is the keyword which matches when the keywords are tried in the order of
+        the keyword map.
+        """
+        first = None
+        for start, end, index in self._keyword_matcher.find_all(text):
+            if (first is None or index < first) and has_word_boundaries(
+                text, start, end
+            ):
+                first = index
+
+        for index, regex in self._keyword_regexes:
+            if first is not None and index > first:
+                break
+            if regex.search(text):
+                return index
+
+        return first
+
     def _validate_keyword_map(self) -> None:
-        re_flag = 0 if self.case_sensitive else re.IGNORECASE
+        self._compile_keywords()
+
+        # `keywords_containing[i]` are the indices of the keywords which contain the
+        # keyword with index `i`, in the order of the keyword map
+        keywords_containing: List[List[int]] = [[] for _ in self._keywords]
+        for index2, keyword2 in enumerate(self._keywords):
+            for index1 in self._matching_keywords(keyword2):
+                keywords_containing[index1].append(index2)
 
         ambiguous_mappings = []
-        for keyword1, intent1 in self.intent_keyword_map.items():
-            for keyword2, intent2 in self.intent_keyword_map.items():
-                if (
-                    re.search(r"\b" + keyword1 + r"\b", keyword2, flags=re_flag)
-                    and intent1 != intent2
-                ):
+        for index1, keyword1 in enumerate(self._keywords):
+            intent1 = self.intent_keyword_map[keyword1]
+            for index2 in keywords_containing[index1]:
+                keyword2 = self._keywords[index2]
+                intent2 = self.intent_keyword_map[keyword2]
+                if intent1 != intent2:
                     ambiguous_mappings.append((intent1, keyword1))
                     rasa.shared.utils.io.raise_warning(
                         f"Keyword '{keyword1}' is a keyword of intent '{intent1}', "
@@ -140,15 +208,15 @@ class KeywordIntentClassifier(GraphComponent, IntentClassifier):
         return messages
 
     def _map_keyword_to_intent(self, text: Text) -> Optional[Text]:
-        re_flag = 0 if self.case_sensitive else re.IGNORECASE
-
-        for keyword, intent in self.intent_keyword_map.items():
-            if re.search(r"\b" + keyword + r"\b", text, flags=re_flag):
-                logger.debug(
-                    f"KeywordClassifier matched keyword '{keyword}' to"
-                    f" intent '{intent}'."
-                )
-                return intent
+        index = self._first_matching_keyword(text)
+        if index is not None:
+            keyword = self._keywords[index]
+            intent = self.intent_keyword_map[keyword]
+            logger.debug(
+                f"KeywordClassifier matched keyword '{keyword}' to"
+                f" intent '{intent}'."
+            )
+            return intent
 
         logger.debug("KeywordClassifier did not find any keywords in the message.")
         return None
@@ -1,10 +1,14 @@
 from __future__ import annotations
+import copy
 import time
 import json
 import logging
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Any, List, Optional, Text, Dict
+from typing import Any, List, Optional, Text, Dict, Tuple
 
 import rasa.utils.endpoints as endpoints_utils
 from rasa.engine.graph import GraphComponent, ExecutionContext
@@ -12,6 +16,7 @@ from rasa.engine.recipes.default_recipe import DefaultV1Recipe
 from rasa.engine.storage.resource import Resource
 from rasa.engine.storage.storage import ModelStorage
 from rasa.shared.constants import DOCS_URL_COMPONENTS
+from rasa.shared.exceptions import InvalidConfigException
 from rasa.shared.nlu.constants import ENTITIES, TEXT
 from rasa.nlu.extractors.extractor import EntityExtractorMixin
 from rasa.shared.nlu.training_data.message import Message
@@ -20,6 +25,9 @@ import rasa.shared.utils.io
 
 logger = logging.getLogger(__name__)
 
+# text, reference time bucket
+CacheKey = Tuple[Text, int]
+
 
 def extract_value(match: Dict[Text, Any]) -> Dict[Text, Any]:
     if match["value"].get("type") == "interval":
@@ -80,6 +88,16 @@ class DucklingEntityExtractor(GraphComponent, EntityExtractorMixin):
             # duckling server. If not set the default timeout of duckling HTTP URL
             # is set to 3 seconds.
             "timeout": 3,
+            # maximum number of messages which are sent to the duckling server at
+            # the same time.
+            "max_concurrent_requests": 4,
+            # number of parse results which are cached. 0 disables the cache.
+            "cache_size": 0,
+            # time in seconds after which cached parse results expire.
+            "cache_ttl": 60,
+            # messages whose reference times are in the same interval of this many
+            # seconds share cached parse results.
+            "cache_reference_time_granularity": 60,
         }
 
     def __init__(self, config: Dict[Text, Any]) -> None:
@@ -89,6 +107,30 @@ class DucklingEntityExtractor(GraphComponent, EntityExtractorMixin):
             config: The extractor's config.
         """
         self.component_config = config
+        self.validate_config(config)
+
+        self._session = self._create_session()
+        # cached parse results with the time at which they were cached
+        self._cache: OrderedDict[
+            CacheKey, Tuple[float, List[Dict[Text, Any]]]
+        ] = OrderedDict()
+        # messages can be processed by several inference workers at the same time
+        self._cache_lock = threading.Lock()
+
+    @classmethod
+    def validate_config(cls, config: Dict[Text, Any]) -> None:
+        """Checks whether the given configuration is valid.
+
+        Args:
+            config: The extractor's config.
+        """
+        for option in ["max_concurrent_requests", "cache_size", "cache_ttl"]:
+            value = config.get(option)
+            if value is not None and (not isinstance(value, int) or value < 0):
+                raise InvalidConfigException(
+                    f"`{option}` of `{cls.__name__}` must be a number which is not "
+                    f"negative. Received {value} instead."
+                )
 
     @classmethod
     def create(
@@ -118,7 +160,20 @@ class DucklingEntityExtractor(GraphComponent, EntityExtractorMixin):
             "reftime": reference_time,
         }
 
-    def _duckling_parse(self, text: Text, reference_time: int) -> List[Dict[Text, Any]]:
+    def _create_session(self) -> requests.Session:
+        """Creates the session which keeps the connections to duckling alive."""
+        pool_size = max(self.component_config.get("max_concurrent_requests", 1), 1)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_size
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _request_parse(
+        self, text: Text, reference_time: int
+    ) -> Optional[List[Dict[Text, Any]]]:
         """Sends the request to the duckling server and parses the result.
 
         Args:
@@ -126,7 +181,8 @@ class DucklingEntityExtractor(GraphComponent, EntityExtractorMixin):
             reference_time: Reference time in milliseconds.
 
         Returns:
-            JSON response from duckling server with parse data.
+            JSON response from duckling server with parse data, or `None` if the
+            request failed.
         """
         parse_url = endpoints_utils.concat_url(self._url(), "/parse")
         try:
@@ -134,7 +190,7 @@ class DucklingEntityExtractor(GraphComponent, EntityExtractorMixin):
             headers = {
                 "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8"
             }
-            response = requests.post(
+            response = self._session.post(
                 parse_url,
                 data=payload,
                 headers=headers,
@@ -149,7 +205,7 @@ class DucklingEntityExtractor(GraphComponent, EntityExtractorMixin):
                     f"Status Code: {response.status_code}. "
                     f"Response: {response.text}"
                 )
-                return []
+                return None
         except (
             requests.exceptions.ConnectionError,
             requests.exceptions.ReadTimeout,
@@ -163,7 +219,115 @@ class DucklingEntityExtractor(GraphComponent, EntityExtractorMixin):
                 "https://github.com/facebook/duckling#quickstart "
                 "Error: {}".format(e)
             )
-            return []
+            return None
+
+    def _cache_key(self, text: Text, reference_time: int) -> CacheKey:
+        """Returns the key of the parse result of a text.
+
+        Locale, timezone and dimensions are part of the config, so they are the same
+        for all entries of the cache.
+        """
+        granularity = self.component_config.get("cache_reference_time_granularity")
+        if not granularity:
+            return text, int(reference_time)
+        return text, int(reference_time // (granularity * 1000))
+
+    def _get_cached(self, key: CacheKey) -> Optional[List[Dict[Text, Any]]]:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+
+            cached_at, matches = entry
+            ttl = self.component_config.get("cache_ttl", 0)
+            if time.monotonic() - cached_at > ttl:
+                self._cache.pop(key, None)
+                return None
+
+            self._cache.move_to_end(key)
+        # cached entries are never modified, so they can be copied without the lock
+        return copy.deepcopy(matches)
+
+    def _add_to_cache(self, key: CacheKey, matches: List[Dict[Text, Any]]) -> None:
+        cache_size = self.component_config.get("cache_size", 0)
+        if not cache_size:
+            return
+
+        entry = (time.monotonic(), copy.deepcopy(matches))
+        with self._cache_lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > cache_size:
+                self._cache.popitem(last=False)
+
+    def _parse_messages(
+        self, messages: List[Message]
+    ) -> List[List[Dict[Text, Any]]]:
+        """Parses the texts of messages with duckling.
+
+        Every distinct text is only sent once and cached parse results are reused.
+        The remaining requests are sent concurrently.
+
+        Args:
+            messages: The messages to parse.
+
+        Returns:
+            The parse results of the messages.
+        """
+        keys = []
+        # text and reference time of every request which needs to be sent
+        requests_to_send: Dict[CacheKey, Tuple[Text, int]] = {}
+        parse_results: Dict[CacheKey, List[Dict[Text, Any]]] = {}
+        for message in messages:
+            text = message.get(TEXT)
+            reference_time = self._reference_time_from_message(message)
+            key = self._cache_key(text, reference_time)
+            keys.append(key)
+
+            if key in parse_results or key in requests_to_send:
+                continue
+            cached = self._get_cached(key)
+            if cached is not None:
+                parse_results[key] = cached
+            else:
+                requests_to_send[key] = (text, reference_time)
+
+        max_workers = min(
+            self.component_config.get("max_concurrent_requests", 1),
+            len(requests_to_send),
+        )
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                parsed = list(
+                    executor.map(
+                        lambda request: self._request_parse(*request),
+                        requests_to_send.values(),
+                    )
+                )
+        else:
+            parsed = [
+                self._request_parse(*request) for request in requests_to_send.values()
+            ]
+
+        for key, matches in zip(requests_to_send, parsed):
+            if matches is None:
+                # don't cache failed requests
+                parse_results[key] = []
+            else:
+                parse_results[key] = matches
+                self._add_to_cache(key, matches)
+
+        results = []
+        returned_keys = set()
+        for key in keys:
+            matches = parse_results[key]
+            # messages with the same text must not share their entities
+            if key in returned_keys:
+                matches = copy.deepcopy(matches)
+            returned_keys.add(key)
+            results.append(matches)
+
+        return results
 
     @staticmethod
     def _reference_time_from_message(message: Message) -> int:
@@ -192,9 +356,7 @@ class DucklingEntityExtractor(GraphComponent, EntityExtractorMixin):
             )
             return messages
 
-        for message in messages:
-            reference_time = self._reference_time_from_message(message)
-            matches = self._duckling_parse(message.get(TEXT), reference_time)
+        for message, matches in zip(messages, self._parse_messages(messages)):
             all_extracted = convert_duckling_format_to_rasa(matches)
             dimensions = self.component_config["dimensions"]
             extracted = self.filter_irrelevant_entities(all_extracted, dimensions)
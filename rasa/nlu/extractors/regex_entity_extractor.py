@@ -1,6 +1,5 @@
 from __future__ import annotations
 import logging
-import re
 from typing import Any, Dict, List, Optional, Text
 
 from rasa.engine.graph import GraphComponent, ExecutionContext
@@ -92,6 +91,20 @@ class RegexEntityExtractor(GraphComponent, EntityExtractorMixin):
         # extractor
         self.case_sensitive = self._config["case_sensitive"]
         self.patterns = patterns or []
+        self._reset_pattern_matcher()
+
+    def _reset_pattern_matcher(self) -> None:
+        """Makes sure that the pattern matcher is rebuilt when the patterns change."""
+        self._compiled_pattern_matcher: Optional[pattern_utils.PatternMatcher] = None
+
+    @property
+    def _pattern_matcher(self) -> pattern_utils.PatternMatcher:
+        """Matches all patterns in a single pass. It's only built when needed."""
+        if self._compiled_pattern_matcher is None:
+            self._compiled_pattern_matcher = pattern_utils.shared_pattern_matcher(
+                self.patterns, self.case_sensitive
+            )
+        return self._compiled_pattern_matcher
 
     def train(self, training_data: TrainingData) -> Resource:
         """Extract patterns from the training data.
@@ -106,6 +119,7 @@ class RegexEntityExtractor(GraphComponent, EntityExtractorMixin):
             use_only_entities=True,
             use_word_boundaries=self._config["use_word_boundaries"],
         )
+        self._reset_pattern_matcher()
 
         if not self.patterns:
             rasa.shared.utils.io.raise_warning(
@@ -159,16 +173,9 @@ class RegexEntityExtractor(GraphComponent, EntityExtractorMixin):
         """
         entities = []
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-
-        for pattern in self.patterns:
-            matches = re.finditer(pattern["pattern"], message.get(TEXT), flags=flags)
-
-            for match in matches:
-                start_index = match.start()
-                end_index = match.end()
+        pattern_spans = self._pattern_matcher.find_spans(message.get(TEXT))
+        for pattern, spans in zip(self.patterns, pattern_spans):
+            for start_index, end_index in spans:
                 entities.append(
                     {
                         ENTITY_ATTRIBUTE_TYPE: pattern["name"],
@@ -1,8 +1,14 @@
 from __future__ import annotations
+import functools
+import hashlib
 import numpy as np
 import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
 
-from typing import Any, Text, List, Dict, Tuple, Type
+from typing import Any, Text, List, Dict, Optional, Tuple, Type
 import tensorflow as tf
 
 from rasa.engine.graph import ExecutionContext, GraphComponent
@@ -21,6 +27,7 @@ from rasa.nlu.constants import (
     NUMBER_OF_SUB_TOKENS,
     TOKENS_NAMES,
 )
+from rasa.shared.exceptions import InvalidConfigException
 from rasa.shared.nlu.constants import TEXT, ACTION_TEXT
 from rasa.utils import train_utils
 from rasa.utils.tensorflow.model_data import ragged_array_to_ndarray
@@ -37,6 +44,142 @@ MAX_SEQUENCE_LENGTHS = {
     "camembert": 512,
 }
 
+DEFAULT_BATCH_SIZE = 64
+
+
+class EmbeddingCache:
+    """Least recently used cache of the embeddings of texts.
+
+    The cache keeps up to `max_size` entries in memory. If a `cache_dir` is given,
+    every entry is also written to it, so that later training runs and servers can
+    load it instead of running the language model again. Entries on disk are loaded
+    as memory-mapped arrays and are never evicted. The cache can be used from
+    several threads at the same time.
+    """
+
+    def __init__(self, max_size: int, cache_dir: Optional[Text] = None) -> None:
+        """Creates the cache.
+
+        Args:
+            max_size: Maximum number of entries which are kept in memory.
+            cache_dir: Directory in which entries are stored, if they should be
+                stored on disk.
+        """
+        self.max_size = max_size
+        self.cache_dir = cache_dir
+        self._entries: OrderedDict[Text, Dict[Text, np.ndarray]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(*parts: Any) -> Text:
+        """Creates the key of an entry.
+
+        Args:
+            parts: Everything which influences the embeddings, e.g. the name of the
+                model and the token ids of the text.
+
+        Returns:
+            The key.
+        """
+        return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: Text) -> Optional[Dict[Text, np.ndarray]]:
+        """Returns a copy of the cached doc with the key.
+
+        Args:
+            key: The key of the doc.
+
+        Returns:
+            The sequence and sentence features of the doc, or `None` if the doc is
+            not cached.
+        """
+        with self._lock:
+            doc = self._entries.get(key)
+            if doc is not None:
+                self._entries.move_to_end(key)
+
+        if doc is None:
+            doc = self._load(key)
+            if doc is None:
+                return None
+            self._add(key, doc)
+
+        # the caller might modify the features of its messages
+        return {name: np.array(features) for name, features in doc.items()}
+
+    def put(self, key: Text, doc: Dict[Text, np.ndarray]) -> None:
+        """Caches a doc.
+
+        Args:
+            key: The key of the doc.
+            doc: The sequence and sentence features of the doc.
+        """
+        doc = {name: np.array(features) for name, features in doc.items()}
+        self._add(key, doc)
+        self._store(key, doc)
+
+    def _add(self, key: Text, doc: Dict[Text, np.ndarray]) -> None:
+        if self.max_size < 1:
+            return
+
+        with self._lock:
+            self._entries[key] = doc
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: Text, name: Text) -> Text:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.{name}.npy")
+
+    def _load(self, key: Text) -> Optional[Dict[Text, np.ndarray]]:
+        if not self.cache_dir:
+            return None
+
+        # the sentence features are written last, so the entry is complete if they
+        # exist
+        if not os.path.exists(self._path(key, SENTENCE_FEATURES)):
+            return None
+
+        try:
+            return {
+                name: np.load(self._path(key, name), mmap_mode="r")
+                for name in (SEQUENCE_FEATURES, SENTENCE_FEATURES)
+            }
+        except (OSError, ValueError) as e:
+            logger.debug(f"Failed to load cached embeddings '{key}'. Error: {e}")
+            return None
+
+    def _store(self, key: Text, doc: Dict[Text, np.ndarray]) -> None:
+        if not self.cache_dir:
+            return
+
+        try:
+            directory = os.path.dirname(self._path(key, SEQUENCE_FEATURES))
+            os.makedirs(directory, exist_ok=True)
+            for name in (SEQUENCE_FEATURES, SENTENCE_FEATURES):
+                # write to a temporary file first, so that other processes never
+                # load incomplete entries
+                file_descriptor, temporary_path = tempfile.mkstemp(dir=directory)
+                with os.fdopen(file_descriptor, "wb") as file:
+                    np.save(file, doc[name])
+                os.replace(temporary_path, self._path(key, name))
+        except OSError as e:
+            logger.warning(
+                f"Failed to write embeddings to the cache directory "
+                f"'{self.cache_dir}'. Error: {e}"
+            )
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_embedding_cache(
+    max_size: int, cache_dir: Optional[Text]
+) -> EmbeddingCache:
+    """Returns the cache which all featurizers with the same settings share.
+
+    This way a server which trains and runs models reuses the embeddings.
+    """
+    return EmbeddingCache(max_size, cache_dir)
+
 
 @DefaultV1Recipe.register(
     DefaultV1Recipe.ComponentType.MESSAGE_FEATURIZER, is_trainable=False
@@ -66,6 +209,15 @@ class LanguageModelFeaturizer(DenseFeaturizer, GraphComponent):
         self._load_model_metadata()
         self._load_model_instance()
 
+        self.batch_size = self._config.get("batch_size", DEFAULT_BATCH_SIZE)
+        cache_size = self._config.get("embedding_cache_size", 0)
+        cache_dir = self._config.get("embedding_cache_dir")
+        self._embedding_cache = (
+            _shared_embedding_cache(cache_size, cache_dir)
+            if cache_size or cache_dir
+            else None
+        )
+
     @staticmethod
     def get_default_config() -> Dict[Text, Any]:
         """Returns LanguageModelFeaturizer's default config."""
@@ -78,12 +230,35 @@ class LanguageModelFeaturizer(DenseFeaturizer, GraphComponent):
             # an optional path to a specific directory to download
             # and cache the pre-trained model weights.
             "cache_dir": None,
+            # number of messages which are fed to the language model at once.
+            # Messages are grouped by length, so that the batches need little
+            # padding.
+            "batch_size": DEFAULT_BATCH_SIZE,
+            # number of texts whose embeddings are kept in memory, so that the
+            # language model doesn't run again for repeated texts. 0 disables it.
+            "embedding_cache_size": 0,
+            # an optional directory in which the embeddings of all texts are
+            # stored, so that they can be reused by other training runs and
+            # servers.
+            "embedding_cache_dir": None,
         }
 
     @classmethod
     def validate_config(cls, config: Dict[Text, Any]) -> None:
         """Validates the configuration."""
-        pass
+        batch_size = config.get("batch_size", DEFAULT_BATCH_SIZE)
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise InvalidConfigException(
+                f"`batch_size` of `{cls.__name__}` must be a positive number. "
+                f"Received {batch_size} instead."
+            )
+
+        cache_size = config.get("embedding_cache_size", 0)
+        if not isinstance(cache_size, int) or cache_size < 0:
+            raise InvalidConfigException(
+                f"`embedding_cache_size` of `{cls.__name__}` must be a number which "
+                f"is not negative. Received {cache_size} instead."
+            )
 
     @classmethod
     def create(
@@ -700,6 +875,94 @@ class LanguageModelFeaturizer(DenseFeaturizer, GraphComponent):
 
         return batch_docs
 
+    def _get_docs_for_messages(
+        self,
+        messages: List[Message],
+        attribute: Text,
+        inference_mode: bool = False,
+    ) -> List[Dict[Text, Any]]:
+        """Computes language model docs for messages of any number.
+
+        Messages with the same tokens are only featurized once and docs which are in
+        the embedding cache are not computed again. The other messages are sorted by
+        their length and fed to the language model in batches of `batch_size`, so
+        that the batches need little padding.
+
+        Args:
+            messages: Message objects for which language model docs need to be
+            computed.
+            attribute: Property of message to be processed, one of ``TEXT`` or
+            ``RESPONSE``.
+            inference_mode: Whether the call is during inference or during training.
+
+        Returns:
+            List of language model docs for each message.
+        """
+        batch_tokens, batch_token_ids = self._get_token_ids_for_batch(
+            messages, attribute
+        )
+        sequence_lengths = [
+            len(token_ids)
+            for token_ids in self._add_lm_specific_special_tokens(batch_token_ids)
+        ]
+
+        docs: List[Optional[Dict[Text, Any]]] = [None] * len(messages)
+        # indices of the messages which need to be featurized by their key
+        missing: Dict[Text, List[int]] = {}
+        for index, (tokens, token_ids) in enumerate(zip(batch_tokens, batch_token_ids)):
+            key = EmbeddingCache.key(
+                self.model_name,
+                self.model_weights,
+                [token.get(NUMBER_OF_SUB_TOKENS) for token in tokens],
+                token_ids,
+            )
+            if key not in missing and self._is_cacheable(sequence_lengths[index]):
+                docs[index] = self._embedding_cache.get(key)  # type: ignore
+            if docs[index] is None:
+                missing.setdefault(key, []).append(index)
+
+        keys = sorted(missing, key=lambda key: sequence_lengths[missing[key][0]])
+        for start in range(0, len(keys), self.batch_size):
+            batch_keys = keys[start : start + self.batch_size]
+            batch_indices = [missing[key][0] for key in batch_keys]
+            (
+                batch_sentence_features,
+                batch_sequence_features,
+            ) = self._get_model_features_for_batch(
+                [batch_token_ids[index] for index in batch_indices],
+                [batch_tokens[index] for index in batch_indices],
+                [messages[index] for index in batch_indices],
+                attribute,
+                inference_mode,
+            )
+
+            for position, key in enumerate(batch_keys):
+                doc = {
+                    SEQUENCE_FEATURES: batch_sequence_features[position],
+                    SENTENCE_FEATURES: np.reshape(
+                        batch_sentence_features[position], (1, -1)
+                    ),
+                }
+                duplicates = missing[key]
+                if self._is_cacheable(sequence_lengths[duplicates[0]]):
+                    self._embedding_cache.put(key, doc)  # type: ignore
+                docs[duplicates[0]] = doc
+                for index in duplicates[1:]:
+                    docs[index] = {name: np.array(f) for name, f in doc.items()}
+
+        return docs  # type: ignore
+
+    def _is_cacheable(self, sequence_length: int) -> bool:
+        """Checks if the doc of a sequence can be cached.
+
+        Docs of sequences which are too long for the model are not cached, so that
+        training still fails for them after they were truncated during inference.
+        """
+        return self._embedding_cache is not None and (
+            self.max_model_sequence_length == NO_LENGTH_RESTRICTION
+            or sequence_length <= self.max_model_sequence_length
+        )
+
     def process_training_data(self, training_data: TrainingData) -> TrainingData:
         """Computes tokens and dense features for each message in training data.
 
@@ -707,55 +970,37 @@ class LanguageModelFeaturizer(DenseFeaturizer, GraphComponent):
             training_data: NLU training data to be tokenized and featurized
             config: NLU pipeline config consisting of all components.
         """
-        batch_size = 64
-
         for attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
 
             non_empty_examples = list(
                 filter(lambda x: x.get(attribute), training_data.training_examples)
             )
 
-            batch_start_index = 0
+            # Construct a doc with relevant features
+            # extracted(tokens, dense_features)
+            docs = self._get_docs_for_messages(non_empty_examples, attribute)
 
-            while batch_start_index < len(non_empty_examples):
-
-                batch_end_index = min(
-                    batch_start_index + batch_size, len(non_empty_examples)
-                )
-                # Collect batch examples
-                batch_messages = non_empty_examples[batch_start_index:batch_end_index]
-
-                # Construct a doc with relevant features
-                # extracted(tokens, dense_features)
-                batch_docs = self._get_docs_for_batch(batch_messages, attribute)
-
-                for index, ex in enumerate(batch_messages):
-                    self._set_lm_features(batch_docs[index], ex, attribute)
-                batch_start_index += batch_size
+            for doc, example in zip(docs, non_empty_examples):
+                self._set_lm_features(doc, example, attribute)
 
         return training_data
 
     def process(self, messages: List[Message]) -> List[Message]:
         """Processes messages by computing tokens and dense features."""
-        for message in messages:
-            self._process_message(message)
-        return messages
-
-    def _process_message(self, message: Message) -> Message:
-        """Processes a message by computing tokens and dense features."""
         # processing featurizers operates only on TEXT and ACTION_TEXT attributes,
         # because all other attributes are labels which are featurized during
         # training and their features are stored by the model itself.
-        for attribute in {TEXT, ACTION_TEXT}:
-            if message.get(attribute):
-                self._set_lm_features(
-                    self._get_docs_for_batch(
-                        [message], attribute=attribute, inference_mode=True
-                    )[0],
-                    message,
-                    attribute,
-                )
-        return message
+        for attribute in [TEXT, ACTION_TEXT]:
+            non_empty_messages = [
+                message for message in messages if message.get(attribute)
+            ]
+            docs = self._get_docs_for_messages(
+                non_empty_messages, attribute, inference_mode=True
+            )
+            for doc, message in zip(docs, non_empty_messages):
+                self._set_lm_features(doc, message, attribute)
+
+        return messages
 
     def _set_lm_features(
         self, doc: Dict[Text, Any], message: Message, attribute: Text = TEXT
@@ -1,8 +1,9 @@
 from __future__ import annotations
 import logging
 import re
+import numpy as np
 import scipy.sparse
-from typing import Any, Dict, List, Optional, Text, Tuple, Set, Type
+from typing import Any, Dict, List, Optional, Text, Tuple, Set, Type, Union
 from rasa.nlu.tokenizers.tokenizer import Tokenizer
 
 import rasa.shared.utils.io
@@ -14,10 +15,14 @@ from rasa.nlu.featurizers.sparse_featurizer.sparse_featurizer import SparseFeatu
 from rasa.nlu.utils.spacy_utils import SpacyModel
 from rasa.shared.constants import DOCS_URL_COMPONENTS
 import rasa.utils.io as io_utils
-from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.nlu.training_data.message import Message
-from rasa.shared.exceptions import RasaException, FileIOException
+from rasa.shared.exceptions import (
+    RasaException,
+    FileIOException,
+    InvalidConfigException,
+)
 from rasa.nlu.constants import (
     TOKENS_NAMES,
     MESSAGE_ATTRIBUTES,
@@ -90,6 +95,9 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
             # indicates whether the featurizer should use the lemma of a word for
             # counting (if available) or not
             "use_lemma": True,
+            # number of features of text attributes if they should be hashed
+            # instead of being looked up in a vocabulary
+            "hashing_features": None,  # int or None
         }
 
     @staticmethod
@@ -131,6 +139,9 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
         # use the lemma of the words or not
         self.use_lemma = self._config["use_lemma"]
 
+        # hash the tokens of text attributes instead of using a vocabulary
+        self.hashing_features = self._config.get("hashing_features")
+
     def _load_vocabulary_params(self) -> Tuple[Text, List[Text]]:
         OOV_token = self._config["OOV_token"]
 
@@ -151,6 +162,10 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
 
         return OOV_token, OOV_words
 
+    def _is_hashed(self, attribute: Text) -> bool:
+        """Checks if the tokens of the attribute are hashed instead of counted."""
+        return isinstance(self.vectorizers.get(attribute), HashingVectorizer)
+
     def _get_attribute_vocabulary(self, attribute: Text) -> Optional[Dict[Text, int]]:
         """Gets trained vocabulary from attribute's count vectorizer."""
         try:
@@ -269,11 +284,7 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
             attribute_vocab = self._get_attribute_vocabulary(attribute)
             if attribute_vocab is not None and self.OOV_token in attribute_vocab:
                 # CountVectorizer is trained, process for prediction
-                attribute_vocabulary_tokens = set(attribute_vocab.keys())
-                tokens = [
-                    t if t in attribute_vocabulary_tokens else self.OOV_token
-                    for t in tokens
-                ]
+                tokens = [t if t in attribute_vocab else self.OOV_token for t in tokens]
             elif self.OOV_words:
                 # CountVectorizer is not trained, process for train
                 tokens = [self.OOV_token if t in self.OOV_words else t for t in tokens]
@@ -472,9 +483,14 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
                     "min_df": self.min_df,
                     "max_features": self.max_features,
                     "analyzer": self.analyzer,
+                    "hashing_features": self.hashing_features,
                 }
             )
         for attribute in self._attributes:
+            if self._is_hashed(attribute):
+                # hashed attributes don't have a vocabulary which could be trained
+                continue
+
             if self._attribute_texts_is_non_empty(attribute_texts[attribute]):
                 if not self.finetune_mode:
                     self._fit_vectorizer_from_scratch(
@@ -546,52 +562,102 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
     ) -> Tuple[
         List[Optional[scipy.sparse.spmatrix]], List[Optional[scipy.sparse.spmatrix]]
     ]:
-        if not self.vectorizers.get(attribute):
-            return [None], [None]
+        """Creates the features of an attribute for a batch of messages.
 
-        sequence_features: List[Optional[scipy.sparse.spmatrix]] = []
-        sentence_features: List[Optional[scipy.sparse.spmatrix]] = []
+        The tokens of all messages are transformed at once and the resulting matrix is
+        split into the features of the single messages.
 
-        for i, tokens in enumerate(all_tokens):
-            if not tokens:
-                # nothing to featurize
-                sequence_features.append(None)
-                sentence_features.append(None)
-                continue
+        Args:
+            attribute: The attribute which is featurized.
+            all_tokens: The processed tokens of the attribute of each message.
 
-            # vectorizer.transform returns a sparse matrix of size
-            # [n_samples, n_features]
-            # set input to list of tokens if sequence should be returned
-            # otherwise join all tokens to a single string and pass that as a list
-            if not tokens:
-                # attribute is not set (e.g. response not present)
-                sequence_features.append(None)
-                sentence_features.append(None)
-                continue
+        Returns:
+            The sequence and sentence features of each message (`None` for messages
+            without tokens).
+        """
+        sequence_features: List[Optional[scipy.sparse.spmatrix]] = [None] * len(
+            all_tokens
+        )
+        sentence_features: List[Optional[scipy.sparse.spmatrix]] = [None] * len(
+            all_tokens
+        )
 
-            seq_vec = self.vectorizers[attribute].transform(tokens)
-            seq_vec.sort_indices()
+        vectorizer = self.vectorizers.get(attribute)
+        # messages without tokens (e.g. response not present) have no features
+        featurized = [i for i, tokens in enumerate(all_tokens) if tokens]
+        if not vectorizer or not featurized:
+            return sequence_features, sentence_features
+
+        # vectorizer.transform returns a sparse matrix of size
+        # [n_samples, n_features], every token is a sample of the sequence features
+        token_counts = [len(all_tokens[i]) for i in featurized]
+        offsets = np.concatenate([[0], np.cumsum(token_counts)])
+        sequence_matrix = scipy.sparse.csr_matrix(
+            vectorizer.transform([token for i in featurized for token in all_tokens[i]])
+        )
+        sequence_matrix.sort_indices()
 
-            sequence_features.append(seq_vec.tocoo())
+        for i, start, end in zip(featurized, offsets[:-1], offsets[1:]):
+            sequence_features[i] = sequence_matrix[start:end].tocoo()
 
-            if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
-                tokens_text = [" ".join(tokens)]
-                sentence_vec = self.vectorizers[attribute].transform(tokens_text)
-                sentence_vec.sort_indices()
+        if attribute not in DENSE_FEATURIZABLE_ATTRIBUTES:
+            return sequence_features, sentence_features
 
-                sentence_features.append(sentence_vec.tocoo())
-            else:
-                sentence_features.append(None)
+        sentence_matrix = self._create_sentence_matrix(
+            vectorizer, sequence_matrix, offsets, [all_tokens[i] for i in featurized]
+        )
+        for row, i in enumerate(featurized):
+            sentence_features[i] = sentence_matrix[row].tocoo()
 
         return sequence_features, sentence_features
 
+    def _create_sentence_matrix(
+        self,
+        vectorizer: Union[CountVectorizer, HashingVectorizer],
+        sequence_matrix: scipy.sparse.csr_matrix,
+        offsets: np.ndarray,
+        all_tokens: List[List[Text]],
+    ) -> scipy.sparse.csr_matrix:
+        """Creates the sentence features of a batch of messages.
+
+        If no n-gram crosses the boundaries of tokens, the sentence features are the
+        sums of the token features. Otherwise, the joined tokens of each message are
+        transformed.
+        """
+        if self.analyzer == "char_wb" or (
+            self.analyzer == "word" and self.max_ngram == 1
+        ):
+            # sums the rows of the tokens of each message
+            number_of_messages = len(offsets) - 1
+            token_to_message = scipy.sparse.csr_matrix(
+                (
+                    np.ones(sequence_matrix.shape[0], dtype=sequence_matrix.dtype),
+                    np.arange(sequence_matrix.shape[0]),
+                    offsets,
+                ),
+                shape=(number_of_messages, sequence_matrix.shape[0]),
+            )
+            sentence_matrix = scipy.sparse.csr_matrix(
+                token_to_message @ sequence_matrix
+            )
+        else:
+            sentence_matrix = scipy.sparse.csr_matrix(
+                vectorizer.transform([" ".join(tokens) for tokens in all_tokens])
+            )
+
+        sentence_matrix.sort_indices()
+        return sentence_matrix
+
     def _get_featurized_attribute(
         self, attribute: Text, all_tokens: List[List[Text]]
     ) -> Tuple[
         List[Optional[scipy.sparse.spmatrix]], List[Optional[scipy.sparse.spmatrix]]
     ]:
         """Returns features of a particular attribute for complete data."""
-        if self._get_attribute_vocabulary(attribute) is not None:
+        if (
+            self._is_hashed(attribute)
+            or self._get_attribute_vocabulary(attribute) is not None
+        ):
             # count vectorizer was trained
             return self._create_features(attribute, all_tokens)
         else:
@@ -653,20 +719,20 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
             )
             return messages
 
-        for message in messages:
-            for attribute in self._attributes:
-
-                message_tokens = self._get_processed_message_tokens_by_attribute(
-                    message, attribute
-                )
+        for attribute in self._attributes:
+            all_tokens = [
+                self._get_processed_message_tokens_by_attribute(message, attribute)
+                for message in messages
+            ]
 
-                # features shape (1, seq, dim)
-                sequence_features, sentence_features = self._create_features(
-                    attribute, [message_tokens]
-                )
-                self.add_features_to_message(
-                    sequence_features[0], sentence_features[0], attribute, message
-                )
+            # features shape (1, seq, dim) per message
+            sequence_features, sentence_features = self._create_features(
+                attribute, all_tokens
+            )
+            for message, sequence, sentence in zip(
+                messages, sequence_features, sentence_features
+            ):
+                self.add_features_to_message(sequence, sentence, attribute, message)
 
         return messages
 
@@ -697,7 +763,9 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
         with self._model_storage.write_to(self._resource) as model_dir:
             # vectorizer instance was not None, some models could have been trained
             attribute_vocabularies = self._collect_vectorizer_vocabularies()
-            if self._is_any_model_trained(attribute_vocabularies):
+            if self._is_any_model_trained(attribute_vocabularies) or any(
+                self._is_hashed(attribute) for attribute in self._attributes
+            ):
                 # Definitely need to persist some vocabularies
                 featurizer_file = model_dir / "vocabularies.pkl"
 
@@ -745,12 +813,23 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
     @classmethod
     def _create_independent_vocab_vectorizers(
         cls, parameters: Dict[Text, Any], vocabulary: Optional[Any] = None
-    ) -> Dict[Text, CountVectorizer]:
+    ) -> Dict[Text, Union[CountVectorizer, HashingVectorizer]]:
         """Create vectorizers for all attributes with independent vocabulary."""
-        attribute_vectorizers = {}
+        attribute_vectorizers: Dict[
+            Text, Union[CountVectorizer, HashingVectorizer]
+        ] = {}
 
         for attribute in cls._attributes_for(parameters["analyzer"]):
-            attribute_vocabulary = vocabulary[attribute] if vocabulary else None
+            if (
+                parameters.get("hashing_features")
+                and attribute in DENSE_FEATURIZABLE_ATTRIBUTES
+            ):
+                attribute_vectorizers[attribute] = cls._create_hashing_vectorizer(
+                    parameters
+                )
+                continue
+
+            attribute_vocabulary = vocabulary.get(attribute) if vocabulary else None
 
             attribute_vectorizer = CountVectorizer(
                 token_pattern=r"(?u)\b\w+\b"
@@ -772,6 +851,23 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
 
         return attribute_vectorizers
 
+    @staticmethod
+    def _create_hashing_vectorizer(parameters: Dict[Text, Any]) -> HashingVectorizer:
+        """Creates a vectorizer which hashes tokens instead of using a vocabulary."""
+        return HashingVectorizer(
+            token_pattern=r"(?u)\b\w+\b" if parameters["analyzer"] == "word" else None,
+            strip_accents=parameters["strip_accents"],
+            lowercase=parameters["lowercase"],
+            stop_words=parameters["stop_words"],
+            ngram_range=(parameters["min_ngram"], parameters["max_ngram"]),
+            analyzer=parameters["analyzer"],
+            n_features=parameters["hashing_features"],
+            # keep the token counts like `CountVectorizer`
+            alternate_sign=False,
+            norm=None,
+            dtype=np.int64,
+        )
+
     @classmethod
     def load(
         cls,
@@ -814,7 +910,8 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
 
                 # make sure the vocabulary has been loaded correctly
                 for attribute in vectorizers:
-                    ftr.vectorizers[attribute]._validate_vocabulary()
+                    if not ftr._is_hashed(attribute):
+                        ftr.vectorizers[attribute]._validate_vocabulary()
 
                 return ftr
 
@@ -833,4 +930,17 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
     @classmethod
     def validate_config(cls, config: Dict[Text, Any]) -> None:
         """Validates that the component is configured properly."""
-        pass
+        hashing_features = config.get("hashing_features")
+        if hashing_features is None:
+            return
+
+        if not isinstance(hashing_features, int) or hashing_features < 1:
+            raise InvalidConfigException(
+                f"`hashing_features` of `{cls.__name__}` must be a positive number. "
+                f"Received {hashing_features} instead."
+            )
+        if config.get("use_shared_vocab"):
+            raise InvalidConfigException(
+                f"`hashing_features` of `{cls.__name__}` can't be used together with "
+                f"`use_shared_vocab`."
+            )
@@ -1,7 +1,6 @@
 from __future__ import annotations
 import logging
-import re
-from typing import Any, Dict, List, Optional, Text, Tuple, Type
+from typing import Any, Dict, List, Optional, Set, Text, Tuple, Type
 import numpy as np
 import scipy.sparse
 from rasa.nlu.tokenizers.tokenizer import Tokenizer
@@ -75,6 +74,20 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
         self.known_patterns = known_patterns if known_patterns else []
         self.case_sensitive = config["case_sensitive"]
         self.finetune_mode = execution_context.is_finetuning
+        self._reset_pattern_matcher()
+
+    def _reset_pattern_matcher(self) -> None:
+        """Makes sure that the pattern matcher is rebuilt when the patterns change."""
+        self._compiled_pattern_matcher: Optional[pattern_utils.PatternMatcher] = None
+
+    @property
+    def _pattern_matcher(self) -> pattern_utils.PatternMatcher:
+        """Matches all patterns in a single pass. It's only built when needed."""
+        if self._compiled_pattern_matcher is None:
+            self._compiled_pattern_matcher = pattern_utils.shared_pattern_matcher(
+                self.known_patterns, self.case_sensitive
+            )
+        return self._compiled_pattern_matcher
 
     @classmethod
     def create(
@@ -126,6 +139,7 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
         else:
             self.known_patterns = patterns_from_data
 
+        self._reset_pattern_matcher()
         self._persist()
         return self._resource
 
@@ -191,10 +205,6 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
             # nothing to featurize
             return None, None
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-
         sequence_length = len(tokens)
 
         num_patterns = len(self.known_patterns)
@@ -202,24 +212,45 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
         sequence_features = np.zeros([sequence_length, num_patterns])
         sentence_features = np.zeros([1, num_patterns])
 
-        for pattern_index, pattern in enumerate(self.known_patterns):
-            matches = list(
-                re.finditer(pattern["pattern"], message.get(attribute), flags=flags)
-            )
-
-            for token_index, t in enumerate(tokens):
-                patterns = t.get("pattern", default={})
-                patterns[pattern["name"]] = False
-
-                for match in matches:
-                    if t.start < match.end() and t.end > match.start():
-                        patterns[pattern["name"]] = True
-                        sequence_features[token_index][pattern_index] = 1.0
-                        if attribute in [RESPONSE, TEXT, ACTION_TEXT]:
-                            # sentence vector should contain all patterns
-                            sentence_features[0][pattern_index] = 1.0
+        pattern_spans = self._pattern_matcher.find_spans(message.get(attribute))
+        token_starts = [t.start for t in tokens]
+        token_ends = [t.end for t in tokens]
+        tokens_are_ordered = all(
+            previous <= current for previous, current in zip(token_ends, token_ends[1:])
+        ) and all(
+            previous <= current
+            for previous, current in zip(token_starts, token_starts[1:])
+        )
 
-                t.set("pattern", patterns)
+        matched_tokens: List[Set[int]] = []
+        for pattern_index, spans in enumerate(pattern_spans):
+            matched = set()
+            for start, end in spans:
+                if tokens_are_ordered:
+                    matched.update(
+                        pattern_utils.overlapping_tokens(
+                            token_starts, token_ends, start, end
+                        )
+                    )
+                else:
+                    matched.update(
+                        token_index
+                        for token_index, t in enumerate(tokens)
+                        if t.start < end and t.end > start
+                    )
+
+            for token_index in matched:
+                sequence_features[token_index][pattern_index] = 1.0
+            if matched and attribute in [RESPONSE, TEXT, ACTION_TEXT]:
+                # sentence vector should contain all patterns
+                sentence_features[0][pattern_index] = 1.0
+            matched_tokens.append(matched)
+
+        for token_index, t in enumerate(tokens):
+            patterns = t.get("pattern", default={})
+            for pattern, matched in zip(self.known_patterns, matched_tokens):
+                patterns[pattern["name"]] = token_index in matched
+            t.set("pattern", patterns)
 
         return (
             scipy.sparse.coo_matrix(sequence_features),
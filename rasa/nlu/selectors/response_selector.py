@@ -77,6 +77,7 @@ from rasa.utils.tensorflow.constants import (
     CONCAT_DIMENSION,
     FEATURIZERS,
     CHECKPOINT_MODEL,
+    EXPORT_PREDICT_FUNCTION,
     DENSE_DIMENSION,
     CONSTRAIN_SIMILARITIES,
     MODEL_CONFIDENCE,
@@ -256,6 +257,9 @@ class ResponseSelector(DIETClassifier):
             FEATURIZERS: [],
             # Perform model checkpointing
             CHECKPOINT_MODEL: False,
+            # If 'True' the traced prediction graph is exported together with the
+            # model, which makes loading the model for inference a lot faster.
+            EXPORT_PREDICT_FUNCTION: False,
             # if 'True' applies sigmoid on all similarity terms and adds it
             # to the loss function to ensure that similarity values are
             # approximately bounded. Used inside cross-entropy loss only.
@@ -527,8 +531,7 @@ class ResponseSelector(DIETClassifier):
             List containing the message augmented with the most likely response,
             the associated intent_response_key and its similarity to the input.
         """
-        for message in messages:
-            out = self._predict(message)
+        for message, out in zip(messages, self._predict_batch(messages)):
             top_label, label_ranking = self._predict_label(out)
 
             # Get the exact intent_response_key and the associated
@@ -626,15 +629,8 @@ class ResponseSelector(DIETClassifier):
         config: Dict[Text, Any],
         finetune_mode: bool = False,
     ) -> "RasaModel":
+        predict_data_example = cls._create_predict_data_example(model_data_example)
 
-        predict_data_example = RasaModelData(
-            label_key=model_data_example.label_key,
-            data={
-                feature_name: features
-                for feature_name, features in model_data_example.items()
-                if TEXT in feature_name
-            },
-        )
         return cls.model_class(config[USE_TEXT_AS_LABEL]).load(
             tf_model_file,
             model_data_example,
@@ -1,5 +1,11 @@
+import bisect
+import functools
 import re
-from typing import Dict, List, Text, Union
+import threading
+import weakref
+from array import array
+from collections import deque
+from typing import Dict, List, Optional, Pattern, Sequence, Text, Tuple, Union
 
 import rasa.shared.utils.io
 from rasa.shared.nlu.training_data.training_data import TrainingData
@@ -156,6 +162,10 @@ def extract_patterns(
 
     # validate regexes, raise Error when invalid
     for pattern in patterns:
+        if _literal_alternatives(pattern["pattern"]) is not None:
+            # alternations of escaped literals (e.g. lookup tables) are always valid
+            # and expensive to compile
+            continue
         try:
             re.compile(pattern["pattern"])
         except re.error:
@@ -166,3 +176,397 @@ def extract_patterns(
             )
 
     return patterns
+
+
+# characters which have a special meaning in regexes if they aren't escaped
+_REGEX_SPECIAL_CHARACTERS = set("()[]{}.^$*+?|\\")
+
+
+def is_literal_pattern(pattern: Text) -> bool:
+    """Checks if a regex pattern only matches the pattern itself.
+
+    Args:
+        pattern: The regex pattern.
+
+    Returns:
+        `True` if the pattern is not empty and has no special regex characters.
+    """
+    return bool(pattern) and not _REGEX_SPECIAL_CHARACTERS.intersection(pattern)
+
+
+def _literal_alternatives(pattern: Text) -> Optional[List[Tuple[Text, bool]]]:
+    r"""Parses a regex pattern which is an alternation of literals.
+
+    These are the patterns which are created for lookup tables, e.g.
+    `(\bMax\b|\bJohn\b)`.
+
+    Args:
+        pattern: The regex pattern.
+
+    Returns:
+        The literals and whether they are enclosed by `\b`, or `None` if the pattern
+        is not an alternation of literals.
+    """
+    if len(pattern) < 2 or pattern[0] != "(" or pattern[-1] != ")":
+        return None
+
+    body = pattern[1:-1]
+    alternatives: List[List[Union[Text, None]]] = [[]]
+    index = 0
+    while index < len(body):
+        character = body[index]
+        if character == "\\":
+            if index + 1 == len(body):
+                return None
+            escaped = body[index + 1]
+            if escaped == "b":
+                # `None` marks a word boundary
+                alternatives[-1].append(None)
+            elif escaped.isalnum():
+                # character classes like `\d` or references like `\1`
+                return None
+            else:
+                alternatives[-1].append(escaped)
+            index += 2
+        elif character == "|":
+            alternatives.append([])
+            index += 1
+        elif character in _REGEX_SPECIAL_CHARACTERS:
+            return None
+        else:
+            alternatives[-1].append(character)
+            index += 1
+
+    literals = []
+    for alternative in alternatives:
+        use_word_boundaries = bool(alternative) and alternative[0] is None
+        if use_word_boundaries:
+            if len(alternative) < 2 or alternative[-1] is not None:
+                return None
+            alternative = alternative[1:-1]
+        if not alternative or None in alternative:
+            return None
+        literals.append(("".join(alternative), use_word_boundaries))  # type: ignore
+
+    return literals
+
+
+def _is_word_character(character: Text) -> bool:
+    return character.isalnum() or character == "_"
+
+
+def has_word_boundaries(text: Text, start: int, end: int) -> bool:
+    r"""Checks if a span of a text is enclosed by word boundaries (`\b` in regexes).
+
+    Args:
+        text: The text.
+        start: The start of the span.
+        end: The end of the span.
+
+    Returns:
+        `True` if there is a word boundary at the start and at the end of the span.
+    """
+    return _is_word_boundary(text, start) and _is_word_boundary(text, end)
+
+
+def _is_word_boundary(text: Text, index: int) -> bool:
+    before = index > 0 and _is_word_character(text[index - 1])
+    after = index < len(text) and _is_word_character(text[index])
+    return before != after
+
+
+@functools.lru_cache(maxsize=4096)
+def _fold_character(character: Text) -> Text:
+    lowered = character.lower()
+    # keep the positions in the folded text equal to the positions in the text
+    return lowered if len(lowered) == 1 else character
+
+
+class LiteralMatcher:
+    """Finds all occurrences of many literals in a text in a single pass.
+
+    The literals are compiled into an Aho-Corasick automaton, so the time to search a
+    text doesn't depend on the number of literals. The automaton is stored in flat
+    arrays instead of a dictionary per state, so that large lookup tables need
+    little memory.
+    """
+
+    def __init__(self, literals: Sequence[Text], case_sensitive: bool = True) -> None:
+        """Compiles the literals.
+
+        Args:
+            literals: The literals to search for. Empty literals are ignored.
+            case_sensitive: Whether the case of the literals has to match.
+        """
+        self.case_sensitive = case_sensitive
+        self._lengths = array("i", [len(literal) for literal in literals])
+
+        folded_literals = [self._fold(literal) for literal in literals]
+        # the sort is stable, so equal literals keep their order
+        ordered_literals = sorted(
+            (index for index, literal in enumerate(folded_literals) if literal),
+            key=folded_literals.__getitem__,
+        )
+        sorted_literals = [folded_literals[index] for index in ordered_literals]
+
+        # The states are created in breadth-first order. The transitions of a state
+        # are a slice of `_edge_characters`, sorted by character, which starts at
+        # `_first_edges[state]`. Every state except the root is the target of exactly
+        # one transition, so the n-th transition leads to state n + 1. The literals
+        # which end in a state are a slice of `_outputs` in the same way.
+        self._first_edges = array("i")
+        self._first_outputs = array("i")
+        self._outputs = array("i")
+        edge_characters: List[Text] = []
+
+        # the depth of a state and the range of sorted literals with its prefix
+        queue = deque([(0, 0, len(sorted_literals))])
+        while queue:
+            depth, start, end = queue.popleft()
+            self._first_edges.append(len(edge_characters))
+            self._first_outputs.append(len(self._outputs))
+
+            # the literals which end in the state come first
+            while start < end and len(sorted_literals[start]) == depth:
+                self._outputs.append(ordered_literals[start])
+                start += 1
+
+            # the remaining literals are grouped by their next character
+            while start < end:
+                character = sorted_literals[start][depth]
+                group_end = start + 1
+                while (
+                    group_end < end and sorted_literals[group_end][depth] == character
+                ):
+                    group_end += 1
+
+                edge_characters.append(character)
+                queue.append((depth + 1, start, group_end))
+                start = group_end
+
+        self._first_edges.append(len(edge_characters))
+        self._first_outputs.append(len(self._outputs))
+        self._edge_characters = "".join(edge_characters)
+
+        number_of_states = len(self._edge_characters) + 1
+        self._failures = array("i", [0]) * number_of_states
+        # the next state on the failure chain in which literals end
+        self._output_links = array("i", [0]) * number_of_states
+        self._link_failures()
+
+    def _transition(self, state: int, character: Text) -> int:
+        """Returns the state which `character` leads to, or `-1` if there is none."""
+        start = self._first_edges[state]
+        end = self._first_edges[state + 1]
+        index = bisect.bisect_left(self._edge_characters, character, start, end)
+        if index < end and self._edge_characters[index] == character:
+            return index + 1
+        return -1
+
+    def _has_outputs(self, state: int) -> bool:
+        return self._first_outputs[state] < self._first_outputs[state + 1]
+
+    def _link_failures(self) -> None:
+        """Links every state to the state of its longest proper suffix."""
+        # states are linked in breadth-first order, so the states of shorter
+        # suffixes are linked first
+        for state in range(len(self._failures)):
+            for edge in range(self._first_edges[state], self._first_edges[state + 1]):
+                character = self._edge_characters[edge]
+
+                failure = 0
+                if state:
+                    failure = self._failures[state]
+                    next_state = self._transition(failure, character)
+                    while next_state < 0 and failure:
+                        failure = self._failures[failure]
+                        next_state = self._transition(failure, character)
+                    failure = max(next_state, 0)
+
+                # the n-th transition leads to state n + 1
+                self._failures[edge + 1] = failure
+                if self._has_outputs(failure):
+                    self._output_links[edge + 1] = failure
+                else:
+                    self._output_links[edge + 1] = self._output_links[failure]
+
+    def _fold(self, text: Text) -> Text:
+        if self.case_sensitive:
+            return text
+        return "".join(map(_fold_character, text))
+
+    def find_all(self, text: Text) -> List[Tuple[int, int, int]]:
+        """Finds all occurrences of the literals, including overlapping ones.
+
+        Args:
+            text: The text to search.
+
+        Returns:
+            The start, end and index of the literal of every occurrence, ordered by
+            their end.
+        """
+        occurrences = []
+        state = 0
+        for position, character in enumerate(self._fold(text)):
+            next_state = self._transition(state, character)
+            while next_state < 0 and state:
+                state = self._failures[state]
+                next_state = self._transition(state, character)
+            state = max(next_state, 0)
+
+            end = position + 1
+            output_state = (
+                state if self._has_outputs(state) else self._output_links[state]
+            )
+            while output_state:
+                for output in range(
+                    self._first_outputs[output_state],
+                    self._first_outputs[output_state + 1],
+                ):
+                    literal_index = self._outputs[output]
+                    occurrences.append(
+                        (end - self._lengths[literal_index], end, literal_index)
+                    )
+                output_state = self._output_links[output_state]
+
+        return occurrences
+
+
+class PatternMatcher:
+    """Finds the matches of regex patterns, e.g. from regexes and lookup tables.
+
+    Patterns which are alternations of literals (like the patterns of lookup tables)
+    are compiled into a single `LiteralMatcher`, all other patterns are compiled as
+    regexes. The matches are the same as the ones of `re.finditer`.
+    """
+
+    def __init__(
+        self, patterns: List[Dict[Text, Text]], case_sensitive: bool = True
+    ) -> None:
+        """Compiles the patterns.
+
+        Args:
+            patterns: The patterns with their name and regex pattern.
+            case_sensitive: Whether the patterns are matched case sensitive.
+        """
+        flags = 0 if case_sensitive else re.IGNORECASE
+
+        self._number_of_patterns = len(patterns)
+        self._regexes: Dict[int, Pattern] = {}
+        literals = []
+        # the pattern index, alternative index and word boundary flag of each literal
+        self._literal_patterns = array("i")
+        self._literal_alternatives = array("i")
+        self._literal_word_boundaries = array("b")
+        for pattern_index, pattern in enumerate(patterns):
+            alternatives = _literal_alternatives(pattern["pattern"])
+            if alternatives is None:
+                self._regexes[pattern_index] = re.compile(pattern["pattern"], flags)
+                continue
+
+            for alternative_index, (literal, use_word_boundaries) in enumerate(
+                alternatives
+            ):
+                literals.append(literal)
+                self._literal_patterns.append(pattern_index)
+                self._literal_alternatives.append(alternative_index)
+                self._literal_word_boundaries.append(use_word_boundaries)
+
+        self._literal_matcher = (
+            LiteralMatcher(literals, case_sensitive) if literals else None
+        )
+
+    def find_spans(self, text: Text) -> List[List[Tuple[int, int]]]:
+        """Finds the spans of all matches in a text.
+
+        Args:
+            text: The text to search.
+
+        Returns:
+            The start and end of the non-overlapping matches of every pattern.
+        """
+        spans: List[List[Tuple[int, int]]] = [
+            [] for _ in range(self._number_of_patterns)
+        ]
+        for pattern_index, regex in self._regexes.items():
+            spans[pattern_index] = [match.span() for match in regex.finditer(text)]
+
+        if self._literal_matcher is None:
+            return spans
+
+        # the first alternative of a pattern which matches at a position wins, like
+        # in regexes
+        candidates: Dict[int, Dict[int, Tuple[int, int]]] = {}
+        for start, end, literal_index in self._literal_matcher.find_all(text):
+            if self._literal_word_boundaries[
+                literal_index
+            ] and not has_word_boundaries(text, start, end):
+                continue
+
+            pattern_index = self._literal_patterns[literal_index]
+            alternative_index = self._literal_alternatives[literal_index]
+
+            pattern_candidates = candidates.setdefault(pattern_index, {})
+            candidate = pattern_candidates.get(start)
+            if candidate is None or alternative_index < candidate[0]:
+                pattern_candidates[start] = (alternative_index, end)
+
+        for pattern_index, pattern_candidates in candidates.items():
+            # matches don't overlap, the search continues at the end of a match
+            last_end = 0
+            for start in sorted(pattern_candidates):
+                if start < last_end:
+                    continue
+                _, end = pattern_candidates[start]
+                spans[pattern_index].append((start, end))
+                last_end = end
+
+        return spans
+
+
+# the matchers which are in use, by their patterns and case sensitivity
+_shared_pattern_matchers: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+_shared_pattern_matchers_lock = threading.Lock()
+
+
+def shared_pattern_matcher(
+    patterns: List[Dict[Text, Text]], case_sensitive: bool = True
+) -> PatternMatcher:
+    """Returns a `PatternMatcher` for the patterns which is shared between components.
+
+    Components which use the same patterns, e.g. the `RegexFeaturizer` and the
+    `RegexEntityExtractor`, get the same matcher as long as one of them holds it.
+
+    Args:
+        patterns: The patterns with their name and regex pattern.
+        case_sensitive: Whether the patterns are matched case sensitive.
+
+    Returns:
+        The matcher for the patterns.
+    """
+    key = (tuple(pattern["pattern"] for pattern in patterns), case_sensitive)
+    with _shared_pattern_matchers_lock:
+        matcher = _shared_pattern_matchers.get(key)
+        if matcher is None:
+            matcher = PatternMatcher(patterns, case_sensitive)
+            _shared_pattern_matchers[key] = matcher
+        return matcher
+
+
+def overlapping_tokens(
+    token_starts: Sequence[int], token_ends: Sequence[int], start: int, end: int
+) -> range:
+    """Returns the indices of the tokens which overlap with a span.
+
+    Args:
+        token_starts: The start offsets of the tokens in ascending order.
+        token_ends: The end offsets of the tokens in ascending order.
+        start: The start of the span.
+        end: The end of the span.
+
+    Returns:
+        The indices of the overlapping tokens.
+    """
+    first = bisect.bisect_right(token_ends, start)
+    last = bisect.bisect_left(token_starts, end, lo=first)
+    return range(first, last)
@@ -709,6 +709,9 @@ def create_app(
                 "model_file": app.ctx.agent.processor.model_filename,
                 "model_id": app.ctx.agent.model_id,
                 "num_active_training_jobs": app.ctx.active_training_processes.value,
+                "num_pending_inference_requests": (
+                    app.ctx.agent.inference_executor.queue_depth
+                ),
             }
         )
 
@@ -1281,7 +1284,7 @@ def create_app(
             )
 
         try:
-            result = app.ctx.agent.predict_next_with_tracker(tracker, verbosity)
+            result = await app.ctx.agent.predict_next_with_tracker(tracker, verbosity)
 
             return response.json(result)
         except Exception as e:
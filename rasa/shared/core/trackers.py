@@ -61,7 +61,7 @@ from rasa.shared.core.events import (
     ActionExecutionRejected,
     DefinePrevUserUtteredFeaturization,
 )
-from rasa.shared.core.domain import Domain, State
+from rasa.shared.core.domain import Domain, State, TrackerHistoryStates
 from rasa.shared.core.slots import AnySlot, Slot
 
 if TYPE_CHECKING:
@@ -84,6 +84,17 @@ class TrackerActiveLoop:
 
 logger = logging.getLogger(__name__)
 
+
+@dataclasses.dataclass
+class _PastStatesCacheEntry:
+    """States of a tracker history which can be extended with new events."""
+
+    domain: Domain
+    applied_events: List[Event]
+    prior_tracker: "DialogueStateTracker"
+    history_states: TrackerHistoryStates
+
+
 # same as State but with Dict[...] substituted with FrozenSet[Tuple[...]]
 FrozenState = FrozenSet[Tuple[Text, FrozenSet[Tuple[Text, Tuple[Union[float, Text]]]]]]
 
@@ -227,6 +238,20 @@ class DialogueStateTracker:
         self.model_id: Optional[Text] = None
         self.assistant_id: Optional[Text] = None
 
+        # states of the history which are shared by all policies and extended
+        # incrementally when events are added to the tracker
+        self._past_states_cache: Dict[Tuple, _PastStatesCacheEntry] = {}
+
+    def __getstate__(self) -> Dict[Text, Any]:
+        """Returns the state of the tracker which is copied and pickled.
+
+        The cached past states hold a domain and a replayed copy of the tracker, so
+        they are left out. Copies rebuild them from their events when needed.
+        """
+        state = self.__dict__.copy()
+        state["_past_states_cache"] = {}
+        return state
+
     ###
     # Public tracker interface
     ###
@@ -318,11 +343,72 @@ class DialogueStateTracker:
         Returns:
             A list of states
         """
-        return domain.states_for_tracker_history(
-            self,
-            omit_unset_slots=omit_unset_slots,
-            ignore_rule_only_turns=ignore_rule_only_turns,
-            rule_only_data=rule_only_data,
+        cache_key = (
+            omit_unset_slots,
+            ignore_rule_only_turns,
+            rasa.shared.utils.io.deep_container_fingerprint(rule_only_data or {}),
+        )
+        applied_events = self.applied_events()
+        entry = self._past_states_cache.get(cache_key)
+
+        if entry is None or not self._extends_cached_events(
+            entry, domain, applied_events
+        ):
+            entry = _PastStatesCacheEntry(
+                domain,
+                [],
+                self.init_copy(),
+                TrackerHistoryStates(
+                    domain,
+                    omit_unset_slots=omit_unset_slots,
+                    ignore_rule_only_turns=ignore_rule_only_turns,
+                    rule_only_data=rule_only_data,
+                ),
+            )
+            self._past_states_cache[cache_key] = entry
+
+        for event in applied_events[len(entry.applied_events) :]:
+            if isinstance(event, ActionExecuted):
+                entry.history_states.add_prior_tracker(
+                    entry.prior_tracker, event.hide_rule_turn
+                )
+            entry.prior_tracker.update(event)
+            entry.applied_events.append(event)
+
+        # the state after the latest event changes with every new event, hence it
+        # is not added to the cached history
+        history_states = entry.history_states.copy()
+        history_states.add_prior_tracker(entry.prior_tracker, False)
+
+        # callers are allowed to modify the returned states
+        return [
+            {key: copy.copy(sub_state) for key, sub_state in state.items()}
+            for state in history_states.states
+        ]
+
+    @staticmethod
+    def _extends_cached_events(
+        entry: _PastStatesCacheEntry, domain: Domain, applied_events: List[Event]
+    ) -> bool:
+        """Checks if the cached states can be extended to the given applied events.
+
+        This is not the case if the cached events were changed by reverting events,
+        restarts, new sessions or loop executions which undo previous events, or if
+        the states were created for a different domain.
+        """
+        if entry.domain is not domain:
+            if entry.domain.fingerprint() != domain.fingerprint():
+                return False
+            # the domain is equal, skip the fingerprints for the next calls with it
+            entry.domain = domain
+
+        cached_events = entry.applied_events
+        return (
+            len(applied_events) >= len(cached_events)
+            and all(
+                cached is applied
+                for cached, applied in zip(cached_events, applied_events)
+            )
         )
 
     def change_loop_to(self, loop_name: Optional[Text]) -> None:
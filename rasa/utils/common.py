@@ -1,4 +1,6 @@
+import asyncio
 import copy
+import functools
 import inspect
 import logging
 import logging.config
@@ -7,10 +9,12 @@ import os
 import shutil
 import tempfile
 import warnings
+from concurrent.futures import Executor
 from pathlib import Path
 from types import TracebackType
 from typing import (
     Any,
+    Callable,
     Coroutine,
     Dict,
     List,
@@ -492,6 +496,34 @@ async def call_potential_coroutine(
     return coroutine_or_return_value
 
 
+async def run_in_thread_pool(
+    executor: Optional[Executor],
+    func: Callable[..., T],
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    """Runs a blocking function without blocking the event loop.
+
+    Args:
+        executor: The thread pool to run the function in. If `None` the function is
+            called directly, e.g. for clients which can't be used from multiple
+            threads.
+        func: The blocking function.
+        args: The positional arguments for `func`.
+        kwargs: The keyword arguments for `func`.
+
+    Returns:
+        The return value of `func`.
+    """
+    if executor is None:
+        return func(*args, **kwargs)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(func, *args, **kwargs)
+    )
+
+
 def directory_size_in_mb(
     path: Path, filenames_to_exclude: Optional[List[Text]] = None
 ) -> float:
@@ -95,6 +95,7 @@ class RasaModel(Model):
         self._set_random_seed()
 
         self._tf_predict_step: Optional["GenericFunction"] = None
+        self._exported_predict_function: Optional[Any] = None
         self.prepared_for_prediction = False
 
         self._checkpoint = tf.train.Checkpoint(model=self)
@@ -404,6 +405,47 @@ class RasaModel(Model):
         """
         self.save_weights(model_file_name, overwrite=overwrite, save_format="tf")
 
+    def export_predict_function(
+        self, model_file_name: Text, predict_data_example: RasaModelData
+    ) -> None:
+        """Exports the traced prediction graph of the model next to its weights.
+
+        Loading a model from its weights requires building the model by training
+        it on an example and tracing the prediction graph on the first prediction.
+        Models which have an exported prediction graph skip both steps when they
+        are loaded for inference, see `load`.
+
+        Args:
+            model_file_name: The file name the model weights were saved to.
+            predict_data_example: Example data point which defines the inputs of the
+                prediction graph.
+        """
+        self._training = False
+        if not self.prepared_for_prediction:
+            self.prepare_for_predict()
+            self.prepared_for_prediction = True
+
+        (data_generator, _) = rasa.utils.train_utils.create_data_generators(
+            model_data=predict_data_example, batch_sizes=1, epochs=1, shuffle=False
+        )
+        batch_in = next(iter(data_generator))[0]
+
+        predict_function = tf.Module()
+        # the exported graph can only read variables which are tracked by the module
+        predict_function.model_variables = self.variables
+        # batches are passed as tuples, the restored function expects the same type
+        predict_function.predict = tf.function(
+            self.predict_step,
+            input_signature=[tuple(self._dynamic_signature(batch_in)[0])],
+        )
+        tf.saved_model.save(
+            predict_function, self._predict_function_dir(model_file_name)
+        )
+
+    @staticmethod
+    def _predict_function_dir(model_file_name: Text) -> Text:
+        return f"{model_file_name}.predict_function"
+
     @classmethod
     def load(
         cls,
@@ -437,6 +479,19 @@ class RasaModel(Model):
         learning_rate = kwargs.get("config", {}).get(LEARNING_RATE, 0.001)
         run_eagerly = kwargs.get("config", {}).get(RUN_EAGERLY)
 
+        predict_function_dir = cls._predict_function_dir(model_file_name)
+        use_exported_predict_function = not finetune_mode and not run_eagerly
+        if use_exported_predict_function and os.path.isdir(predict_function_dir):
+            # the exported graph already contains the trained weights and
+            # everything which `prepare_for_predict` calculates
+            model._exported_predict_function = tf.saved_model.load(
+                predict_function_dir
+            )
+            model._tf_predict_step = model._exported_predict_function.predict
+            model.prepared_for_prediction = True
+            logger.debug("Finished loading the exported prediction graph.")
+            return model
+
         # need to train on 1 example to build weights of the correct size
         model.compile(
             optimizer=tf.keras.optimizers.Adam(learning_rate), run_eagerly=run_eagerly
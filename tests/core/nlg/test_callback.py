@@ -1,11 +1,15 @@
+import asyncio
 import logging
 
+from aioresponses import aioresponses
+from yarl import URL
 from pytest import LogCaptureFixture
 from rasa.core.nlg.callback import CallbackNaturalLanguageGenerator, nlg_request_format
 from rasa.shared.core.domain import Domain
 from rasa.shared.core.events import UserUttered
 from rasa.shared.core.slots import TextSlot
 from rasa.shared.core.trackers import DialogueStateTracker, EventVerbosity
+from rasa.utils.endpoints import EndpointConfig
 
 
 def test_nlg_request_format(
@@ -142,3 +146,62 @@ def test_callback_nlg_fetch_response_id_with_no_response_id(
     # Assert
     assert response_id is None
     assert f"Failed to fetch response id for action '{utter_action}'." in caplog.text
+
+
+def _tracker_with_name(name: str) -> DialogueStateTracker:
+    name_slot = TextSlot(
+        name="name", mappings=[{}], initial_value=name, influence_conversation=False
+    )
+    return DialogueStateTracker.from_events(
+        sender_id=name, evts=[UserUttered("Hello")], slots=[name_slot]
+    )
+
+
+async def test_callback_nlg_caches_responses_per_slot_values() -> None:
+    url = "http://nlg.test/nlg"
+    nlg = CallbackNaturalLanguageGenerator(EndpointConfig(url, cache={"ttl": 60}))
+
+    with aioresponses() as mocked:
+        mocked.post(url, payload={"text": "Hi Bob!"})
+        mocked.post(url, payload={"text": "Hi Alice!"})
+
+        first = await nlg.generate("utter_greet", _tracker_with_name("Bob"), "rest")
+        cached = await nlg.generate("utter_greet", _tracker_with_name("Bob"), "rest")
+        other = await nlg.generate("utter_greet", _tracker_with_name("Alice"), "rest")
+
+        assert len(mocked.requests[("POST", URL(url))]) == 2
+
+    assert first == cached == {"text": "Hi Bob!"}
+    assert other == {"text": "Hi Alice!"}
+
+
+async def test_callback_nlg_coalesces_identical_requests() -> None:
+    url = "http://nlg.test/nlg"
+    nlg = CallbackNaturalLanguageGenerator(EndpointConfig(url, cache=True))
+
+    with aioresponses() as mocked:
+        mocked.post(url, payload={"text": "Hi Bob!"})
+
+        responses = await asyncio.gather(
+            *[
+                nlg.generate("utter_greet", _tracker_with_name("Bob"), "rest")
+                for _ in range(3)
+            ]
+        )
+
+        assert len(mocked.requests[("POST", URL(url))]) == 1
+
+    assert responses == [{"text": "Hi Bob!"}] * 3
+
+
+async def test_callback_nlg_without_cache_requests_every_response() -> None:
+    url = "http://nlg.test/nlg"
+    nlg = CallbackNaturalLanguageGenerator(EndpointConfig(url))
+
+    with aioresponses() as mocked:
+        mocked.post(url, payload={"text": "Hi Bob!"}, repeat=True)
+
+        for _ in range(2):
+            await nlg.generate("utter_greet", _tracker_with_name("Bob"), "rest")
+
+        assert len(mocked.requests[("POST", URL(url))]) == 2
@@ -1,9 +1,9 @@
 import textwrap
-from typing import Text
+from typing import Any, Dict, List, Text
 
 import pytest
 
-from rasa.core.nlg.generator import ResponseVariationFilter
+from rasa.core.nlg.generator import ResponseVariationFilter, compile_slot_condition
 from rasa.shared.core.domain import Domain
 from rasa.shared.core.events import UserUttered
 from rasa.shared.core.slots import TextSlot
@@ -441,3 +441,57 @@ def test_response_variation_filter_raises_exception_duplicate_ids() -> None:
         )
 
     assert result is None
+
+
+@pytest.mark.parametrize(
+    "filled_slots, expected",
+    [
+        ({"name": "Bob", "logged_in": True}, True),
+        ({"name": "bOB", "logged_in": True}, True),
+        ({"name": "Bob", "logged_in": False}, False),
+        ({"name": "Alice", "logged_in": True}, False),
+        ({"logged_in": True}, False),
+    ],
+)
+def test_compile_slot_condition(filled_slots: Dict[Text, Any], expected: bool) -> None:
+    matches = compile_slot_condition(
+        [
+            {"type": "slot", "name": "name", "value": "Bob"},
+            {"type": "slot", "name": "logged_in", "value": True},
+        ]
+    )
+
+    assert matches(filled_slots) == expected
+
+
+def test_response_variation_filter_groups_variations_by_channel() -> None:
+    responses = {
+        "utter_greet": [
+            {"text": "default"},
+            {"text": "slack", "channel": "slack"},
+            {
+                "text": "slack conditional",
+                "channel": "slack",
+                "condition": [{"type": "slot", "name": "vip", "value": True}],
+            },
+            {
+                "text": "conditional",
+                "condition": [{"type": "slot", "name": "vip", "value": True}],
+            },
+        ]
+    }
+    response_filter = ResponseVariationFilter(responses)
+    response_filter.index_responses()
+
+    def texts(channel: Text, vip: bool) -> List[Text]:
+        return [
+            response["text"]
+            for response in response_filter.responses_for_utter_action(
+                "utter_greet", channel, {"vip": vip}
+            )
+        ]
+
+    assert texts("slack", vip=True) == ["slack conditional"]
+    assert texts("slack", vip=False) == ["slack"]
+    assert texts("rest", vip=True) == ["conditional"]
+    assert texts("rest", vip=False) == ["default"]
@@ -625,3 +625,13 @@ async def test_nlg_conditional_response_variations_condition_logging(
         "[condition 2] type: slot | name: test_B | value: B" in message
         for message in caplog.messages
     )
+
+
+async def test_nlg_uses_responses_which_are_set_later():
+    nlg = TemplatedNaturalLanguageGenerator({"utter_test": [{"text": "old"}]})
+    tracker = DialogueStateTracker(sender_id="test", slots=[])
+    assert (await nlg.generate("utter_test", tracker, "")).get("text") == "old"
+
+    nlg.responses = {"utter_test": [{"text": "new"}]}
+
+    assert (await nlg.generate("utter_test", tracker, "")).get("text") == "new"
@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 from typing import Text, Callable, Dict, Any, Optional, cast
 
@@ -3169,3 +3170,42 @@ def test_initial_values_are_not_incorporated_into_rule_policy(
     policy.train(trackers, domain)
 
     assert not any(["has_said_hi" in rule for rule in policy.lookup[RULES]])
+
+
+def test_possible_keys_only_contain_applicable_rules(policy: RulePolicy):
+    greet_state = {
+        PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME},
+        USER: {INTENT: GREET_INTENT_NAME},
+    }
+    greet_rule = json.dumps([greet_state])
+    goodbye_rule = json.dumps(
+        [{PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME}, USER: {INTENT: "bye"}}]
+    )
+    any_intent_rule = json.dumps([{PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME}}])
+    after_greet_rule = json.dumps(
+        [greet_state, {PREVIOUS_ACTION: {ACTION_NAME: UTTER_GREET_ACTION}}]
+    )
+    conversation_start_rule = json.dumps([{USER: {INTENT: GREET_INTENT_NAME}}])
+    lookup = {
+        greet_rule: UTTER_GREET_ACTION,
+        goodbye_rule: "utter_goodbye",
+        any_intent_rule: "utter_default",
+        after_greet_rule: ACTION_LISTEN_NAME,
+        conversation_start_rule: UTTER_GREET_ACTION,
+    }
+    policy.lookup[RULES] = lookup
+
+    assert policy._get_possible_keys(lookup, [greet_state]) == {
+        greet_rule,
+        any_intent_rule,
+    }
+    assert policy._get_possible_keys(
+        lookup, [greet_state, {PREVIOUS_ACTION: {ACTION_NAME: UTTER_GREET_ACTION}}]
+    ) == {after_greet_rule}
+    assert policy._get_possible_keys(lookup, [{USER: {INTENT: GREET_INTENT_NAME}}]) == {
+        conversation_start_rule
+    }
+
+    # removed rules are not returned anymore
+    lookup.pop(greet_rule)
+    assert policy._get_possible_keys(lookup, [greet_state]) == {any_intent_rule}
@@ -27,6 +27,12 @@ from rasa.core.actions.action import (
     ActionEndToEndResponse,
     ActionExtractSlots,
 )
+from rasa.core.actions.constants import (
+    DOMAIN_HASH_KEY,
+    EVENTS_OFFSET_KEY,
+    INCREMENTAL_PAYLOADS,
+    LAST_SENT_EVENT_TIMESTAMP_KEY,
+)
 from rasa.core.actions.forms import FormAction
 from rasa.core.channels import CollectingOutputChannel, OutputChannel
 from rasa.core.channels.slack import SlackBot
@@ -3042,3 +3048,72 @@ async def test_action_send_text_handles_missing_metadata(
     )
 
     assert events == [BotUttered("")]
+
+
+async def test_remote_action_sends_incremental_payloads(
+    default_channel: OutputChannel,
+    default_nlg: NaturalLanguageGenerator,
+    domain: Domain,
+):
+    url = "https://example.com/webhooks/incremental-actions"
+    endpoint = EndpointConfig(url, **{INCREMENTAL_PAYLOADS: True})
+    remote_action = action.RemoteAction("my_action", endpoint)
+    tracker = DialogueStateTracker.from_events(
+        "test_remote_action_sends_incremental_payloads",
+        [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi")],
+    )
+
+    with aioresponses() as mocked:
+        mocked.post(url, payload={"events": [], "responses": []}, repeat=True)
+
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+        first_request = json_of_latest_request(latest_request(mocked, "post", url))
+
+        tracker.update(ActionExecuted("my_action"))
+        tracker.update(SlotSet("name", "rasa"))
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+        second_request = json_of_latest_request(latest_request(mocked, "post", url))
+
+    assert first_request["domain"] == domain.as_dict()
+    assert len(first_request["tracker"]["events"]) == 2
+    assert EVENTS_OFFSET_KEY not in first_request
+
+    assert "domain" not in second_request
+    assert second_request[DOMAIN_HASH_KEY] == first_request[DOMAIN_HASH_KEY]
+    assert second_request[EVENTS_OFFSET_KEY] == 2
+    assert second_request[LAST_SENT_EVENT_TIMESTAMP_KEY] == tracker.events[1].timestamp
+    assert second_request["tracker"]["events"] == [
+        event.as_dict() for event in list(tracker.events)[2:]
+    ]
+    assert second_request["tracker"]["slots"]["name"] == "rasa"
+
+
+async def test_remote_action_sends_full_payload_if_incremental_one_is_rejected(
+    default_channel: OutputChannel,
+    default_nlg: NaturalLanguageGenerator,
+    domain: Domain,
+):
+    url = "https://example.com/webhooks/rejected-incremental-actions"
+    endpoint = EndpointConfig(url, **{INCREMENTAL_PAYLOADS: True})
+    remote_action = action.RemoteAction("my_action", endpoint)
+    tracker = DialogueStateTracker.from_events(
+        "test_remote_action_sends_full_payload_if_incremental_one_is_rejected",
+        [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi")],
+    )
+
+    with aioresponses() as mocked:
+        mocked.post(url, payload={"events": [], "responses": []})
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+
+        tracker.update(ActionExecuted("my_action"))
+        mocked.post(url, status=409)
+        mocked.post(url, payload={"events": [], "responses": []})
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+
+        requests = latest_request(mocked, "post", url)
+
+    assert len(requests) == 3
+    assert requests[1].kwargs["json"][EVENTS_OFFSET_KEY] == 2
+    assert EVENTS_OFFSET_KEY not in requests[2].kwargs["json"]
+    assert requests[2].kwargs["json"]["domain"] == domain.as_dict()
+    assert len(requests[2].kwargs["json"]["tracker"]["events"]) == 3
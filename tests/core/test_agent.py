@@ -1,8 +1,10 @@
 import asyncio
+import base64
+import hashlib
 from http import HTTPStatus
 import json
 from pathlib import Path
-from typing import Any, Dict, Text, Callable, Optional
+from typing import Any, Dict, List, Text, Callable, Optional
 from unittest.mock import patch
 import uuid
 
@@ -32,13 +34,18 @@ import rasa.utils.io
 from rasa.core import jobs
 from rasa.core.agent import Agent, load_agent
 from rasa.core.channels.channel import UserMessage
+from rasa.core.processor import MessageProcessor
 from rasa.shared.core.domain import Domain
 from rasa.shared.constants import INTENT_MESSAGE_PREFIX
 from rasa.utils.endpoints import EndpointConfig
 from tests.conftest import with_assistant_ids, with_model_ids
 
 
-def model_server_app(model_path: Text, model_hash: Text = "somehash") -> Sanic:
+def model_server_app(
+    model_path: Text,
+    model_hash: Text = "somehash",
+    headers: Optional[Dict[Text, Text]] = None,
+) -> Sanic:
     app = Sanic("test_agent")
     app.ctx.number_of_model_requests = 0
 
@@ -53,7 +60,11 @@ def model_server_app(model_path: Text, model_hash: Text = "somehash") -> Sanic:
 
         return await response.file_stream(
             location=model_path,
-            headers={"ETag": model_hash, "filename": Path(model_path).name},
+            headers={
+                "ETag": model_hash,
+                "filename": Path(model_path).name,
+                **(headers or {}),
+            },
             mime_type="application/gzip",
         )
 
@@ -168,6 +179,44 @@ async def test_agent_with_model_server_in_thread(
     jobs.kill_scheduler()
 
 
+@pytest.mark.parametrize(
+    "headers, endpoint_config, should_load",
+    [
+        ({"Content-MD5": "correct"}, {}, True),
+        ({"Content-MD5": "bm90IHRoZSBjaGVja3N1bQ=="}, {}, False),
+        ({}, {"verify_etag": True}, False),
+        ({}, {}, True),
+    ],
+)
+async def test_agent_verifies_model_checksum(
+    sanic_client: Callable,
+    trained_rasa_model: Text,
+    headers: Dict[Text, Text],
+    endpoint_config: Dict[Text, Any],
+    should_load: bool,
+):
+    if headers.get("Content-MD5") == "correct":
+        model_md5 = hashlib.md5(Path(trained_rasa_model).read_bytes()).digest()
+        headers = {"Content-MD5": base64.b64encode(model_md5).decode()}
+
+    app = model_server_app(trained_rasa_model, model_hash="somehash", headers=headers)
+    model_server = await sanic_client(app)
+    model_endpoint_config = EndpointConfig.from_dict(
+        {
+            "url": model_server.make_url("/model"),
+            "wait_time_between_pulls": None,
+            **endpoint_config,
+        }
+    )
+
+    agent = await rasa.core.agent.load_from_server(
+        Agent(), model_server=model_endpoint_config
+    )
+
+    assert agent.is_ready() == should_load
+    assert (agent.fingerprint == "somehash") == should_load
+
+
 async def test_wait_time_between_pulls_without_interval(
     model_server: TestClient, monkeypatch: MonkeyPatch
 ):
@@ -348,6 +397,30 @@ async def test_agent_update_model(trained_core_model: Text, trained_nlu_model: T
     )
 
 
+def test_agent_warms_up_model_before_swapping_it(
+    trained_core_model: Text, trained_nlu_model: Text, monkeypatch: MonkeyPatch
+):
+    agent = Agent.load(
+        trained_core_model,
+        model_server=EndpointConfig(
+            "http://server.com/model", warm_up_messages=["hello", "bye"]
+        ),
+    )
+    previous_processor = agent.processor
+    warmed_up_texts = []
+
+    def warm_up(processor: MessageProcessor, texts: List[Text]) -> None:
+        # the previous model keeps handling requests during the warm-up
+        assert agent.processor is previous_processor
+        warmed_up_texts.extend(texts)
+
+    monkeypatch.setattr(MessageProcessor, "warm_up", warm_up)
+    agent.load_model(trained_nlu_model)
+
+    assert warmed_up_texts == ["hello", "bye"]
+    assert agent.processor is not previous_processor
+
+
 async def test_parse_with_http_interpreter(trained_default_agent_model: Text):
     endpoints = AvailableEndpoints(nlu=EndpointConfig("https://interpreter.com"))
     agent = await load_agent(
@@ -1,8 +1,9 @@
 import json
 import logging
 import textwrap
+import threading
 from pathlib import Path
-from typing import Union, Text, List, Optional, Type
+from typing import Any, Dict, Union, Text, List, Optional, Type
 
 import aio_pika.exceptions
 import aiormq.exceptions
@@ -19,6 +20,7 @@ from tests.conftest import AsyncMock
 import rasa.shared.utils.io
 import rasa.utils.io
 from rasa.core.brokers.broker import EventBroker
+from rasa.core.brokers.buffered import BufferedEventBroker
 from rasa.core.brokers.file import FileEventBroker
 from rasa.core.brokers.kafka import KafkaEventBroker, KafkaProducerInitializationError
 from rasa.core.brokers.pika import PikaEventBroker, DEFAULT_QUEUE_NAME
@@ -172,6 +174,118 @@ async def test_sql_broker_logs_to_sql_db():
     assert events_types == ["user", "slot", "restart"]
 
 
+async def test_sql_broker_publishes_batch():
+    broker = SQLEventBroker(db=":memory:")
+
+    await broker.publish_batch([e.as_dict() for e in TEST_EVENTS])
+
+    with broker.session_scope() as session:
+        events_types = [
+            json.loads(event.data)["event"]
+            for event in session.query(broker.SQLBrokerEvent).all()
+        ]
+
+    assert events_types == ["user", "slot", "restart"]
+
+
+class ThreadRecordingEventBroker(EventBroker):
+    def __init__(self) -> None:
+        self.published: List[Dict[Text, Any]] = []
+        self.publishing_threads = set()
+
+    def publish(self, event: Dict[Text, Any]) -> None:
+        self.publishing_threads.add(threading.get_ident())
+        self.published.append(event)
+
+
+async def test_default_publish_batch_does_not_publish_on_event_loop_thread():
+    broker = ThreadRecordingEventBroker()
+    events = [e.as_dict() for e in TEST_EVENTS]
+
+    await broker.publish_batch(events)
+
+    assert broker.published == events
+    assert threading.get_ident() not in broker.publishing_threads
+
+
+class BatchCollectingEventBroker(EventBroker):
+    def __init__(self, failing_batches: int = 0) -> None:
+        self.batches: List[List[Dict[Text, Any]]] = []
+        self.failing_batches = failing_batches
+
+    async def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        if self.failing_batches:
+            self.failing_batches -= 1
+            raise ConnectionError()
+        self.batches.append(events)
+
+
+async def test_buffered_broker_from_config():
+    config = EndpointConfig(
+        type="sql", db=":memory:", batch_publishing={"flush_size": 2}
+    )
+
+    actual = await EventBroker.create(config)
+
+    assert isinstance(actual, BufferedEventBroker)
+    assert isinstance(actual.broker, SQLEventBroker)
+    assert actual.flush_size == 2
+
+
+async def test_buffered_broker_publishes_in_batches():
+    inner_broker = BatchCollectingEventBroker()
+    broker = BufferedEventBroker(inner_broker, flush_size=2, flush_interval=60)
+    events = [{"event": "slot", "value": i} for i in range(5)]
+
+    for event in events:
+        broker.publish(event)
+    # nothing is published while handling the events
+    assert inner_broker.batches == []
+
+    await broker.close()
+
+    assert inner_broker.batches == [events[:2], events[2:4], events[4:]]
+
+
+async def test_buffered_broker_drops_oldest_events_if_queue_is_full():
+    inner_broker = BatchCollectingEventBroker()
+    broker = BufferedEventBroker(
+        inner_broker, flush_size=2, flush_interval=60, max_queue_size=2
+    )
+    events = [{"event": "slot", "value": i} for i in range(3)]
+
+    for event in events:
+        broker.publish(event)
+    await broker.close()
+
+    assert inner_broker.batches == [events[1:]]
+
+
+async def test_buffered_broker_spills_batches_which_could_not_be_published(
+    tmp_path: Path,
+):
+    spill_path = str(tmp_path / "spilled_events.jsonl")
+    inner_broker = BatchCollectingEventBroker(failing_batches=1)
+    broker = BufferedEventBroker(
+        inner_broker, flush_size=10, flush_interval=60, spill_path=spill_path
+    )
+    events = [{"event": "slot", "value": i} for i in range(3)]
+
+    broker.publish(events[0])
+    broker.publish(events[1])
+    await broker.flush()
+
+    assert inner_broker.batches == []
+    assert Path(spill_path).is_file()
+
+    broker.publish(events[2])
+    await broker.flush()
+
+    assert inner_broker.batches == [events[2:], events[:2]]
+    assert not Path(spill_path).exists()
+    await broker.close()
+
+
 async def test_file_broker_from_config(tmp_path: Path):
     # backslashes need to be encoded (windows...) otherwise we run into unicode issues
     path = str(tmp_path / "rasa_test_event.log").replace("\\", "\\\\")
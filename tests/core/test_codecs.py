@@ -0,0 +1,82 @@
+from typing import Text, Union
+
+import pytest
+
+from rasa.core.codecs import (
+    COMPRESSED_JSON_CODEC,
+    COMPRESSED_JSON_PREFIX,
+    JSON_CODEC,
+    Codec,
+    CodecDecodingException,
+    CompressedJsonCodec,
+    JsonCodec,
+    create_codec,
+)
+from rasa.shared.core.events import ActionExecuted, UserUttered
+from rasa.shared.exceptions import RasaException
+
+EVENT = UserUttered(
+    "hello", intent={"name": "greet", "confidence": 0.9}, message_id="1"
+).as_dict()
+
+
+@pytest.mark.parametrize(
+    "encoding_codec, decoding_codec",
+    [
+        (JsonCodec(), JsonCodec()),
+        (CompressedJsonCodec(), CompressedJsonCodec()),
+        (JsonCodec(), CompressedJsonCodec()),
+        (CompressedJsonCodec(), JsonCodec()),
+    ],
+)
+def test_codecs_decode_data_of_all_built_in_codecs(
+    encoding_codec: Codec, decoding_codec: Codec
+):
+    encoded = encoding_codec.encode(EVENT)
+
+    assert decoding_codec.decode(encoded) == EVENT
+    assert decoding_codec.decode(encoded.encode()) == EVENT
+
+
+def test_compressed_json_codec_makes_single_events_smaller():
+    for event in [EVENT, ActionExecuted("action_listen").as_dict()]:
+        encoded = CompressedJsonCodec().encode(event)
+
+        assert encoded.startswith(COMPRESSED_JSON_PREFIX)
+        assert len(encoded) < len(JsonCodec().encode(event)) / 2
+
+
+@pytest.mark.parametrize(
+    "encoded",
+    [
+        # invalid base64
+        COMPRESSED_JSON_PREFIX + "!!!",
+        # truncated compressed data
+        CompressedJsonCodec().encode(EVENT)[:20],
+        # corrupted compressed data
+        CompressedJsonCodec().encode(EVENT)[:-8] + "AAAAAAAA",
+        b"\x80\x04pickled",
+        '{"event": "user"',
+    ],
+)
+def test_codecs_raise_on_corrupted_data(encoded: Union[Text, bytes]):
+    for codec in [JsonCodec(), CompressedJsonCodec()]:
+        with pytest.raises(CodecDecodingException):
+            codec.decode(encoded)
+
+
+@pytest.mark.parametrize(
+    "name, expected_class",
+    [
+        (JSON_CODEC, JsonCodec),
+        (COMPRESSED_JSON_CODEC, CompressedJsonCodec),
+        ("rasa.core.codecs.CompressedJsonCodec", CompressedJsonCodec),
+    ],
+)
+def test_create_codec(name: Text, expected_class: type):
+    assert isinstance(create_codec(name), expected_class)
+
+
+def test_create_codec_with_unknown_name():
+    with pytest.raises(RasaException):
+        create_codec("unknown")
@@ -0,0 +1,264 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Text
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+import rasa.core.inference_executor
+from rasa.core.channels.channel import CollectingOutputChannel, UserMessage
+from rasa.core.inference_executor import InferenceExecutor, _without_output_channels
+from rasa.engine.constants import PLACEHOLDER_MESSAGE, PLACEHOLDER_TRACKER
+from rasa.engine.runner.interface import GraphRunner
+from rasa.shared.exceptions import RasaException
+from rasa.shared.nlu.constants import TEXT
+from rasa.shared.nlu.training_data.message import Message
+
+
+class BlockingGraphRunner(GraphRunner):
+    """Graph runner which returns the thread it ran in once it is released."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.number_of_runs = 0
+
+    @classmethod
+    def create(cls, *args: Any, **kwargs: Any) -> "BlockingGraphRunner":
+        return cls()
+
+    def run(self, inputs: Dict[Text, Any], targets: List[Text]) -> Dict[Text, Any]:
+        self.release.wait(timeout=5)
+        self.number_of_runs += 1
+        return {target: threading.current_thread() for target in targets}
+
+
+async def test_inference_executor_runs_graph_in_worker_thread():
+    executor = InferenceExecutor()
+    graph_runner = BlockingGraphRunner()
+    graph_runner.release.set()
+
+    results = await executor.run(graph_runner, inputs={}, targets=["target"])
+
+    assert results["target"] is not threading.current_thread()
+    assert executor.queue_depth == 0
+    executor.close()
+
+
+async def test_inference_executor_applies_back_pressure():
+    executor = InferenceExecutor(max_workers=1, max_queue_size=0)
+    graph_runner = BlockingGraphRunner()
+
+    first = asyncio.ensure_future(executor.run(graph_runner, {}, ["target"]))
+    second = asyncio.ensure_future(executor.run(graph_runner, {}, ["target"]))
+    await asyncio.sleep(0.1)
+
+    assert executor.queue_depth == 2
+    assert graph_runner.number_of_runs == 0
+
+    graph_runner.release.set()
+    await asyncio.gather(first, second)
+
+    assert graph_runner.number_of_runs == 2
+    assert executor.queue_depth == 0
+    executor.close()
+
+
+async def test_inference_executor_keeps_released_model_archive_for_requests(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    executor = InferenceExecutor(executor_type="process")
+    # the workers run in threads so that the test can control them
+    workers = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(executor, "_get_executor", lambda: workers)
+    release = threading.Event()
+
+    def run_graph(
+        model_archive: Text, inputs: Dict[Text, Any], targets: List[Text]
+    ) -> Dict[Text, Any]:
+        release.wait(timeout=5)
+        return {target: os.path.exists(model_archive) for target in targets}
+
+    monkeypatch.setattr(
+        rasa.core.inference_executor, "_run_graph_in_worker_process", run_graph
+    )
+    model_path = tmp_path / "model.tar.gz"
+    model_path.write_text("model")
+
+    previous_archive = executor.load_model(model_path)
+    request = asyncio.ensure_future(
+        executor.run(
+            BlockingGraphRunner(), {}, ["target"], model_archive=previous_archive
+        )
+    )
+    await asyncio.sleep(0.1)
+
+    archive = executor.load_model(model_path)
+    executor.release_model(previous_archive)
+    assert os.path.exists(previous_archive)
+
+    release.set()
+    assert (await request)["target"]
+    assert not os.path.exists(previous_archive)
+    assert os.path.exists(archive)
+
+    executor.close()
+    workers.shutdown()
+    assert not os.path.exists(archive)
+
+
+def test_process_inference_executor_warms_up_every_worker(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    executor = InferenceExecutor(executor_type="process", max_workers=3)
+    workers = ThreadPoolExecutor(max_workers=3)
+    monkeypatch.setattr(executor, "_get_executor", lambda: workers)
+    graph_runner = BlockingGraphRunner()
+    graph_runner.release.set()
+    loaded_archives = []
+
+    def load_worker_graph_runner(model_archive: Text) -> GraphRunner:
+        loaded_archives.append(model_archive)
+        return graph_runner
+
+    monkeypatch.setattr(
+        rasa.core.inference_executor,
+        "_load_worker_graph_runner",
+        load_worker_graph_runner,
+    )
+    model_path = tmp_path / "model.tar.gz"
+    model_path.write_text("model")
+    archive = executor.load_model(model_path)
+
+    executor.warm_up(
+        graph_runner, lambda run: run(inputs={}, targets=["target"]), archive
+    )
+
+    assert loaded_archives == [archive] * 3
+    assert graph_runner.number_of_runs == 3
+    executor.close()
+    workers.shutdown()
+
+
+def test_process_inference_executor_needs_model_archive():
+    executor = InferenceExecutor(executor_type="process")
+
+    with pytest.raises(RasaException):
+        asyncio.run(executor.run(BlockingGraphRunner(), {}, ["target"]))
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"executor_type": "gpu"},
+        {"max_workers": 0},
+        {"max_queue_size": -1},
+        {"nlu_batch_window": -1},
+        {"nlu_batch_size": 0},
+    ],
+)
+def test_inference_executor_with_invalid_configuration(kwargs: Dict[Text, Any]):
+    with pytest.raises(RasaException):
+        InferenceExecutor(**kwargs)
+
+
+def test_inference_inputs_without_output_channels():
+    message = UserMessage("hello", output_channel=CollectingOutputChannel())
+    inputs = {PLACEHOLDER_MESSAGE: [message], PLACEHOLDER_TRACKER: None}
+
+    sendable_inputs = _without_output_channels(inputs)
+
+    assert sendable_inputs[PLACEHOLDER_MESSAGE][0].output_channel is None
+    assert sendable_inputs[PLACEHOLDER_MESSAGE][0].text == "hello"
+    assert message.output_channel is not None
+    assert sendable_inputs[PLACEHOLDER_TRACKER] is None
+
+
+class NLUGraphRunner(GraphRunner):
+    """Graph runner which records the batches of messages it parsed."""
+
+    def __init__(self, fail_on: Optional[Text] = None) -> None:
+        self.fail_on = fail_on
+        self.batches: List[List[Text]] = []
+
+    @classmethod
+    def create(cls, *args: Any, **kwargs: Any) -> "NLUGraphRunner":
+        return cls()
+
+    def run(self, inputs: Dict[Text, Any], targets: List[Text]) -> Dict[Text, Any]:
+        texts = [message.text for message in inputs[PLACEHOLDER_MESSAGE]]
+        self.batches.append(texts)
+        if self.fail_on in texts:
+            raise ValueError(f"Can't parse '{self.fail_on}'.")
+        return {target: [Message(data={TEXT: text}) for text in texts]}
+
+
+async def test_inference_executor_parses_messages_in_batches():
+    executor = InferenceExecutor(nlu_batch_window=50, nlu_batch_size=3)
+    graph_runner = NLUGraphRunner()
+    texts = ["hi", "hello", "hey", "bye"]
+
+    parsed_messages = await asyncio.gather(
+        *[
+            executor.parse_message(graph_runner, UserMessage(text), "nlu")
+            for text in texts
+        ]
+    )
+
+    assert [message.get(TEXT) for message in parsed_messages] == texts
+    assert graph_runner.batches == [["hi", "hello", "hey"], ["bye"]]
+    executor.close()
+
+
+async def test_inference_executor_parses_messages_without_batching():
+    executor = InferenceExecutor(nlu_batch_window=0)
+    graph_runner = NLUGraphRunner()
+
+    await asyncio.gather(
+        executor.parse_message(graph_runner, UserMessage("hi"), "nlu"),
+        executor.parse_message(graph_runner, UserMessage("bye"), "nlu"),
+    )
+
+    assert sorted(graph_runner.batches) == [["bye"], ["hi"]]
+    executor.close()
+
+
+async def test_inference_executor_failing_batch_only_fails_failing_message():
+    executor = InferenceExecutor(nlu_batch_window=50)
+    graph_runner = NLUGraphRunner(fail_on="bye")
+
+    hi, bye = await asyncio.gather(
+        executor.parse_message(graph_runner, UserMessage("hi"), "nlu"),
+        executor.parse_message(graph_runner, UserMessage("bye"), "nlu"),
+        return_exceptions=True,
+    )
+
+    assert hi.get(TEXT) == "hi"
+    assert isinstance(bye, ValueError)
+    executor.close()
+
+
+async def test_inference_executor_close_cancels_message_batches():
+    executor = InferenceExecutor(nlu_batch_window=10)
+    graph_runner = BlockingGraphRunner()
+
+    running = asyncio.ensure_future(
+        executor.parse_message(graph_runner, UserMessage("hi"), "nlu")
+    )
+    await asyncio.sleep(0.1)
+    assert len(executor._message_batch_tasks) == 1
+
+    waiting = asyncio.ensure_future(
+        executor.parse_message(graph_runner, UserMessage("bye"), "nlu")
+    )
+    await asyncio.sleep(0)
+
+    executor.close()
+    graph_runner.release.set()
+
+    for parsing in [running, waiting]:
+        with pytest.raises(asyncio.CancelledError):
+            await parsing
+    assert not executor._message_batch_tasks
@@ -1,9 +1,11 @@
 import asyncio
 import logging
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Text
+from typing import Optional, Text
 from unittest.mock import Mock, patch
 
 import numpy as np
@@ -385,6 +387,28 @@ async def test_redis_lock_store_with_valid_prefix(monkeypatch: MonkeyPatch):
             pass
 
 
+async def test_redis_lock_store_runs_requests_in_thread_pool():
+    lock_store = FakeRedisLockStore()
+    lock_store._executor = ThreadPoolExecutor(max_workers=1)
+    event_loop_thread = threading.current_thread()
+    request_threads = set()
+
+    get_lock = lock_store.get_lock
+
+    def get_lock_and_record_thread(conversation_id: Text) -> Optional[TicketLock]:
+        request_threads.add(threading.current_thread())
+        return get_lock(conversation_id)
+
+    lock_store.get_lock = get_lock_and_record_thread
+
+    async with lock_store.lock("some sender"):
+        pass
+
+    assert request_threads
+    assert event_loop_thread not in request_threads
+    assert lock_store.get_lock("some sender") is None
+
+
 def test_create_lock_store_from_endpoint_config(endpoints_path: Text):
     store = read_endpoint_config(endpoints_path, endpoint_type="lock_store")
     tracker_store = RedisLockStore(
@@ -401,3 +425,106 @@ def test_create_lock_store_from_endpoint_config(endpoints_path: Text):
     )
 
     assert isinstance(tracker_store, type(LockStore.create(store)))
+
+
+@pytest.mark.parametrize("lock_store", [InMemoryLockStore(), FakeRedisLockStore()])
+async def test_waiters_are_woken_up_when_lock_is_released(lock_store: LockStore):
+    conversation_id = "test_waiters_are_woken_up_when_lock_is_released"
+    wait_time_in_seconds = 10
+
+    async def locking_task() -> None:
+        async with lock_store.lock(
+            conversation_id, wait_time_in_seconds=wait_time_in_seconds
+        ):
+            await asyncio.sleep(0.05)
+
+    start = time.time()
+    await asyncio.wait_for(
+        asyncio.gather(locking_task(), locking_task(), locking_task()),
+        timeout=wait_time_in_seconds,
+    )
+
+    assert time.time() - start < 1
+    assert lock_store.get_lock(conversation_id) is None
+
+
+async def test_redis_lock_store_wakes_up_waiters_of_other_instances():
+    conversation_id = "test_redis_lock_store_wakes_up_waiters_of_other_instances"
+    lock_store = FakeRedisLockStore()
+    other_lock_store = FakeRedisLockStore()
+    # both lock stores use the same fake Redis server
+    other_lock_store.red = lock_store.red
+
+    ticket = lock_store.issue_ticket(conversation_id)
+    waiter = asyncio.ensure_future(
+        other_lock_store._acquire_lock(
+            conversation_id,
+            other_lock_store.issue_ticket(conversation_id),
+            wait_time_in_seconds=10,
+        )
+    )
+    # give the waiter time to subscribe to the lock releases
+    await asyncio.sleep(0.2)
+
+    lock_store.cleanup(conversation_id, ticket)
+    await lock_store._notify_release(conversation_id)
+
+    lock = await asyncio.wait_for(waiter, timeout=5)
+    assert not lock.is_locked(ticket + 1)
+
+
+def test_redis_lock_store_issues_tickets_atomically(monkeypatch: MonkeyPatch):
+    conversation_id = "test_redis_lock_store_issues_tickets_atomically"
+    lock_store = FakeRedisLockStore()
+    other_lock_store = FakeRedisLockStore()
+    other_lock_store.red = lock_store.red
+
+    get_or_create_lock = lock_store.get_or_create_lock
+    other_tickets = []
+
+    def get_or_create_lock_with_concurrent_ticket(conversation_id: Text) -> TicketLock:
+        lock = get_or_create_lock(conversation_id)
+        if not other_tickets:
+            # another instance issues a ticket after the lock was read
+            other_tickets.append(other_lock_store.issue_ticket(conversation_id))
+        return lock
+
+    monkeypatch.setattr(
+        lock_store, "get_or_create_lock", get_or_create_lock_with_concurrent_ticket
+    )
+    ticket = lock_store.issue_ticket(conversation_id)
+
+    assert ticket != other_tickets[0]
+    lock = lock_store.get_lock(conversation_id)
+    assert [t.number for t in lock.tickets] == [other_tickets[0], ticket]
+
+
+@pytest.mark.parametrize("lock_store", [InMemoryLockStore(), FakeRedisLockStore()])
+async def test_release_events_are_removed_when_nobody_waits(lock_store: LockStore):
+    conversation_id = "test_release_events_are_removed_when_nobody_waits"
+    ticket = lock_store.issue_ticket(conversation_id, lock_lifetime=0.1)
+    lock_store.issue_ticket(conversation_id)
+
+    # the first ticket expires while the second one waits for it
+    await lock_store._acquire_lock(
+        conversation_id, ticket + 1, wait_time_in_seconds=0.2
+    )
+    lock_store.delete_lock(conversation_id)
+    with pytest.raises(LockError):
+        await lock_store._acquire_lock(conversation_id, ticket, 0.1)
+
+    assert not lock_store._release_events
+    assert not lock_store._number_of_waiters
+    await lock_store.close()
+
+
+async def test_redis_lock_store_close_stops_listening_for_releases():
+    lock_store = FakeRedisLockStore()
+    lock_store._listen_for_releases(asyncio.get_running_loop())
+    listener = lock_store._release_listener
+
+    await lock_store.close()
+
+    listener.join(timeout=5)
+    assert not listener.is_alive()
+    assert lock_store._release_listener is None
@@ -7,6 +7,7 @@ import numpy as np
 import pytest
 from _pytest.tmpdir import TempPathFactory
 
+import rasa.shared.utils.io
 from rasa.engine.graph import ExecutionContext, GraphSchema
 from rasa.engine.storage.local_model_storage import LocalModelStorage
 from rasa.engine.storage.resource import Resource
@@ -35,7 +36,11 @@ from rasa.core.featurizers.single_state_featurizer import (
 from rasa.core.policies.policy import SupportedData, InvalidPolicyConfig, Policy
 from rasa.core.policies.rule_policy import RulePolicy
 from rasa.core.policies.ted_policy import TEDPolicy
-from rasa.core.policies.memoization import AugmentedMemoizationPolicy, MemoizationPolicy
+from rasa.core.policies.memoization import (
+    AugmentedMemoizationPolicy,
+    MemoizationPolicy,
+    LOOKUP_FORMAT_VERSION,
+)
 
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.core.generator import TrackerWithCachedStates
@@ -459,6 +464,53 @@ class TestMemoizationPolicy(PolicyTestCollection):
             state_key = loaded_policy._create_feature_key(states)
             assert state_key in loaded_policy.lookup
 
+    def test_load_lookup_with_string_keys(
+        self,
+        trained_policy: MemoizationPolicy,
+        model_storage: ModelStorage,
+        execution_context: ExecutionContext,
+        default_domain: Domain,
+        stories_path: Text,
+    ):
+        trackers = train_trackers(default_domain, stories_path, augmentation_factor=0)
+        (
+            all_states,
+            all_actions,
+        ) = trained_policy.featurizer.training_states_and_labels(
+            trackers, default_domain
+        )
+        # lookups of older models map compressed json strings to actions
+        string_lookup = {
+            trained_policy._create_string_feature_key(states): actions[0]
+            for states, actions in zip(all_states, all_actions)
+        }
+
+        resource = Resource(uuid.uuid4().hex)
+        with model_storage.write_to(resource) as path:
+            trained_policy.featurizer.persist(path)
+            rasa.shared.utils.io.dump_obj_as_json_to_file(
+                Path(path) / MemoizationPolicy._metadata_filename(),
+                {"lookup": string_lookup},
+            )
+
+        loaded_policy = trained_policy.__class__.load(
+            trained_policy.config, model_storage, resource, execution_context
+        )
+
+        assert loaded_policy.lookup == string_lookup
+        for tracker, states, actions in zip(trackers, all_states, all_actions):
+            recalled = loaded_policy.recall(states, tracker, default_domain, None)
+            assert recalled == actions[0]
+
+    def test_persisted_lookup_uses_feature_ids(self, trained_policy: MemoizationPolicy):
+        metadata = trained_policy._metadata()
+
+        assert metadata["lookup_format_version"] == LOOKUP_FORMAT_VERSION
+        number_of_features = len(metadata["state_features"])
+        for feature_key, _ in metadata["lookup"]:
+            for feature_ids in feature_key:
+                assert all(0 <= i < number_of_features for i in feature_ids)
+
     @pytest.mark.parametrize(
         "tracker_events_with_action, tracker_events_without_action",
         [
@@ -17,7 +17,7 @@ import json
 from _pytest.monkeypatch import MonkeyPatch
 from _pytest.logging import LogCaptureFixture
 from aioresponses import aioresponses
-from typing import Optional, Text, List, Callable, Type, Any
+from typing import Optional, Text, List, Callable, Type, Any, Dict, Tuple
 from unittest import mock
 
 from rasa.core.lock_store import InMemoryLockStore
@@ -25,6 +25,7 @@ from rasa.core.policies.ensemble import DefaultPolicyPredictionEnsemble
 from rasa.core.tracker_store import InMemoryTrackerStore
 import rasa.shared.utils.io
 from rasa.core.actions.action import (
+    Action,
     ActionBotResponse,
     ActionListen,
     ActionExecutionRejection,
@@ -138,6 +139,24 @@ async def test_parsing(default_processor: MessageProcessor):
         mocked_function.assert_called()
 
 
+async def test_warm_up_runs_nlu_and_core_targets(
+    default_processor: MessageProcessor,
+):
+    with mock.patch.object(
+        default_processor.graph_runner,
+        "run",
+        wraps=default_processor.graph_runner.run,
+    ) as mocked_run:
+        default_processor.warm_up(["hello", "goodbye"])
+
+    targets = [call.kwargs["targets"] for call in mocked_run.call_args_list]
+    assert targets == [
+        [default_processor.model_metadata.nlu_target],
+        [default_processor.model_metadata.core_target],
+    ] * 2
+    assert not list(await default_processor.tracker_store.keys())
+
+
 async def test_check_for_unseen_feature(default_processor: MessageProcessor):
     message = UserMessage('/greet{"name": "Joe"}')
     old_domain = default_processor.domain
@@ -1019,6 +1038,78 @@ async def test_action_send_text_metadata(default_processor: MessageProcessor):
     assert applied_events[1].metadata == metadata
 
 
+async def test_bot_messages_are_sent_while_next_action_is_predicted(
+    default_processor: MessageProcessor, monkeypatch: MonkeyPatch
+):
+    log = []
+
+    class SlowOutputChannel(CollectingOutputChannel):
+        async def _persist_message(self, message: Dict[Text, Any]) -> None:
+            await asyncio.sleep(0.05)
+            log.append(f"sent {message['text']}")
+            await super()._persist_message(message)
+
+    predictions = [
+        (ActionSendText(), {"message": {"text": "first"}}),
+        (ActionSendText(), {"message": {"text": "second"}}),
+        (ActionListen(), None),
+    ]
+
+    async def mocked_predict(
+        tracker: DialogueStateTracker,
+    ) -> Tuple[Action, PolicyPrediction]:
+        log.append("predicted")
+        action, metadata = predictions.pop(0)
+        return action, PolicyPrediction([], "some policy", action_metadata=metadata)
+
+    monkeypatch.setattr(
+        default_processor, "predict_next_with_tracker_if_should", mocked_predict
+    )
+
+    output_channel = SlowOutputChannel()
+    tracker = DialogueStateTracker.from_events(
+        "some-sender", evts=[ActionExecuted(ACTION_LISTEN_NAME), UserUttered("Hi")]
+    )
+    await default_processor._run_prediction_loop(output_channel, tracker)
+
+    assert log == ["predicted", "predicted", "predicted", "sent first", "sent second"]
+    assert [message["text"] for message in output_channel.messages] == [
+        "first",
+        "second",
+    ]
+
+
+async def test_failed_bot_message_is_raised_after_prediction_loop(
+    default_processor: MessageProcessor, monkeypatch: MonkeyPatch
+):
+    class FailingOutputChannel(CollectingOutputChannel):
+        async def _persist_message(self, message: Dict[Text, Any]) -> None:
+            raise ValueError("channel is down")
+
+    predictions = [
+        (ActionSendText(), {"message": {"text": "first"}}),
+        (ActionListen(), None),
+    ]
+
+    async def mocked_predict(
+        tracker: DialogueStateTracker,
+    ) -> Tuple[Action, PolicyPrediction]:
+        action, metadata = predictions.pop(0)
+        return action, PolicyPrediction([], "some policy", action_metadata=metadata)
+
+    monkeypatch.setattr(
+        default_processor, "predict_next_with_tracker_if_should", mocked_predict
+    )
+
+    tracker = DialogueStateTracker.from_events(
+        "some-sender", evts=[ActionExecuted(ACTION_LISTEN_NAME), UserUttered("Hi")]
+    )
+    with pytest.raises(ValueError):
+        await default_processor._run_prediction_loop(FailingOutputChannel(), tracker)
+
+    assert not predictions
+
+
 async def test_restart_triggers_session_start(
     default_channel: CollectingOutputChannel,
     default_processor: MessageProcessor,
@@ -1401,7 +1492,7 @@ async def test_predict_next_action_with_hidden_rules(
         ],
         slots=domain.slots,
     )
-    action, prediction = processor.predict_next_with_tracker_if_should(tracker)
+    action, prediction = await processor.predict_next_with_tracker_if_should(tracker)
     assert action._name == rule_action
     assert prediction.hide_rule_turn
 
@@ -1409,7 +1500,7 @@ async def test_predict_next_action_with_hidden_rules(
         tracker, action, [SlotSet(rule_slot, rule_slot)], prediction
     )
 
-    action, prediction = processor.predict_next_with_tracker_if_should(tracker)
+    action, prediction = await processor.predict_next_with_tracker_if_should(tracker)
     assert isinstance(action, ActionListen)
     assert prediction.hide_rule_turn
 
@@ -1418,7 +1509,7 @@ async def test_predict_next_action_with_hidden_rules(
     tracker.events.append(UserUttered(intent={"name": story_intent}))
 
     # rules are hidden correctly if memo policy predicts next actions correctly
-    action, prediction = processor.predict_next_with_tracker_if_should(tracker)
+    action, prediction = await processor.predict_next_with_tracker_if_should(tracker)
     assert action._name == story_action
     assert not prediction.hide_rule_turn
 
@@ -1426,12 +1517,12 @@ async def test_predict_next_action_with_hidden_rules(
         tracker, action, [SlotSet(story_slot, story_slot)], prediction
     )
 
-    action, prediction = processor.predict_next_with_tracker_if_should(tracker)
+    action, prediction = await processor.predict_next_with_tracker_if_should(tracker)
     assert isinstance(action, ActionListen)
     assert not prediction.hide_rule_turn
 
 
-def test_predict_next_action_raises_limit_reached_exception(
+async def test_predict_next_action_raises_limit_reached_exception(
     default_processor: MessageProcessor,
 ):
     tracker = DialogueStateTracker.from_events(
@@ -1446,7 +1537,7 @@ def test_predict_next_action_raises_limit_reached_exception(
 
     default_processor.max_number_of_predictions = 1
     with pytest.raises(ActionLimitReached):
-        default_processor.predict_next_with_tracker_if_should(tracker)
+        await default_processor.predict_next_with_tracker_if_should(tracker)
 
 
 async def test_processor_logs_text_tokens_in_tracker(
@@ -1529,27 +1620,27 @@ async def test_parse_message_full_model(trained_moodbot_path: Text):
     assert result["intent"]["name"]
 
 
-def test_predict_next_with_tracker_nlu_only(trained_nlu_model: Text):
+async def test_predict_next_with_tracker_nlu_only(trained_nlu_model: Text):
     processor = Agent.load(model_path=trained_nlu_model).processor
     tracker = DialogueStateTracker("some_id", [])
     tracker.followup_action = None
-    result = processor.predict_next_with_tracker(tracker)
+    result = await processor.predict_next_with_tracker(tracker)
     assert result is None
 
 
-def test_predict_next_with_tracker_core_only(trained_core_model: Text):
+async def test_predict_next_with_tracker_core_only(trained_core_model: Text):
     processor = Agent.load(model_path=trained_core_model).processor
     tracker = DialogueStateTracker("some_id", [])
     tracker.followup_action = None
-    result = processor.predict_next_with_tracker(tracker)
+    result = await processor.predict_next_with_tracker(tracker)
     assert result["policy"] == "MemoizationPolicy"
 
 
-def test_predict_next_with_tracker_full_model(trained_rasa_model: Text):
+async def test_predict_next_with_tracker_full_model(trained_rasa_model: Text):
     processor = Agent.load(model_path=trained_rasa_model).processor
     tracker = DialogueStateTracker("some_id", [])
     tracker.followup_action = None
-    result = processor.predict_next_with_tracker(tracker)
+    result = await processor.predict_next_with_tracker(tracker)
     assert result["policy"] == "MemoizationPolicy"
 
 
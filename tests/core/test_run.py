@@ -11,6 +11,7 @@ from asyncio import AbstractEventLoop
 from pathlib import Path
 from rasa.core import run
 from rasa.core.brokers.sql import SQLEventBroker
+from rasa.core.lock_store import InMemoryLockStore
 from rasa.core.utils import AvailableEndpoints
 
 CREDENTIALS_FILE = "data/test_moodbot/credentials.yml"
@@ -84,6 +85,7 @@ async def test_close_resources(loop: AbstractEventLoop):
     broker = SQLEventBroker()
     app = Mock()
     app.ctx.agent.tracker_store.event_broker = broker
+    app.ctx.agent.lock_store = InMemoryLockStore()
     app.ctx.agent.action_endpoint.session = aiohttp.ClientSession()
     app.ctx.agent.model_server.session = aiohttp.ClientSession()
 
@@ -6,7 +6,7 @@ from collections import deque
 from contextlib import contextmanager
 from pathlib import Path
 
-import fakeredis
+import fakeredis.aioredis
 import pytest
 import sqlalchemy
 import uuid
@@ -33,6 +33,7 @@ from rasa.shared.core.constants import (
     ACTION_RESTART_NAME,
     ACTION_SESSION_START_NAME,
 )
+from rasa.core.codecs import COMPRESSED_JSON_CODEC
 from rasa.core.constants import POSTGRESQL_SCHEMA
 from rasa.shared.core.domain import Domain
 from rasa.shared.core.events import (
@@ -46,14 +47,18 @@ from rasa.shared.core.events import (
 )
 from rasa.shared.exceptions import ConnectionException, RasaException
 from rasa.core.tracker_store import (
+    CachedTrackerStore,
     TrackerStore,
     InMemoryTrackerStore,
     RedisTrackerStore,
     DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX,
+    MONGO_EVENT_COUNT_KEY,
+    MONGO_SESSION_START_KEY,
     SQLTrackerStore,
     DynamoTrackerStore,
     FailSafeTrackerStore,
     AwaitableTrackerStore,
+    TrackerDeserialisationException,
 )
 from rasa.shared.core.trackers import DialogueStateTracker, TrackerEventDiffEngine
 from rasa.shared.nlu.training_data.message import Message
@@ -178,6 +183,12 @@ def test_create_tracker_store_from_endpoint_config(
     assert isinstance(tracker_store, type(TrackerStore.create(store, domain)))
 
 
+def test_redis_tracker_store_max_connections(domain: Domain):
+    tracker_store = RedisTrackerStore(domain=domain, max_connections=5)
+
+    assert tracker_store.red.connection_pool.max_connections == 5
+
+
 def test_redis_tracker_store_invalid_key_prefix(domain: Domain):
 
     test_invalid_key_prefix = "$$ &!"
@@ -807,6 +818,19 @@ def test_create_engine_kwargs(
     assert rasa.core.tracker_store.create_engine_kwargs(url) == kwargs
 
 
+def test_create_engine_kwargs_with_pool_size(monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(rasa.core.tracker_store.POSTGRESQL_POOL_SIZE, "10")
+    set_or_delete_postgresql_schema_env_var(monkeypatch, None)
+
+    kwargs = rasa.core.tracker_store.create_engine_kwargs(
+        f"{PGDialect.name}://admin:pw@localhost:5432/rasa",
+        pool_size=20,
+        max_overflow=5,
+    )
+
+    assert kwargs == {"pool_size": 20, "max_overflow": 5}
+
+
 @contextmanager
 def does_not_raise():
     """Contextmanager to be used when an expression is not expected to raise an
@@ -1167,7 +1191,7 @@ class MockedRedisTrackerStore(RedisTrackerStore):
         self,
         domain: Domain,
     ) -> None:
-        self.red = fakeredis.FakeStrictRedis()
+        self.red = fakeredis.aioredis.FakeRedis()
         self.key_prefix = DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX
         self.record_exp = None
         super(RedisTrackerStore, self).__init__(domain, None)
@@ -1200,6 +1224,108 @@ async def test_redis_tracker_store_retrieve(
     assert list(tracker.events) == events_after_restart
 
 
+async def test_redis_tracker_store_save_appends_new_events(domain: Domain) -> None:
+    tracker_store = MockedRedisTrackerStore(domain)
+    sender_id = "append-events"
+    first_session = [
+        ActionExecuted(ACTION_SESSION_START_NAME, timestamp=1),
+        SessionStarted(timestamp=2),
+        ActionExecuted(ACTION_LISTEN_NAME, timestamp=3),
+        UserUttered("hello", timestamp=4),
+    ]
+    await tracker_store.save(DialogueStateTracker.from_events(sender_id, first_session))
+
+    tracker = await tracker_store.retrieve(sender_id)
+    second_session = [
+        ActionExecuted(ACTION_SESSION_START_NAME, timestamp=5),
+        SessionStarted(timestamp=6),
+        ActionExecuted(ACTION_LISTEN_NAME, timestamp=7),
+    ]
+    tracker.update_with_events(second_session, domain, override_timestamp=False)
+    await tracker_store.save(tracker)
+
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == second_session
+
+    tracker.update(UserUttered("hi again", timestamp=8))
+    await tracker_store.save(tracker)
+
+    key = DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX + sender_id
+    assert await tracker_store.red.llen(key) == 8
+
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert list(full_tracker.events) == (
+        first_session + second_session + [UserUttered("hi again", timestamp=8)]
+    )
+
+    # saving the tracker with all sessions doesn't store any events twice
+    await tracker_store.save(full_tracker)
+    assert await tracker_store.red.llen(key) == 8
+    assert key.encode() in await tracker_store.keys()
+
+
+async def test_redis_tracker_store_concurrent_save_does_not_duplicate_events(
+    domain: Domain, monkeypatch: MonkeyPatch
+) -> None:
+    tracker_store = MockedRedisTrackerStore(domain)
+    other_tracker_store = MockedRedisTrackerStore(domain)
+    other_tracker_store.red = tracker_store.red
+
+    sender_id = "concurrent-save"
+    events = [
+        ActionExecuted(ACTION_LISTEN_NAME, timestamp=1),
+        UserUttered("hello", timestamp=2),
+    ]
+    tracker = DialogueStateTracker.from_events(sender_id, events)
+
+    stored_metadata = tracker_store._stored_metadata
+    saved_by_other_store = False
+
+    async def stored_metadata_with_concurrent_save(sender_id: Text) -> Any:
+        nonlocal saved_by_other_store
+        metadata = await stored_metadata(sender_id)
+        if not saved_by_other_store:
+            saved_by_other_store = True
+            # another instance saves the same conversation after the metadata was read
+            await other_tracker_store.save(tracker)
+        return metadata
+
+    monkeypatch.setattr(
+        tracker_store, "_stored_metadata", stored_metadata_with_concurrent_save
+    )
+    await tracker_store.save(tracker)
+
+    key = DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX + sender_id
+    assert await tracker_store.red.llen(key) == len(events)
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert list(full_tracker.events) == events
+
+
+async def test_redis_tracker_store_migrates_serialised_tracker(
+    domain: Domain,
+    tracker_with_restarted_event: DialogueStateTracker,
+    events_after_restart: List[Event],
+) -> None:
+    tracker_store = MockedRedisTrackerStore(domain)
+    sender_id = tracker_with_restarted_event.sender_id
+    key = DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX + sender_id
+    await tracker_store.red.set(
+        key, tracker_store.serialise_tracker(tracker_with_restarted_event)
+    )
+
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events_after_restart
+
+    tracker.update(UserUttered("hello", timestamp=tracker.events[-1].timestamp + 1))
+    await tracker_store.save(tracker)
+
+    assert await tracker_store.red.type(key) == b"list"
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert list(full_tracker.events) == list(tracker_with_restarted_event.events) + [
+        tracker.events[-1]
+    ]
+
+
 async def test_redis_tracker_store_merge_trackers_same_session() -> None:
     start_session_sequence = [
         ActionExecuted(ACTION_SESSION_START_NAME),
@@ -1315,3 +1441,325 @@ async def test_tracker_event_diff_engine_event_difference() -> None:
     event_diff = TrackerEventDiffEngine.event_difference(prior_tracker, new_tracker)
 
     assert new_events == event_diff
+
+
+@pytest.mark.parametrize("store_class", [InMemoryTrackerStore, SQLTrackerStore])
+async def test_tracker_store_with_compressed_json_codec(
+    store_class: Type[TrackerStore], domain: Domain
+):
+    store = store_class(domain, codec=COMPRESSED_JSON_CODEC)
+    tracker = DialogueStateTracker.from_events(
+        "sender", [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hello")]
+    )
+    await store.save(tracker)
+
+    retrieved = await store.retrieve("sender")
+
+    assert retrieved.events == tracker.events
+
+
+async def test_tracker_store_reads_trackers_stored_with_other_codec(domain: Domain):
+    json_store = InMemoryTrackerStore(domain)
+    tracker = DialogueStateTracker.from_events(
+        "sender", [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hello")]
+    )
+    await json_store.save(tracker)
+
+    compressed_store = InMemoryTrackerStore(domain, codec=COMPRESSED_JSON_CODEC)
+    compressed_store.store = json_store.store
+
+    retrieved = await compressed_store.retrieve("sender")
+
+    assert retrieved.events == tracker.events
+
+
+async def test_tracker_store_raises_on_corrupted_compressed_tracker(domain: Domain):
+    store = InMemoryTrackerStore(domain, codec=COMPRESSED_JSON_CODEC)
+    tracker = DialogueStateTracker.from_events(
+        "sender", [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hello")]
+    )
+    await store.save(tracker)
+    store.store["sender"] = store.store["sender"][:20]
+
+    with pytest.raises(TrackerDeserialisationException):
+        await store.retrieve("sender")
+
+
+async def test_mongo_tracker_store_indexes_stored_events(domain: Domain):
+    sender_id = "test_mongo_tracker_store_indexes_stored_events"
+    tracker_store = MockedMongoTrackerStore(domain)
+    tracker = await _saved_tracker_with_multiple_session_starts(
+        tracker_store, sender_id
+    )
+
+    tracker.update(UserUttered("hi2"))
+    await tracker_store.save(tracker)
+
+    stored = tracker_store.conversations.find_one({"sender_id": sender_id})
+    assert stored[MONGO_EVENT_COUNT_KEY] == len(stored["events"]) == 6
+    assert stored[MONGO_SESSION_START_KEY] == 4
+
+    retrieved = await tracker_store.retrieve(sender_id)
+    assert [type(event) for event in retrieved.events] == [
+        SessionStarted,
+        UserUttered,
+    ]
+
+
+async def test_mongo_tracker_store_save_does_not_read_stored_events(
+    domain: Domain, monkeypatch: MonkeyPatch
+):
+    sender_id = "test_mongo_tracker_store_save_does_not_read_stored_events"
+    tracker_store = MockedMongoTrackerStore(domain)
+    tracker = DialogueStateTracker.from_events(sender_id, [UserUttered("hello")])
+    await tracker_store.save(tracker)
+
+    conversations = Mock(wraps=tracker_store.conversations)
+    monkeypatch.setattr(MockedMongoTrackerStore, "conversations", conversations)
+
+    tracker.update(BotUttered("hi"))
+    await tracker_store.save(tracker)
+
+    projections = [call.args[1] for call in conversations.find_one.call_args_list]
+    assert projections
+    assert all("events" not in projection for projection in projections)
+    retrieved = await tracker_store.retrieve_full_tracker(sender_id)
+    assert retrieved.events == tracker.events
+
+
+async def test_mongo_tracker_store_with_conversation_without_event_index(
+    domain: Domain,
+):
+    sender_id = "test_mongo_tracker_store_with_conversation_without_event_index"
+    tracker_store = MockedMongoTrackerStore(domain)
+    events = [UserUttered("hi"), ActionExecuted(ACTION_SESSION_START_NAME)]
+    events += [SessionStarted(), UserUttered("hello")]
+    tracker_store.conversations.insert_one(
+        {"sender_id": sender_id, "events": [event.as_dict() for event in events]}
+    )
+
+    retrieved = await tracker_store.retrieve(sender_id)
+    assert [type(event) for event in retrieved.events] == [
+        SessionStarted,
+        UserUttered,
+    ]
+
+    retrieved.update(BotUttered("hey"))
+    await tracker_store.save(retrieved)
+
+    stored = tracker_store.conversations.find_one({"sender_id": sender_id})
+    assert stored[MONGO_EVENT_COUNT_KEY] == 5
+    assert stored[MONGO_SESSION_START_KEY] == 2
+
+
+async def test_sql_tracker_store_stores_watermark(domain: Domain):
+    sender_id = "test_sql_tracker_store_stores_watermark"
+    tracker_store = SQLTrackerStore(domain, host="sqlite:///")
+    tracker = await _saved_tracker_with_multiple_session_starts(
+        tracker_store, sender_id
+    )
+    session_started = tracker.events[0]
+
+    tracker.update(UserUttered("hi2"))
+    await tracker_store.save(tracker)
+
+    with tracker_store.session_scope() as session:
+        watermark = session.get(SQLTrackerStore.SQLConversationWatermark, sender_id)
+
+        assert watermark.session_start == session_started.timestamp
+        assert watermark.session_event_count == 2
+
+    retrieved = await tracker_store.retrieve(sender_id)
+    assert [type(event) for event in retrieved.events] == [
+        SessionStarted,
+        UserUttered,
+    ]
+
+
+async def test_sql_tracker_store_with_conversation_without_watermark(domain: Domain):
+    sender_id = "test_sql_tracker_store_with_conversation_without_watermark"
+    tracker_store = SQLTrackerStore(domain, host="sqlite:///")
+    await _saved_tracker_with_multiple_session_starts(tracker_store, sender_id)
+
+    with tracker_store.session_scope() as session:
+        session.query(SQLTrackerStore.SQLConversationWatermark).delete()
+        session.commit()
+
+    tracker = await tracker_store.retrieve(sender_id)
+    assert [type(event) for event in tracker.events] == [SessionStarted]
+
+    tracker.update(UserUttered("hi2"))
+    await tracker_store.save(tracker)
+
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert len(full_tracker.events) == 6
+
+    with tracker_store.session_scope() as session:
+        watermark = session.get(SQLTrackerStore.SQLConversationWatermark, sender_id)
+        assert watermark.session_event_count == 2
+
+
+async def test_sql_tracker_store_concurrent_first_saves_keep_events(
+    domain: Domain, tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    sender_id = "test_sql_tracker_store_concurrent_first_saves_keep_events"
+    db = str(tmp_path / "rasa.db")
+    tracker_store = SQLTrackerStore(domain, db=db)
+    other_tracker_store = SQLTrackerStore(domain, db=db)
+    tracker = DialogueStateTracker.from_events(
+        sender_id, [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hello")]
+    )
+
+    watermark = tracker_store._watermark
+    saved_concurrently = False
+
+    def watermark_with_concurrent_save(*args: Any) -> Any:
+        nonlocal saved_concurrently
+        new_watermark = watermark(*args)
+        if not saved_concurrently:
+            # the other instance saves the conversation after this one checked
+            # that it isn't stored yet
+            saved_concurrently = True
+            other_tracker_store._save_events(tracker)
+        return new_watermark
+
+    monkeypatch.setattr(tracker_store, "_watermark", watermark_with_concurrent_save)
+
+    await tracker_store.save(tracker)
+
+    assert saved_concurrently
+    stored = await tracker_store.retrieve_full_tracker(sender_id)
+    assert stored.events == tracker.events
+    assert await tracker_store.stored_event_count(sender_id) == 2
+
+
+def test_sql_tracker_store_creates_indices(domain: Domain):
+    tracker_store = SQLTrackerStore(domain, host="sqlite:///")
+
+    indices = {
+        index["name"]: index["column_names"]
+        for index in sqlalchemy.inspect(tracker_store.engine).get_indexes("events")
+    }
+
+    assert indices["ix_events_sender_id_timestamp"] == ["sender_id", "timestamp"]
+    assert indices["ix_events_sender_id_type_name"] == ["sender_id", "type_name"]
+
+
+async def test_cached_tracker_store_returns_cached_copy(domain: Domain):
+    sender_id = "test_cached_tracker_store_returns_cached_copy"
+    wrapped_store = SQLTrackerStore(domain, host="sqlite:///")
+    tracker_store = CachedTrackerStore(wrapped_store)
+    tracker = DialogueStateTracker.from_events(sender_id, [UserUttered("hello")])
+    await tracker_store.save(tracker)
+
+    wrapped_store.retrieve = AsyncMock()
+    retrieved = await tracker_store.retrieve(sender_id)
+
+    wrapped_store.retrieve.assert_not_called()
+    assert retrieved.events == tracker.events
+
+    retrieved.update(BotUttered("hi"))
+    assert len((await tracker_store.retrieve(sender_id)).events) == 1
+
+
+async def test_cached_tracker_store_retrieves_tracker_saved_by_other_instance(
+    domain: Domain,
+):
+    sender_id = "test_cached_tracker_store_retrieves_tracker_saved_by_other_instance"
+    wrapped_store = SQLTrackerStore(domain, host="sqlite:///")
+    tracker_store = CachedTrackerStore(wrapped_store)
+    tracker = DialogueStateTracker.from_events(sender_id, [UserUttered("hello")])
+    await tracker_store.save(tracker)
+
+    other_tracker = tracker.copy()
+    other_tracker.update(BotUttered("hi"))
+    await CachedTrackerStore(wrapped_store).save(other_tracker)
+
+    retrieved = await tracker_store.retrieve(sender_id)
+
+    assert retrieved.events == other_tracker.events
+
+
+async def test_cached_tracker_store_detects_events_with_older_timestamps(
+    domain: Domain,
+):
+    sender_id = "test_cached_tracker_store_detects_events_with_older_timestamps"
+    wrapped_store = SQLTrackerStore(domain, host="sqlite:///")
+    tracker_store = CachedTrackerStore(wrapped_store)
+    tracker = DialogueStateTracker.from_events(
+        sender_id, [UserUttered("hello", timestamp=2)]
+    )
+    await tracker_store.save(tracker)
+
+    # timestamps of events aren't necessarily increasing
+    other_tracker = tracker.copy()
+    other_tracker.update(BotUttered("hi", timestamp=1))
+    await wrapped_store.save(other_tracker)
+
+    retrieved = await tracker_store.retrieve(sender_id)
+
+    assert len(retrieved.events) == 2
+
+
+async def test_sql_tracker_store_counts_stored_events(domain: Domain):
+    sender_id = "test_sql_tracker_store_counts_stored_events"
+    tracker_store = SQLTrackerStore(domain, host="sqlite:///")
+    assert await tracker_store.stored_event_count(sender_id) == 0
+
+    tracker = DialogueStateTracker.from_events(
+        sender_id, [UserUttered("hello"), BotUttered("hi")]
+    )
+    await tracker_store.save(tracker)
+    assert await tracker_store.stored_event_count(sender_id) == 2
+
+    tracker.update(UserUttered("bye"))
+    await tracker_store.save(tracker)
+    assert await tracker_store.stored_event_count(sender_id) == 3
+
+
+async def test_cached_tracker_store_removes_least_recently_used_tracker(
+    domain: Domain,
+):
+    wrapped_store = InMemoryTrackerStore(domain)
+    tracker_store = CachedTrackerStore(wrapped_store, max_size=2)
+    for sender_id in ["first", "second"]:
+        await tracker_store.save(DialogueStateTracker.from_events(sender_id, []))
+
+    await tracker_store.retrieve("first")
+    await tracker_store.save(DialogueStateTracker.from_events("third", []))
+
+    wrapped_store.retrieve = AsyncMock(return_value=None)
+    assert await tracker_store.retrieve("first") is not None
+    assert await tracker_store.retrieve("third") is not None
+    assert await tracker_store.retrieve("second") is None
+
+
+async def test_cached_tracker_store_expires_trackers(
+    domain: Domain, monkeypatch: MonkeyPatch
+):
+    wrapped_store = InMemoryTrackerStore(domain)
+    tracker_store = CachedTrackerStore(wrapped_store, ttl=10)
+    await tracker_store.save(DialogueStateTracker.from_events("sender", []))
+
+    now = rasa.core.tracker_store.time.monotonic()
+    monkeypatch.setattr(
+        rasa.core.tracker_store.time, "monotonic", Mock(return_value=now + 11)
+    )
+    wrapped_store.retrieve = AsyncMock(return_value=None)
+
+    assert await tracker_store.retrieve("sender") is None
+
+
+def test_create_tracker_store_with_cache(domain: Domain):
+    endpoint_config = EndpointConfig(
+        type="sql", db="rasa.db", cache={"max_size": 10, "ttl": 60}
+    )
+
+    tracker_store = rasa.core.tracker_store.create_tracker_store(
+        endpoint_config, domain
+    )
+
+    assert isinstance(tracker_store, CachedTrackerStore)
+    assert tracker_store.max_size == 10
+    assert tracker_store.ttl == 60
+    assert isinstance(tracker_store._tracker_store, SQLTrackerStore)
@@ -1,5 +1,6 @@
 import copy
 from pathlib import Path
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -43,9 +44,10 @@ from rasa.utils.tensorflow.constants import (
     MODEL_CONFIDENCE,
     HIDDEN_LAYERS_SIZES,
     RUN_EAGERLY,
+    EXPORT_PREDICT_FUNCTION,
 )
 from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
-from rasa.nlu.classifiers.diet_classifier import DIETClassifier
+from rasa.nlu.classifiers.diet_classifier import DIET, DIETClassifier
 from rasa.nlu.featurizers.sparse_featurizer.count_vectors_featurizer import (
     CountVectorsFeaturizer,
 )
@@ -394,6 +396,22 @@ async def test_train_persist_load_with_only_intent_classification(
     )
 
 
+@pytest.mark.timeout(120, func_only=True)
+async def test_train_persist_load_with_exported_predict_function(
+    create_train_load_and_process_diet: Callable[..., Message],
+    create_diet: Callable[..., DIETClassifier],
+):
+    config = {EPOCHS: 1, EXPORT_PREDICT_FUNCTION: True}
+    # the loaded classifier has to make the same predictions as the trained one
+    create_train_load_and_process_diet(config)
+
+    with patch.object(DIET, "fit") as mocked_fit:
+        loaded_diet = create_diet(config, load=True)
+
+    mocked_fit.assert_not_called()
+    assert loaded_diet.model._exported_predict_function is not None
+
+
 @pytest.mark.parametrize(
     "classifier_params, data_path, output_length, output_should_sum_to_1",
     [
@@ -604,6 +622,45 @@ async def test_process_unfeaturized_input(
     assert not classified_message.get(ENTITIES)
 
 
+async def test_process_batch_of_messages(
+    create_diet: Callable[..., DIETClassifier],
+    train_and_preprocess: Callable[..., Tuple[TrainingData, List[GraphComponent]]],
+    process_message: Callable[..., Message],
+):
+    pipeline = [
+        {"component": WhitespaceTokenizer},
+        {"component": CountVectorsFeaturizer},
+    ]
+    training_data, loaded_pipeline = train_and_preprocess(
+        pipeline, "data/test/demo-rasa-composite-entities.yml"
+    )
+    diet = create_diet({EPOCHS: 1, RUN_EAGERLY: True})
+    diet.train(training_data=training_data)
+
+    messages = [
+        process_message(loaded_pipeline, Message(data={TEXT: text}))
+        for text in ["hello", "I am looking for an italian restaurant", "bye bye"]
+    ]
+    # unfeaturized messages are skipped by the model
+    messages.insert(1, Message(data={TEXT: "message text"}))
+
+    batch_messages = diet.process(copy.deepcopy(messages))
+    single_messages = [diet.process([message])[0] for message in messages]
+
+    for batch_message, single_message in zip(batch_messages, single_messages):
+        assert (
+            batch_message.get(INTENT)[INTENT_NAME_KEY]
+            == single_message.get(INTENT)[INTENT_NAME_KEY]
+        )
+        assert batch_message.get(INTENT)[PREDICTED_CONFIDENCE_KEY] == pytest.approx(
+            single_message.get(INTENT)[PREDICTED_CONFIDENCE_KEY], abs=1e-5
+        )
+        assert [entity["value"] for entity in batch_message.get(ENTITIES)] == [
+            entity["value"] for entity in single_message.get(ENTITIES)
+        ]
+    assert not batch_messages[1].get(INTENT)[INTENT_NAME_KEY]
+
+
 async def test_train_model_not_checkpointing(
     default_model_storage: ModelStorage,
     default_diet_resource: Resource,
@@ -206,3 +206,45 @@ def test_ambiguous_data(default_keyword_intent_classifier: KeywordIntentClassifi
     with pytest.warns(UserWarning) as record:
         default_keyword_intent_classifier.train(data)
     assert len(record) == 2
+
+
+@pytest.mark.parametrize(
+    "case_sensitive, message, expected_intent",
+    [
+        # the first keyword of the map wins, not the first keyword in the message
+        (True, "thanks and hello", "greet"),
+        (True, "Hello", None),
+        (False, "Hello", "greet"),
+        # keywords only match whole words
+        (True, "othello", None),
+        # keywords with special characters are matched as regexes
+        (True, "is it open", "ask_hours"),
+        (True, "is it closed", None),
+    ],
+)
+def test_keyword_precedence(
+    case_sensitive: bool,
+    message: Text,
+    expected_intent: Optional[Text],
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+):
+    classifier = KeywordIntentClassifier.create(
+        {"case_sensitive": case_sensitive},
+        default_model_storage,
+        Resource("keyword"),
+        default_execution_context,
+    )
+    classifier.train(
+        TrainingData(
+            [
+                Message(data={TEXT: "hello", INTENT: "greet"}),
+                Message(data={TEXT: "thanks", INTENT: "thank"}),
+                Message(data={TEXT: "op.n", INTENT: "ask_hours"}),
+            ]
+        )
+    )
+
+    message = classifier.process([Message(data={TEXT: message})])[0]
+
+    assert message.get(INTENT)[INTENT_NAME_KEY] == expected_intent
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Dict, Text, Any
 
 import pytest
@@ -237,3 +238,56 @@ def test_duckling_entity_extractor_dimension_filtering(
         assert len(entities) == 1
         assert entities[0]["text"] == "5"
         assert entities[0]["value"] == 5
+
+
+def test_duckling_entity_extractor_caches_parse_results(
+    create_duckling: Callable[[Dict[Text, Any]], DucklingEntityExtractor]
+):
+    duckling = create_duckling({"dimensions": ["number"], "cache_size": 10})
+
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            responses.POST,
+            "http://localhost:8000/parse",
+            json=[
+                {
+                    "body": "5",
+                    "start": 4,
+                    "value": {"value": 5, "type": "value"},
+                    "end": 5,
+                    "dim": "number",
+                }
+            ],
+        )
+
+        # 1381536182 == 2013/10/12 02:03:02
+        messages = [
+            Message(data={TEXT: "for 5 people"}, time=1381536182),
+            Message(data={TEXT: "for 5 people"}, time=1381536183),
+        ]
+        duckling.process(messages)
+        duckling.process([Message(data={TEXT: "for 5 people"}, time=1381536184)])
+
+        assert len(rsps.calls) == 1
+
+    for message in messages:
+        entities = message.get("entities")
+        assert len(entities) == 1
+        assert entities[0]["value"] == 5
+
+
+def test_duckling_entity_extractor_cache_is_thread_safe(
+    create_duckling: Callable[[Dict[Text, Any]], DucklingEntityExtractor]
+):
+    duckling = create_duckling({"cache_size": 2, "cache_ttl": 0})
+
+    def use_cache(index: int) -> None:
+        for text in ["one", "two", "three", "four"] * 50:
+            key = duckling._cache_key(text, index)
+            duckling._add_to_cache(key, [{"text": text}])
+            duckling._get_cached(key)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(use_cache, range(8)))
+
+    assert len(duckling._cache) <= 2
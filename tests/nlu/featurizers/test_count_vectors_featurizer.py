@@ -19,6 +19,7 @@ from rasa.shared.nlu.training_data.message import Message
 from rasa.nlu.featurizers.sparse_featurizer.count_vectors_featurizer import (
     CountVectorsFeaturizer,
 )
+from rasa.shared.exceptions import InvalidConfigException
 
 
 @pytest.fixture()
@@ -841,3 +842,78 @@ def test_create_independent_vocab_vectorizers_min_df(
             cvf.train(data)
     else:
         cvf.train(data)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {},
+        {"max_ngram": 2},
+        {"analyzer": "char_wb", "min_ngram": 2, "max_ngram": 3},
+        {"analyzer": "char", "min_ngram": 1, "max_ngram": 2},
+    ],
+)
+def test_count_vector_featurizer_process_batch_like_single_messages(
+    config: Dict[Text, Any],
+    create_featurizer: Callable[..., CountVectorsFeaturizer],
+    whitespace_tokenizer: WhitespaceTokenizer,
+):
+    ftr = create_featurizer(config)
+    sentences = ["hello there", "", "hello hello 42 you", "good bye"]
+
+    train_data = TrainingData([Message(data={TEXT: text}) for text in sentences])
+    whitespace_tokenizer.process_training_data(train_data)
+    ftr.train(train_data)
+
+    batch = [Message(data={TEXT: text}) for text in sentences]
+    single = [Message(data={TEXT: text}) for text in sentences]
+    whitespace_tokenizer.process(batch + single)
+
+    ftr.process(batch)
+    for message in single:
+        ftr.process([message])
+
+    for batch_message, single_message in zip(batch, single):
+        batch_features = batch_message.get_sparse_features(TEXT, [])
+        single_features = single_message.get_sparse_features(TEXT, [])
+        for batch_feature, single_feature in zip(batch_features, single_features):
+            if single_feature is None:
+                assert batch_feature is None
+                continue
+
+            assert (
+                batch_feature.features.toarray() == single_feature.features.toarray()
+            ).all()
+
+
+def test_count_vector_featurizer_hashing_features(
+    create_featurizer: Callable[..., CountVectorsFeaturizer],
+    load_featurizer: Callable[..., CountVectorsFeaturizer],
+    whitespace_tokenizer: WhitespaceTokenizer,
+):
+    config = {"hashing_features": 64}
+    ftr = create_featurizer(config)
+
+    train_message = Message(data={TEXT: "hello there", INTENT: "greet"})
+    train_data = TrainingData([train_message])
+    whitespace_tokenizer.process_training_data(train_data)
+    ftr.train(train_data)
+
+    loaded = load_featurizer(config)
+
+    test_message = Message(data={TEXT: "hello unseen hello"})
+    whitespace_tokenizer.process([test_message])
+    loaded.process([test_message])
+
+    seq_vecs, sen_vecs = test_message.get_sparse_features(TEXT, [])
+    assert seq_vecs.features.shape == (3, 64)
+    assert sen_vecs.features.shape == (1, 64)
+    # the unseen word has a feature as well
+    assert sen_vecs.features.sum() == 3
+
+
+def test_count_vector_featurizer_hashing_features_with_shared_vocab(
+    create_featurizer: Callable[..., CountVectorsFeaturizer],
+):
+    with pytest.raises(InvalidConfigException):
+        create_featurizer({"hashing_features": 64, "use_shared_vocab": True})
@@ -1,4 +1,6 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Text, List, Dict, Tuple, Any, Callable
 
 import numpy as np
@@ -11,11 +13,19 @@ from _pytest.logging import LogCaptureFixture
 from rasa.engine.graph import ExecutionContext
 from rasa.engine.storage.storage import ModelStorage
 from rasa.engine.storage.resource import Resource
-from rasa.nlu.constants import TOKENS_NAMES, NUMBER_OF_SUB_TOKENS
+from rasa.nlu.constants import (
+    TOKENS_NAMES,
+    NUMBER_OF_SUB_TOKENS,
+    SENTENCE_FEATURES,
+    SEQUENCE_FEATURES,
+)
 from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.nlu.training_data.message import Message
-from rasa.nlu.featurizers.dense_featurizer.lm_featurizer import LanguageModelFeaturizer
+from rasa.nlu.featurizers.dense_featurizer.lm_featurizer import (
+    EmbeddingCache,
+    LanguageModelFeaturizer,
+)
 from rasa.shared.nlu.constants import TEXT, INTENT
 from rasa.nlu.tokenizers.tokenizer import Token
 
@@ -821,3 +831,104 @@ def test_lm_featurizer_correctly_handle_whitespace_token(
     result, _ = lm_featurizer._tokenize_example(message, TEXT)
 
     assert [(token.text, token.start) for token in result] == expected_feature_tokens
+
+
+def _doc(value: float) -> Dict[Text, np.ndarray]:
+    return {
+        SEQUENCE_FEATURES: np.full((2, 3), value),
+        SENTENCE_FEATURES: np.full((1, 3), value),
+    }
+
+
+def test_embedding_cache_evicts_least_recently_used_doc():
+    cache = EmbeddingCache(max_size=2)
+    cache.put("a", _doc(1))
+    cache.put("b", _doc(2))
+    assert cache.get("a") is not None
+
+    cache.put("c", _doc(3))
+
+    assert cache.get("b") is None
+    assert np.all(cache.get("a")[SENTENCE_FEATURES] == 1)
+    assert np.all(cache.get("c")[SENTENCE_FEATURES] == 3)
+
+
+def test_embedding_cache_is_thread_safe():
+    cache = EmbeddingCache(max_size=2)
+
+    def use_cache(value: int) -> None:
+        for key in ["a", "b", "c", "d"] * 50:
+            cache.put(key, _doc(value))
+            cache.get(key)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(use_cache, range(8)))
+
+    assert len(cache._entries) <= 2
+
+
+def test_embedding_cache_loads_docs_from_disk(tmp_path: Path):
+    EmbeddingCache(max_size=0, cache_dir=str(tmp_path)).put("a", _doc(1))
+
+    cache = EmbeddingCache(max_size=1, cache_dir=str(tmp_path))
+    doc = cache.get("a")
+    doc[SEQUENCE_FEATURES][0, 0] = 5
+
+    assert doc[SEQUENCE_FEATURES].shape == (2, 3)
+    assert np.all(cache.get("a")[SEQUENCE_FEATURES] == 1)
+    assert cache.get("b") is None
+
+
+@pytest.mark.skip_on_windows
+def test_process_featurizes_repeated_texts_once(
+    create_language_model_featurizer: Callable[
+        [Dict[Text, Any]], LanguageModelFeaturizer
+    ],
+    whitespace_tokenizer: WhitespaceTokenizer,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+):
+    monkeypatch.setattr(LanguageModelFeaturizer, "_load_model_instance", lambda _: None)
+    component = create_language_model_featurizer(
+        {"batch_size": 2, "embedding_cache_dir": str(tmp_path)}
+    )
+
+    def lm_tokenize(text: Text) -> Tuple[List[int], List[Text]]:
+        return [len(text)], [text]
+
+    batches = []
+
+    def get_model_features(
+        batch_token_ids: List[List[int]],
+        batch_tokens: List[List[Token]],
+        batch_examples: List[Message],
+        attribute: Text,
+        inference_mode: bool = False,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        batches.append([example.get(TEXT) for example in batch_examples])
+        return (
+            np.ones((len(batch_examples), 3)),
+            [np.ones((len(tokens), 3)) for tokens in batch_tokens],
+        )
+
+    monkeypatch.setattr(component, "_lm_tokenize", lm_tokenize)
+    monkeypatch.setattr(component, "_get_model_features_for_batch", get_model_features)
+
+    texts = ["hello", "how are you doing", "hello", "good morning", "hello"]
+    messages = [Message.build(text=text) for text in texts]
+    whitespace_tokenizer.process(messages)
+    component.process(messages)
+
+    # the messages are sorted by length and every text is featurized once
+    assert batches == [["hello", "good morning"], ["how are you doing"]]
+    for message in messages:
+        sequence_features, sentence_features = message.get_dense_features(TEXT)
+        assert sequence_features.features.shape[0] == len(message.get(TEXT).split())
+        assert sentence_features.features.shape == (1, 3)
+
+    batches.clear()
+    messages = [Message.build(text="good morning"), Message.build(text="hi")]
+    whitespace_tokenizer.process(messages)
+    component.process(messages)
+
+    assert batches == [["hi"]]
@@ -1,3 +1,4 @@
+import re
 from typing import Dict, List, Text
 
 import pytest
@@ -218,3 +219,92 @@ def test_regex_validation(
     assert "Model training failed." in str(e.value)
     assert "not a valid regex." in str(e.value)
     assert "Please update your nlu training data configuration" in str(e.value)
+
+
+@pytest.mark.parametrize(
+    "patterns, case_sensitive, text",
+    [
+        (
+            [{"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"}],
+            True,
+            "Max and John met Maxine and max",
+        ),
+        (
+            [{"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"}],
+            False,
+            "Max and John met Maxine and max",
+        ),
+        (
+            [{"name": "plates", "pattern": "(mapo|mapo\\ tofu|tofu)"}],
+            True,
+            "mapo tofu and tofu",
+        ),
+        (
+            [{"name": "plates", "pattern": "(\\bmapo\\ tofu\\b|\\bmapo\\b)"}],
+            True,
+            "mapo tofu, mapo",
+        ),
+        (
+            [
+                {"name": "zipcode", "pattern": "[0-9]{5}"},
+                {"name": "city", "pattern": "(\\bBerlin\\b|\\bBern\\b)"},
+            ],
+            True,
+            "10115 Berlin, 3011 Bern",
+        ),
+        (
+            [{"name": "symbols", "pattern": "(\\bC\\+\\+\\b|\\.net)"}],
+            False,
+            "c++ and .NET",
+        ),
+    ],
+)
+def test_pattern_matcher_finds_regex_matches(
+    patterns: List[Dict[Text, Text]], case_sensitive: bool, text: Text
+):
+    flags = 0 if case_sensitive else re.IGNORECASE
+    expected = [
+        [match.span() for match in re.finditer(pattern["pattern"], text, flags=flags)]
+        for pattern in patterns
+    ]
+
+    matcher = pattern_utils.PatternMatcher(patterns, case_sensitive)
+
+    assert matcher.find_spans(text) == expected
+
+
+def test_literal_matcher_finds_overlapping_literals():
+    matcher = pattern_utils.LiteralMatcher(["he", "she", "his", "hers"])
+
+    assert sorted(matcher.find_all("ushers")) == [(1, 4, 1), (2, 4, 0), (2, 6, 3)]
+
+
+def test_literal_matcher_finds_duplicate_literals_case_insensitive():
+    matcher = pattern_utils.LiteralMatcher(["Tofu", "tofu", "MAPO tofu"], False)
+
+    assert matcher.find_all("mapo TOFU") == [(0, 9, 2), (5, 9, 0), (5, 9, 1)]
+
+
+def test_shared_pattern_matcher_is_reused_for_equal_patterns():
+    patterns = [{"name": "plates", "pattern": "(mapo|tofu)"}]
+
+    matcher = pattern_utils.shared_pattern_matcher(patterns, True)
+
+    assert (
+        pattern_utils.shared_pattern_matcher(
+            [{"name": "dishes", "pattern": "(mapo|tofu)"}], True
+        )
+        is matcher
+    )
+    assert pattern_utils.shared_pattern_matcher(patterns, False) is not matcher
+
+
+@pytest.mark.parametrize(
+    "start, end, expected",
+    [(0, 5, [0]), (0, 6, [0]), (3, 8, [0, 1]), (6, 9, [1]), (11, 12, [])],
+)
+def test_overlapping_tokens(start: int, end: int, expected: List[int]):
+    # tokens of "hello there"
+    assert list(pattern_utils.overlapping_tokens([0, 6], [5, 11], start, end)) == (
+        expected
+    )
@@ -1,14 +1,16 @@
+import copy
 import datetime
 import json
 import logging
 import os
+import pickle
 import textwrap
 import time
 from pathlib import Path
 import tempfile
 from typing import List, Text, Dict, Any, Type
 
-import fakeredis
+import fakeredis.aioredis
 import freezegun
 import pytest
 
@@ -98,10 +100,7 @@ class MockRedisTrackerStore(RedisTrackerStore):
         super().__init__(_domain)
 
         # Patch the Redis connection in RedisTrackerStore using fakeredis
-        self.red = fakeredis.FakeStrictRedis()
-
-        # added in redis==3.3.0, but not yet in fakeredis
-        self.red.connection_pool.connection_class.health_check_interval = 0
+        self.red = fakeredis.aioredis.FakeRedis()
 
 
 def stores_to_be_tested():
@@ -539,6 +538,50 @@ def test_revert_user_utterance_event(domain: Domain):
     assert len(list(tracker.generate_all_prior_trackers())) == 3
 
 
+@pytest.mark.parametrize(
+    "new_events",
+    [
+        [ActionExecuted("my_action_2"), SlotSet("name", "Peter")],
+        [ActionReverted()],
+        [UserUtteranceReverted()],
+        [Restarted(), ActionExecuted(ACTION_LISTEN_NAME)],
+        [SessionStarted(), ActionExecuted(ACTION_LISTEN_NAME)],
+    ],
+)
+@pytest.mark.parametrize("ignore_rule_only_turns", [True, False])
+def test_past_states_are_updated_incrementally(
+    domain: Domain, new_events: List[Event], ignore_rule_only_turns: bool
+):
+    tracker = DialogueStateTracker("default", domain.slots)
+    tracker.update_with_events(
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("/greet", {"name": "greet"}, []),
+            ActionExecuted("my_action_1", hide_rule_turn=True),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("/goodbye", {"name": "goodbye"}, []),
+        ],
+        domain,
+    )
+
+    states = tracker.past_states(domain, ignore_rule_only_turns=ignore_rule_only_turns)
+    # returned states can be modified without changing the cached states
+    states[-1].clear()
+
+    tracker.update_with_events(new_events, domain)
+
+    expected = domain.states_for_tracker_history(
+        tracker, ignore_rule_only_turns=ignore_rule_only_turns
+    )
+    assert (
+        tracker.past_states(domain, ignore_rule_only_turns=ignore_rule_only_turns)
+        == expected
+    )
+    assert tracker.past_states(domain, omit_unset_slots=True) == (
+        domain.states_for_tracker_history(tracker, omit_unset_slots=True)
+    )
+
+
 def test_traveling_back_in_time(domain: Domain):
     tracker = DialogueStateTracker("default", domain.slots)
     # the retrieved tracker should be empty
@@ -1664,3 +1707,23 @@ def test_assistant_id_is_not_added_to_events_with_assistant_id():
         ActionExecuted(action_name="test", metadata={ASSISTANT_ID_KEY: "old_name"})
     )
     assert tracker.events[-1].metadata[ASSISTANT_ID_KEY] == "old_name"
+
+
+def test_copies_of_tracker_do_not_contain_past_states(domain: Domain):
+    tracker = DialogueStateTracker("default", domain.slots)
+    tracker.update_with_events(
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("/greet", {"name": "greet"}, []),
+        ],
+        domain,
+    )
+    states = tracker.past_states(domain)
+
+    for tracker_copy in [copy.deepcopy(tracker), pickle.loads(pickle.dumps(tracker))]:
+        assert tracker_copy._past_states_cache == {}
+        assert tracker_copy.past_states(domain) == states
+
+    # the cache is reused for an equal domain
+    assert tracker.past_states(copy.deepcopy(domain)) == states
+    assert len(tracker._past_states_cache) == 1
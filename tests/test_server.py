@@ -198,6 +198,7 @@ async def test_status(rasa_app: SanicASGITestClient, trained_rasa_model: Text):
     assert response.status == HTTPStatus.OK
     assert "model_id" in response.json
     assert model_file == Path(trained_rasa_model).name
+    assert response.json["num_pending_inference_requests"] == 0
 
 
 async def test_status_nlu_only(